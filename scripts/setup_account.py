@@ -15,7 +15,9 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -24,19 +26,27 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 
+def emit(*lines: str) -> None:
+    """Write a block of lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def print_banner() -> None:
-    print()
-    print("=" * 60)
-    print("  Polymarket Trading Bot - Account Setup Wizard")
-    print("=" * 60)
-    print()
-    print("This wizard will guide you through setting up your bot.")
-    print("You'll need:")
-    print("  1. A Polymarket account (https://polymarket.com)")
-    print("  2. Your wallet private key")
-    print("  3. CLOB API credentials")
-    print("  4. Some USDC on Polygon for trading")
-    print()
+    emit(
+        "",
+        "=" * 60,
+        "  Polymarket Trading Bot - Account Setup Wizard",
+        "=" * 60,
+        "",
+        "This wizard will guide you through setting up your bot.",
+        "You'll need:",
+        "  1. A Polymarket account (https://polymarket.com)",
+        "  2. Your wallet private key",
+        "  3. CLOB API credentials",
+        "  4. Some USDC on Polygon for trading",
+        "",
+    )
 
 
 def prompt(message: str, default: str = "", secret: bool = False) -> str:
@@ -67,14 +77,16 @@ def confirm(message: str, default: bool = True) -> bool:
 
 def step_wallet_setup() -> tuple[str, str]:
     """Step 1: Configure wallet."""
-    print()
-    print("-" * 40)
-    print("Step 1: Wallet Configuration")
-    print("-" * 40)
-    print()
-    print("Your wallet private key is used to sign orders on Polymarket.")
-    print("It is stored ONLY in your local .env file and NEVER transmitted anywhere.")
-    print()
+    emit(
+        "",
+        "-" * 40,
+        "Step 1: Wallet Configuration",
+        "-" * 40,
+        "",
+        "Your wallet private key is used to sign orders on Polymarket.",
+        "It is stored ONLY in your local .env file and NEVER transmitted anywhere.",
+        "",
+    )
 
     private_key = prompt("Enter your wallet private key (0x...)", secret=True)
     if not private_key:
@@ -85,6 +97,11 @@ def step_wallet_setup() -> tuple[str, str]:
     if not private_key.startswith("0x"):
         private_key = "0x" + private_key
 
+    # Reject malformed keys before paying for the eth_account import and key derivation
+    if not re.fullmatch(r"0x[0-9a-fA-F]{64}", private_key):
+        print("ERROR: Private key must be 64 hex characters (optionally prefixed with 0x).")
+        sys.exit(1)
+
     # Derive funder address
     try:
         from eth_account import Account
@@ -97,9 +114,11 @@ def step_wallet_setup() -> tuple[str, str]:
         sys.exit(1)
 
     # Ask if they want a custom funder address (for proxy wallets)
-    print()
-    print("Polymarket uses a proxy wallet system. Your 'funder' address")
-    print("is typically the address derived from your private key above.")
+    emit(
+        "",
+        "Polymarket uses a proxy wallet system. Your 'funder' address",
+        "is typically the address derived from your private key above.",
+    )
     if not confirm("Use derived address as funder?"):
         funder_address = prompt("Enter custom funder address (0x...)")
 
@@ -108,17 +127,19 @@ def step_wallet_setup() -> tuple[str, str]:
 
 def step_api_keys() -> tuple[str, str, str]:
     """Step 2: Configure CLOB API credentials."""
-    print()
-    print("-" * 40)
-    print("Step 2: API Key Configuration")
-    print("-" * 40)
-    print()
-    print("You need CLOB API credentials from Polymarket.")
-    print("Generate them at: https://polymarket.com (Account Settings -> API Keys)")
-    print()
-    print("IMPORTANT: You must have made at least ONE manual trade on Polymarket")
-    print("before API keys will work. This is a Polymarket requirement.")
-    print()
+    emit(
+        "",
+        "-" * 40,
+        "Step 2: API Key Configuration",
+        "-" * 40,
+        "",
+        "You need CLOB API credentials from Polymarket.",
+        "Generate them at: https://polymarket.com (Account Settings -> API Keys)",
+        "",
+        "IMPORTANT: You must have made at least ONE manual trade on Polymarket",
+        "before API keys will work. This is a Polymarket requirement.",
+        "",
+    )
 
     api_key = prompt("CLOB API Key")
     api_secret = prompt("CLOB API Secret", secret=True)
@@ -132,16 +153,18 @@ def step_api_keys() -> tuple[str, str, str]:
 
 def step_network() -> str:
     """Step 3: Configure Polygon RPC."""
-    print()
-    print("-" * 40)
-    print("Step 3: Network Configuration")
-    print("-" * 40)
-    print()
-    print("The bot needs a Polygon RPC endpoint.")
-    print("The default public RPC works but can be slow/unreliable.")
-    print("For production, consider Alchemy (free tier: https://alchemy.com)")
-    print("or Infura (https://infura.io).")
-    print()
+    emit(
+        "",
+        "-" * 40,
+        "Step 3: Network Configuration",
+        "-" * 40,
+        "",
+        "The bot needs a Polygon RPC endpoint.",
+        "The default public RPC works but can be slow/unreliable.",
+        "For production, consider Alchemy (free tier: https://alchemy.com)",
+        "or Infura (https://infura.io).",
+        "",
+    )
 
     rpc_url = prompt("Polygon RPC URL", default="https://polygon-rpc.com")
     return rpc_url
@@ -149,25 +172,29 @@ def step_network() -> str:
 
 def step_telegram() -> tuple[str, str]:
     """Step 4: Configure Telegram notifications (optional)."""
-    print()
-    print("-" * 40)
-    print("Step 4: Telegram Notifications (Optional)")
-    print("-" * 40)
-    print()
+    emit(
+        "",
+        "-" * 40,
+        "Step 4: Telegram Notifications (Optional)",
+        "-" * 40,
+        "",
+    )
 
     if not confirm("Set up Telegram notifications?", default=False):
         return "", ""
 
-    print()
-    print("To set up Telegram:")
-    print("  1. Message @BotFather on Telegram")
-    print("  2. Send /newbot and follow the prompts")
-    print("  3. Copy the bot token")
-    print("  4. Start a chat with your bot")
-    print("  5. Send a message, then visit:")
-    print("     https://api.telegram.org/bot<TOKEN>/getUpdates")
-    print("     to find your chat_id")
-    print()
+    emit(
+        "",
+        "To set up Telegram:",
+        "  1. Message @BotFather on Telegram",
+        "  2. Send /newbot and follow the prompts",
+        "  3. Copy the bot token",
+        "  4. Start a chat with your bot",
+        "  5. Send a message, then visit:",
+        "     https://api.telegram.org/bot<TOKEN>/getUpdates",
+        "     to find your chat_id",
+        "",
+    )
 
     bot_token = prompt("Telegram Bot Token", secret=True)
     chat_id = prompt("Telegram Chat ID")
@@ -175,77 +202,92 @@ def step_telegram() -> tuple[str, str]:
     return bot_token, chat_id
 
 
-def step_verify_balance(private_key: str, rpc_url: str, funder_address: str) -> None:
-    """Step 5: Verify wallet balance."""
-    print()
-    print("-" * 40)
-    print("Step 5: Balance Verification")
-    print("-" * 40)
-    print()
-    print("Checking your USDC balance on Polygon...")
+def step_verify_balance(private_key: str, rpc_url: str, funder_address: str) -> list[str]:
+    """Step 5: Verify wallet balance. Returns the report lines to print."""
+    report = [
+        "",
+        "-" * 40,
+        "Step 5: Balance Verification",
+        "-" * 40,
+        "",
+        "Checking your USDC balance on Polygon...",
+    ]
 
     try:
         from web3 import Web3
 
+        from src.core.wallet import checksum_address
+
         w3 = Web3(Web3.HTTPProvider(rpc_url))
         if not w3.is_connected():
-            print(f"WARNING: Cannot connect to RPC at {rpc_url}")
-            return
+            report.append(f"WARNING: Cannot connect to RPC at {rpc_url}")
+            return report
 
         # USDC contract on Polygon
-        usdc_address = Web3.to_checksum_address("0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174")
-        # Minimal ERC20 ABI for balanceOf
-        erc20_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "_owner", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "balance", "type": "uint256"}],
-                "type": "function",
-            }
-        ]
-        usdc_contract = w3.eth.contract(address=usdc_address, abi=erc20_abi)
-        raw_balance = usdc_contract.functions.balanceOf(
-            Web3.to_checksum_address(funder_address)
-        ).call()
-        usdc_balance = raw_balance / 1_000_000  # 6 decimals
-
-        # MATIC balance
-        matic_balance = w3.eth.get_balance(Web3.to_checksum_address(funder_address))
+        usdc_address = checksum_address("0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174")
+        owner = checksum_address(funder_address)
+        # ERC20 balanceOf(address): selector + left-padded owner, no ABI encoder needed
+        balance_call = {
+            "to": usdc_address,
+            "data": "0x70a08231" + owner[2:].lower().rjust(64, "0"),
+        }
+
+        # Fetch USDC and MATIC balances in one JSON-RPC batch round-trip
+        try:
+            with w3.batch_requests() as batch:
+                batch.add(w3.eth.call(balance_call))
+                batch.add(w3.eth.get_balance(owner))
+                raw_usdc, matic_balance = batch.execute()
+        except Exception:
+            # Some public RPCs reject batch requests; fall back to two calls
+            raw_usdc = w3.eth.call(balance_call)
+            matic_balance = w3.eth.get_balance(owner)
+
+        usdc_balance = int.from_bytes(raw_usdc, "big") / 1_000_000  # 6 decimals
         matic = w3.from_wei(matic_balance, "ether")
 
-        print(f"\n  USDC Balance: ${usdc_balance:,.2f}")
-        print(f"  MATIC Balance: {matic:.4f} MATIC")
+        report += [
+            f"\n  USDC Balance: ${usdc_balance:,.2f}",
+            f"  MATIC Balance: {matic:.4f} MATIC",
+        ]
 
         if usdc_balance < 10:
-            print("\n  WARNING: Low USDC balance. You need USDC on Polygon to trade.")
-            print("  Transfer USDC to your wallet on Polygon network.")
+            report += [
+                "\n  WARNING: Low USDC balance. You need USDC on Polygon to trade.",
+                "  Transfer USDC to your wallet on Polygon network.",
+            ]
 
         if float(matic) < 0.01:
-            print("\n  WARNING: Low MATIC balance. You need MATIC for gas fees.")
-            print("  Get some MATIC from a faucet or exchange.")
+            report += [
+                "\n  WARNING: Low MATIC balance. You need MATIC for gas fees.",
+                "  Get some MATIC from a faucet or exchange.",
+            ]
 
     except ImportError:
-        print("WARNING: web3 not installed. Run 'uv sync' first to install dependencies.")
+        report.append("WARNING: web3 not installed. Run 'uv sync' first to install dependencies.")
     except Exception as e:
-        print(f"WARNING: Could not verify balance: {e}")
+        report.append(f"WARNING: Could not verify balance: {e}")
+
+    return report
 
 
 def step_verify_api(
     api_key: str, api_secret: str, api_passphrase: str, funder_address: str
-) -> None:
-    """Step 6: Verify API connectivity."""
-    print()
-    print("-" * 40)
-    print("Step 6: API Verification")
-    print("-" * 40)
-    print()
+) -> list[str]:
+    """Step 6: Verify API connectivity. Returns the report lines to print."""
+    report = [
+        "",
+        "-" * 40,
+        "Step 6: API Verification",
+        "-" * 40,
+        "",
+    ]
 
     if not all([api_key, api_secret, api_passphrase]):
-        print("Skipping API verification (credentials not provided)")
-        return
+        report.append("Skipping API verification (credentials not provided)")
+        return report
 
-    print("Testing CLOB API connectivity...")
+    report.append("Testing CLOB API connectivity...")
 
     try:
         from py_clob_client.client import ClobClient
@@ -262,14 +304,39 @@ def step_verify_api(
 
         # Test by fetching open orders
         orders = client.get_orders()
-        print(f"  API connected successfully!")
-        print(f"  Open orders: {len(orders) if orders else 0}")
+        report += [
+            "  API connected successfully!",
+            f"  Open orders: {len(orders) if orders else 0}",
+        ]
 
     except ImportError:
-        print("WARNING: py-clob-client not installed. Run 'uv sync' first.")
+        report.append("WARNING: py-clob-client not installed. Run 'uv sync' first.")
     except Exception as e:
-        print(f"WARNING: API verification failed: {e}")
-        print("This may be normal if you haven't made a first trade on Polymarket yet.")
+        report += [
+            f"WARNING: API verification failed: {e}",
+            "This may be normal if you haven't made a first trade on Polymarket yet.",
+        ]
+
+    return report
+
+
+async def _run_verifications(
+    private_key: str,
+    rpc_url: str,
+    funder_address: str,
+    api_key: str,
+    api_secret: str,
+    api_passphrase: str,
+) -> tuple[list[str], list[str]]:
+    """Run steps 5 and 6 concurrently; they hit independent endpoints."""
+    async with asyncio.TaskGroup() as tg:
+        balance = tg.create_task(
+            asyncio.to_thread(step_verify_balance, private_key, rpc_url, funder_address)
+        )
+        api = tg.create_task(
+            asyncio.to_thread(step_verify_api, api_key, api_secret, api_passphrase, funder_address)
+        )
+    return balance.result(), api.result()
 
 
 def step_write_env(
@@ -283,11 +350,13 @@ def step_write_env(
     telegram_chat_id: str,
 ) -> None:
     """Step 7: Write .env file."""
-    print()
-    print("-" * 40)
-    print("Step 7: Save Configuration")
-    print("-" * 40)
-    print()
+    emit(
+        "",
+        "-" * 40,
+        "Step 7: Save Configuration",
+        "-" * 40,
+        "",
+    )
 
     env_path = PROJECT_ROOT / ".env"
 
@@ -325,36 +394,49 @@ LOG_LEVEL=INFO
 DATABASE_URL=sqlite:///data/polybot.db
 """
 
-    env_path.write_text(env_content)
-    print(f"Configuration saved to {env_path}")
-    print()
-    print("SECURITY REMINDER:")
-    print("  - .env is in .gitignore and will NOT be committed")
-    print("  - Never share your private key or API credentials")
-    print("  - The bot starts in PAPER mode by default (no real trades)")
+    # Write to a temp file and rename over .env so an interrupted write never
+    # leaves a truncated secrets file; 0o600 keeps it readable by the owner only.
+    tmp_path = env_path.with_name(env_path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, env_content.encode())
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, env_path)
+    emit(
+        f"Configuration saved to {env_path}",
+        "",
+        "SECURITY REMINDER:",
+        "  - .env is in .gitignore and will NOT be committed",
+        "  - Never share your private key or API credentials",
+        "  - The bot starts in PAPER mode by default (no real trades)",
+    )
 
 
 def step_summary(funder_address: str) -> None:
     """Final summary."""
-    print()
-    print("=" * 60)
-    print("  Setup Complete!")
-    print("=" * 60)
-    print()
-    print("Next steps:")
-    print("  1. Install dependencies:  uv sync")
-    print("  2. Start the bot:         uv run polybot")
-    print("  3. Check status:          uv run polybot --status")
-    print("  4. Enable live trading:   uv run polybot --live")
-    print()
-    print("Before going live, make sure you:")
-    print(f"  - Have USDC in your wallet ({funder_address})")
-    print("  - Have made at least one manual trade on Polymarket")
-    print("  - Have configured strategies in config/strategies.yaml")
-    print("  - Have added whale wallets to config/wallets.yaml")
-    print()
-    print("Read the docs: .planning/ROADMAP.md for the full feature roadmap")
-    print()
+    emit(
+        "",
+        "=" * 60,
+        "  Setup Complete!",
+        "=" * 60,
+        "",
+        "Next steps:",
+        "  1. Install dependencies:  uv sync",
+        "  2. Start the bot:         uv run polybot",
+        "  3. Check status:          uv run polybot --status",
+        "  4. Enable live trading:   uv run polybot --live",
+        "",
+        "Before going live, make sure you:",
+        f"  - Have USDC in your wallet ({funder_address})",
+        "  - Have made at least one manual trade on Polymarket",
+        "  - Have configured strategies in config/strategies.yaml",
+        "  - Have added whale wallets to config/wallets.yaml",
+        "",
+        "Read the docs: .planning/ROADMAP.md for the full feature roadmap",
+        "",
+    )
 
 
 def main() -> None:
@@ -377,11 +459,14 @@ def main() -> None:
     # Step 4: Telegram
     telegram_token, telegram_chat_id = step_telegram()
 
-    # Step 5: Verify balance
-    step_verify_balance(private_key, rpc_url, funder_address)
-
-    # Step 6: Verify API
-    step_verify_api(api_key, api_secret, api_passphrase, funder_address)
+    # Steps 5 + 6: Verify balance and API together, report in step order
+    print("\nVerifying balance and API access...")
+    balance_report, api_report = asyncio.run(
+        _run_verifications(
+            private_key, rpc_url, funder_address, api_key, api_secret, api_passphrase
+        )
+    )
+    emit(*balance_report, *api_report)
 
     # Step 7: Write .env
     step_write_env(
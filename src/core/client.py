@@ -9,23 +9,85 @@ Addresses: CORE-02 (auth), CORE-04 (market discovery), CORE-05 (orders), CORE-06
 from __future__ import annotations
 
 import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 import httpx
 import structlog
-from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import ApiCreds, OrderArgs
 
-from .config import Settings, StrategyConfig
+from . import serialization
+from .config import PROJECT_ROOT, Settings, StrategyConfig
+from .file_cache import FileCache
+from .http import get_shared_client
+from .rate_limiter import TokenBucket
+
+if TYPE_CHECKING:
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import ApiCreds
+
+    from .websocket import WebSocketManager
 
 logger = structlog.get_logger()
 
+_T = TypeVar("_T")
+
+# Gamma/Data responses worth retrying, and the backoff schedule for them
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_TRIES = 4
+_BACKOFF_BASE_S = 0.5
+_BACKOFF_CAP_S = 8.0
+
+# Expired cache entries are swept once a cache grows past this many keys
+_CACHE_SWEEP_SIZE = 1024
+
+# Shared stand-in for a missing token entry; only ever read
+_EMPTY_TOKEN: dict[str, Any] = {}
+
+
+def _get_clob_cls() -> Any:
+    """Import ClobClient on first use.
+
+    py-clob-client pulls in eth_account and the signing stack, which dominates
+    import time. Deferring it keeps `import src.core.client` cheap for callers
+    that only need Market/OrderResult or the Gamma/Data API helpers.
+    """
+    from py_clob_client.client import ClobClient
+
+    return ClobClient
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds to wait from a Retry-After header, capped.
+
+    Accepts both forms RFC 9110 allows: delta-seconds or an HTTP-date.
+    """
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), _BACKOFF_CAP_S)
+
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     """Normalized market data from Gamma API."""
 
+    # Keep the full Gamma payload on `raw`. Off by default so the parsed JSON
+    # can be freed once discovery has built its Market objects.
+    store_raw: ClassVar[bool] = False
+
     condition_id: str
     question: str
     slug: str
@@ -41,49 +103,59 @@ class Market:
     resolved: bool = False
     category: str = ""
     description: str = ""
+    # Winning outcome once the market has resolved ("" while open)
+    resolution: str = ""
     raw: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_gamma(cls, data: dict[str, Any]) -> Market:
-        """Parse a market from Gamma API response."""
-        tokens = data.get("tokens", [])
+    def from_gamma(cls, data: dict[str, Any], keep_raw: bool | None = None) -> Market:
+        """Parse a market from Gamma API response.
+
+        `keep_raw` overrides `store_raw` for a single call (e.g. when a caller
+        needs fields that aren't normalized onto Market).
+        """
+        if keep_raw is None:
+            keep_raw = cls.store_raw
+        get = data.get
+        tokens: list[dict[str, Any]] = get("tokens") or []
         # C-03 FIX: Identify tokens by outcome field, not array index
-        yes_token: dict[str, Any] = {}
-        no_token: dict[str, Any] = {}
-        for token in tokens:
-            outcome = token.get("outcome", "").upper()
-            if outcome == "YES":
-                yes_token = token
-            elif outcome == "NO":
-                no_token = token
         # Fallback: if outcome field missing, use index (legacy compat)
-        if not yes_token and len(tokens) > 0:
-            yes_token = tokens[0]
-        if not no_token and len(tokens) > 1:
-            no_token = tokens[1]
+        yes_token: dict[str, Any] | None = None
+        no_token: dict[str, Any] | None = None
+        for t in tokens:
+            outcome = t.get("outcome", "").upper()
+            if outcome == "YES" and yes_token is None:
+                yes_token = t
+            elif outcome == "NO" and no_token is None:
+                no_token = t
+        if yes_token is None:
+            yes_token = tokens[0] if tokens else _EMPTY_TOKEN
+        if no_token is None:
+            no_token = tokens[1] if len(tokens) > 1 else _EMPTY_TOKEN
 
         return cls(
-            condition_id=data.get("conditionId", data.get("condition_id", "")),
-            question=data.get("question", ""),
-            slug=data.get("slug", ""),
+            condition_id=get("conditionId") or get("condition_id") or "",
+            question=get("question", ""),
+            slug=get("slug", ""),
             yes_token_id=yes_token.get("token_id", ""),
             no_token_id=no_token.get("token_id", ""),
             yes_price=float(yes_token.get("price", 0)),
             no_price=float(no_token.get("price", 0)),
-            volume=float(data.get("volume", 0)),
-            liquidity=float(data.get("liquidity", 0)),
-            end_date=data.get("endDate", data.get("end_date", "")),
-            active=data.get("active", False),
+            volume=float(get("volume", 0)),
+            liquidity=float(get("liquidity", 0)),
+            end_date=get("endDate") or get("end_date", ""),
+            active=get("active", False),
             # M-16 FIX: Parse closed/resolved from API so stink_bidder checks work
-            closed=bool(data.get("closed", False)),
-            resolved=bool(data.get("resolved", False)),
-            category=data.get("category", ""),
-            description=data.get("description", ""),
-            raw=data,
+            closed=bool(get("closed", False)),
+            resolved=bool(get("resolved", False)),
+            category=get("category", ""),
+            description=get("description", ""),
+            resolution=get("resolution") or get("winning_outcome") or "",
+            raw=data if keep_raw else {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """Result of an order placement."""
 
@@ -106,45 +178,117 @@ class PolymarketClient:
         self.settings = settings
         self.strategy_config = strategy_config
         self._clob_client: ClobClient | None = None
+        self._creds: ApiCreds | None = None
         self._http_client: httpx.AsyncClient | None = None
+        # Endpoints and identity resolved once; these are read on every request
+        self._host = settings.polymarket_host
+        self._gamma_url = settings.gamma_api_url
+        self._data_url = settings.data_api_url
+        self._funder = settings.funder_address or ""
+        self._markets_url = f"{self._gamma_url}/markets"
+        self._positions_url = f"{self._data_url}/positions"
+
+        # Dedicated pool for blocking CLOB calls, created in initialize()
+        self._clob_pool: ThreadPoolExecutor | None = None
+        # Orders slower than this to submit are abandoned (0 disables)
+        self._order_timeout = settings.order_submit_timeout_seconds
+        # Background CLOB tasks (late-ack cancels, metadata priming) kept alive until done
+        self._background: set[asyncio.Task[Any]] = set()
+        # Tokens whose tick size / neg-risk / fee rate py-clob-client already holds
+        self._primed_tokens: set[str] = set()
+        # Paces order-mutating CLOB calls so bursts don't trip server-side 429s
+        self._clob_bucket = TokenBucket(
+            rate=settings.clob_orders_per_second,
+            capacity=settings.clob_order_burst,
+        )
+
+        # Response caches: key -> (fetched_at monotonic, value). TTL 0 disables.
+        # One lock per cache key so concurrent callers share a single in-flight request.
+        self._gamma_ttl = settings.gamma_cache_ttl_seconds
+        # Market lists persisted across restarts; only read on a key's first fetch
+        self._file_cache = (
+            FileCache(PROJECT_ROOT / ".cache" / "gamma", settings.gamma_file_cache_ttl_seconds)
+            if settings.gamma_file_cache_ttl_seconds > 0
+            else None
+        )
+        self._disk_checked: set[str] = set()
+        # Full Gamma payloads are only retained on Market.raw when debugging
+        self._keep_raw = settings.debug_keep_raw
+        self._markets_cache: dict[tuple[Any, ...], tuple[float, list[Market]]] = {}
+        self._market_cache: dict[str, tuple[float, Market | None]] = {}
+        self._gamma_locks: dict[Any, asyncio.Lock] = {}
+        self._book_ttl = settings.orderbook_cache_ttl_seconds
+        # Pushed WebSocket quotes are preferred over REST books while this fresh
+        self._quote_feed: WebSocketManager | None = None
+        self._quote_max_age = settings.ws_quote_max_age_seconds
+        self._book_cache: dict[str, tuple[float, Any]] = {}
+        self._book_locks: dict[str, asyncio.Lock] = {}
+        # Tracked wallets that last returned no positions -> monotonic time to re-poll
+        self._empty_wallet_cooldown = settings.empty_wallet_cooldown_seconds
+        self._empty_wallets: dict[str, float] = {}
+        # In-flight CLOB calls shared by concurrent callers, keyed by operation
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        # Caps concurrent requests issued by the *_batch fan-out helpers
+        self._fanout_sem = asyncio.Semaphore(settings.api_concurrency)
 
     async def initialize(self) -> None:
         """Initialize API connections."""
         # Initialize CLOB client
         pk = self.settings.wallet_private_key.get_secret_value()
         if pk:
+            self._creds = self._build_creds()
             # C-01 FIX: Pass private_key via key= parameter
-            # Build ApiCreds from API key/secret/passphrase
-            # M-01 FIX: Extract secret values from SecretStr
-            creds = ApiCreds(
-                api_key=self.settings.polymarket_api_key.get_secret_value(),
-                api_secret=self.settings.polymarket_api_secret.get_secret_value(),
-                api_passphrase=self.settings.polymarket_api_passphrase.get_secret_value(),
-            )
-            self._clob_client = ClobClient(
-                host=self.settings.polymarket_host,
+            self._clob_client = _get_clob_cls()(
+                host=self._host,
                 key=pk,
-                creds=creds,
+                creds=self._creds,
                 signature_type=1,  # MetaMask/Web3 wallet
                 chain_id=self.settings.chain_id,
-                funder=self.settings.funder_address or "",
+                funder=self._funder,
+            )
+            del pk
+            self._clob_pool = ThreadPoolExecutor(
+                max_workers=self.settings.clob_max_workers,
+                thread_name_prefix="clob",
+            )
+            logger.info(
+                "clob_client_initialized",
+                host=self._host,
+                workers=self.settings.clob_max_workers,
             )
-            logger.info("clob_client_initialized", host=self.settings.polymarket_host)
         else:
             logger.warning("clob_client_skipped", reason="no private key configured")
 
-        # Initialize async HTTP client for Gamma/Data APIs
-        self._http_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0),
-            headers={"Accept": "application/json"},
-        )
-        logger.info("http_client_initialized")
+        # Gamma/Data APIs go through the process-wide pooled client so every
+        # PolymarketClient reuses the same warm connections
+        self._http_client = get_shared_client(self.settings)
+
+    def _build_creds(self) -> ApiCreds:
+        """Build CLOB API credentials, reading each secret from Settings exactly once.
+
+        M-01 FIX: Extract secret values from SecretStr. The plaintext only lives
+        in this frame and the returned ApiCreds, which is the single object to
+        swap on re-auth.
+        """
+        from py_clob_client.clob_types import ApiCreds
+
+        api_key = self.settings.polymarket_api_key.get_secret_value()
+        api_secret = self.settings.polymarket_api_secret.get_secret_value()
+        api_passphrase = self.settings.polymarket_api_passphrase.get_secret_value()
+        creds = ApiCreds(api_key=api_key, api_secret=api_secret, api_passphrase=api_passphrase)
+        del api_key, api_secret, api_passphrase
+        return creds
 
     async def close(self) -> None:
-        """Close all connections."""
-        if self._http_client:
-            await self._http_client.aclose()
-            logger.info("http_client_closed")
+        """Release this client's resources.
+
+        The shared HTTP pool stays open for other clients; the application
+        closes it with shutdown_shared_client() on exit.
+        """
+        self._http_client = None
+        if self._clob_pool:
+            self._clob_pool.shutdown(wait=False, cancel_futures=True)
+            self._clob_pool = None
 
     @property
     def clob(self) -> ClobClient:
@@ -160,8 +304,94 @@ class PolymarketClient:
             raise RuntimeError("HTTP client not initialized. Call initialize() first.")
         return self._http_client
 
+    async def _run_clob(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking CLOB call on the dedicated CLOB thread pool.
+
+        Keeps order traffic off the loop's default executor so unrelated blocking
+        work (RPC balance checks, file I/O) cannot delay it. Falls back to the
+        default executor if initialize() has not created the pool.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._clob_pool, fn, *args)
+
+    async def _coalesced(self, key: str, call: Callable[[], Awaitable[_T]]) -> _T:
+        """Share one in-flight `call()` between all concurrent callers for `key`.
+
+        The shared task is shielded so a cancelled caller doesn't cancel it for
+        everyone else; the slot is freed as soon as the call completes.
+        """
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(call())
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(fut)
+
+    async def _bounded(self, aw: Awaitable[_T]) -> _T:
+        """Await `aw` while holding a fan-out slot."""
+        async with self._fanout_sem:
+            return await aw
+
+    async def _get(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """GET with retry on 429/502/503/504.
+
+        Backs off exponentially with full jitter, or for as long as the server's
+        Retry-After asks. The last response is returned as-is once tries run out,
+        so callers keep their own raise_for_status() / 404 handling.
+        """
+        attempt = 1
+        while True:
+            resp = await self.http.get(url, params=params)
+            if resp.status_code not in _RETRY_STATUSES or attempt >= _MAX_TRIES:
+                return resp
+            delay = _retry_after(resp)
+            if delay is None:
+                delay = random.uniform(0, min(_BACKOFF_CAP_S, _BACKOFF_BASE_S * 2**attempt))
+            logger.warning(
+                "http_retry",
+                url=url,
+                status=resp.status_code,
+                attempt=attempt,
+                delay=round(delay, 2),
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
     # ─── Gamma API: Market Discovery ──────────────────────────────
 
+    @staticmethod
+    async def _cached(
+        cache: dict[Any, tuple[float, _T]],
+        locks: dict[Any, asyncio.Lock],
+        key: Any,
+        ttl: float,
+        fetch: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Return a fresh cached value, or fetch it once for all waiting callers."""
+        if ttl <= 0:
+            return await fetch()
+
+        hit = cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+        lock = locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the entry while we waited
+            hit = cache.get(key)
+            now = time.monotonic()
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+
+            value = await fetch()
+            now = time.monotonic()
+            if len(cache) >= _CACHE_SWEEP_SIZE:
+                for stale in [k for k, (ts, _) in cache.items() if now - ts >= ttl]:
+                    del cache[stale]
+                    locks.pop(stale, None)
+            cache[key] = (now, value)
+            return value
+
     async def get_markets(
         self,
         limit: int = 50,
@@ -173,6 +403,8 @@ class PolymarketClient:
     ) -> list[Market]:
         """Fetch markets from Gamma API with filtering.
 
+        Identical queries within `gamma_cache_ttl_seconds` are served from memory.
+
         Addresses: CORE-04
         """
         params: dict[str, Any] = {
@@ -182,38 +414,144 @@ class PolymarketClient:
         }
         if category:
             params["tag"] = category
+        # Let Gamma drop thin markets so the page is filled with usable ones;
+        # _fetch_markets still re-checks locally
+        if min_volume > 0:
+            params["volume_num_min"] = min_volume
+        if min_liquidity > 0:
+            params["liquidity_num_min"] = min_liquidity
+
+        url = self._markets_url
+        key = (url, tuple(sorted(params.items())), min_volume, min_liquidity)
+        markets = await self._cached(
+            self._markets_cache,
+            self._gamma_locks,
+            key,
+            self._gamma_ttl,
+            lambda: self._fetch_markets(url, params, min_volume, min_liquidity),
+        )
+        # Callers may mutate the returned list; never hand out the cached one
+        return list(markets)
 
-        url = f"{self.settings.gamma_api_url}/markets"
-        resp = await self.http.get(url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
-
-        markets = []
+    async def _fetch_markets(
+        self,
+        url: str,
+        params: dict[str, Any],
+        min_volume: float,
+        min_liquidity: float,
+    ) -> list[Market]:
+        """Fetch and filter one page of markets from the Gamma API."""
+        disk_key = f"{url}|{sorted(params.items())}"
+        data = await self._load_from_disk(disk_key)
+        if data is None:
+            resp = await self._get(url, params=params)
+            resp.raise_for_status()
+            data = serialization.loads(resp.content)
+            if self._file_cache is not None:
+                await asyncio.to_thread(self._file_cache.set, disk_key, resp.content)
+
+        markets: list[Market] = []
+        append = markets.append
+        from_gamma = Market.from_gamma
+        keep_raw = self._keep_raw
+        parse_errors = 0
+        last_error = ""
         for item in data:
+            if "conditionId" not in item and "condition_id" not in item:
+                continue
             try:
-                market = Market.from_gamma(item)
-                # Apply filters
-                if market.volume < min_volume:
+                # Apply filters on the raw dict so rejected markets are never built
+                if float(item.get("volume", 0)) < min_volume:
                     continue
-                if market.liquidity < min_liquidity:
+                if float(item.get("liquidity", 0)) < min_liquidity:
                     continue
-                if not market.yes_token_id or not market.no_token_id:
+                tokens = item.get("tokens")
+                if not tokens or len(tokens) < 2:
                     continue
-                markets.append(market)
+                market = from_gamma(item, keep_raw=keep_raw)
             except (KeyError, ValueError, IndexError) as e:
-                logger.warning("market_parse_error", error=str(e), raw=item.get("question", "?"))
+                parse_errors += 1
+                last_error = f"{item.get('question', '?')}: {e}"
+                continue
+            if market.yes_token_id and market.no_token_id:
+                append(market)
+
+        # One warning per page rather than one per malformed market
+        if parse_errors:
+            logger.warning("market_parse_error", error_count=parse_errors, last_error=last_error)
+
+        # Seed the per-market cache so follow-up get_market() calls are free
+        if self._gamma_ttl > 0:
+            now = time.monotonic()
+            for market in markets:
+                self._market_cache[market.condition_id] = (now, market)
 
         logger.info("markets_fetched", count=len(markets), total_raw=len(data))
         return markets
 
+    async def _load_from_disk(self, key: str) -> Any:
+        """Decoded response persisted by a previous run, on this process's first ask.
+
+        Only the first lookup per key consults disk; after that the in-memory
+        caches (and fresh fetches) take over so a long-running bot never reads
+        data older than `gamma_cache_ttl_seconds` from the file cache.
+        """
+        if self._file_cache is None or key in self._disk_checked:
+            return None
+        self._disk_checked.add(key)
+        content = await asyncio.to_thread(self._file_cache.get, key)
+        if content is None:
+            return None
+        try:
+            data = serialization.loads(content)
+        except ValueError:
+            return None
+        logger.info("markets_loaded_from_file_cache", count=len(data))
+        return data
+
+    def invalidate_market_caches(self) -> None:
+        """Forget all cached Gamma responses, in memory and on disk."""
+        self._markets_cache.clear()
+        self._market_cache.clear()
+        if self._file_cache is not None:
+            self._file_cache.invalidate()
+
     async def get_market(self, condition_id: str) -> Market | None:
-        """Fetch a single market by condition ID."""
-        url = f"{self.settings.gamma_api_url}/markets/{condition_id}"
-        resp = await self.http.get(url)
+        """Fetch a single market by condition ID (cached like get_markets)."""
+        return await self._cached(
+            self._market_cache,
+            self._gamma_locks,
+            condition_id,
+            self._gamma_ttl,
+            lambda: self._fetch_market(condition_id),
+        )
+
+    async def get_markets_batch(self, condition_ids: list[str]) -> list[Market | None]:
+        """Fetch several markets by condition ID concurrently.
+
+        Results line up with `condition_ids`. Lookups share get_market's cache
+        and are bounded by `api_concurrency`; a lookup that fails yields None.
+        """
+        results = await asyncio.gather(
+            *(self._bounded(self.get_market(cid)) for cid in condition_ids),
+            return_exceptions=True,
+        )
+        markets: list[Market | None] = []
+        for cid, result in zip(condition_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("get_market_batch_failed", condition_id=cid, error=str(result))
+                result = None
+            markets.append(result)
+        return markets
+
+    async def _fetch_market(self, condition_id: str) -> Market | None:
+        """Fetch a single market from the Gamma API. Returns None on 404."""
+        url = f"{self._markets_url}/{condition_id}"
+        resp = await self._get(url)
         if resp.status_code == 404:
             return None
         resp.raise_for_status()
-        return Market.from_gamma(resp.json())
+        return Market.from_gamma(serialization.loads(resp.content), keep_raw=self._keep_raw)
 
     # ─── CLOB API: Order Operations ──────────────────────────────
 
@@ -225,11 +563,16 @@ class PolymarketClient:
         size: float,
         order_type: str = "GTC",
         expiration: int | None = None,
+        timeout: float | None = None,
     ) -> OrderResult:
         """Create and submit an order via CLOB API.
 
         C-02 FIX: Uses create_and_post_order() to actually submit to exchange.
-        C-05 FIX: Wrapped in asyncio.to_thread() to avoid blocking event loop.
+        C-05 FIX: Run on the CLOB thread pool to avoid blocking event loop.
+
+        If submission takes longer than `timeout` seconds the order is reported
+        as failed, since the price it was made at is likely stale; should the
+        exchange accept it afterwards it is cancelled as soon as the ack lands.
 
         Addresses: CORE-05
         Args:
@@ -239,8 +582,14 @@ class PolymarketClient:
             size: Number of shares
             order_type: "GTC", "FOK", or "IOC"
             expiration: Optional expiration in seconds (GTC only)
+            timeout: Submission deadline in seconds (defaults to
+                order_submit_timeout_seconds; 0 waits indefinitely)
         """
+        if timeout is None:
+            timeout = self._order_timeout
         try:
+            from py_clob_client.clob_types import OrderArgs
+
             # Build proper OrderArgs dataclass
             order_args = OrderArgs(
                 token_id=token_id,
@@ -251,8 +600,30 @@ class PolymarketClient:
             )
 
             # C-02 FIX: Use create_and_post_order instead of create_order
-            # C-05 FIX: Run sync CLOB call in thread to avoid blocking event loop
-            resp = await asyncio.to_thread(self.clob.create_and_post_order, order_args)
+            # C-05 FIX: Run sync CLOB call on the CLOB pool to avoid blocking event loop
+            await self._clob_bucket.acquire()
+            submit = asyncio.ensure_future(
+                self._run_clob(self.clob.create_and_post_order, order_args)
+            )
+            if timeout > 0:
+                try:
+                    # Shielded: the worker thread can't be interrupted, so keep
+                    # the future alive to see whether the order landed anyway
+                    resp = await asyncio.wait_for(asyncio.shield(submit), timeout)
+                except TimeoutError:
+                    submit.add_done_callback(self._cancel_late_order)
+                    logger.warning(
+                        "order_submit_timeout",
+                        token_id=token_id,
+                        side=side,
+                        price=price,
+                        timeout_seconds=timeout,
+                    )
+                    return OrderResult(success=False, error=f"order submission exceeded {timeout}s")
+            else:
+                resp = await submit
+            # Our own order changes the book; don't serve the pre-trade snapshot
+            self._book_cache.pop(token_id, None)
 
             # Parse response
             if isinstance(resp, dict):
@@ -278,7 +649,7 @@ class PolymarketClient:
                 side=side,
                 price=price,
                 size=size,
-                token_id=token_id[:16] + "...",
+                token_id=token_id,
                 order_type=order_type,
             )
             return result
@@ -287,20 +658,98 @@ class PolymarketClient:
             logger.error("order_placement_failed", error=str(e), side=side, price=price, size=size)
             return OrderResult(success=False, error=str(e))
 
+    def prime_order_context(self, token_id: str) -> None:
+        """Start loading a token's order-signing metadata in the background.
+
+        create_order needs the token's tick size, neg-risk flag and fee rate,
+        each a separate blocking GET the first time py-clob-client sees the
+        token (it caches them afterwards). Calling this when a signal is queued
+        moves those round-trips off the order's critical path. No-op without a
+        CLOB client or for tokens already primed.
+        """
+        if self._clob_client is None or not token_id or token_id in self._primed_tokens:
+            return
+        self._primed_tokens.add(token_id)
+        task = asyncio.ensure_future(self._prime_order_context(token_id))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _prime_order_context(self, token_id: str) -> None:
+        clob = self.clob
+        results = await asyncio.gather(
+            self._run_clob(clob.get_tick_size, token_id),
+            self._run_clob(clob.get_neg_risk, token_id),
+            self._run_clob(clob.get_fee_rate_bps, token_id),
+            return_exceptions=True,
+        )
+        errors = [str(r) for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Let the next signal retry; create_order will fetch what's missing
+            self._primed_tokens.discard(token_id)
+            logger.debug("order_context_prime_failed", token_id=token_id, errors=errors)
+
+    def _cancel_late_order(self, submit: asyncio.Future[Any]) -> None:
+        """Cancel an order whose submission ack arrived after we gave up on it."""
+        if submit.cancelled() or submit.exception() is not None:
+            return
+        resp = submit.result()
+        order_id = resp.get("orderID", resp.get("id", "")) if isinstance(resp, dict) else ""
+        if not order_id:
+            return
+        logger.warning("order_late_ack_cancelling", order_id=order_id)
+        task = asyncio.ensure_future(self.cancel_order(order_id))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel a specific order.
 
         C-05 FIX: Async wrapper around sync CLOB call.
         Addresses: CORE-06
         """
+        if not order_id:
+            # Nothing to cancel; don't spend a pacing token or a signed request
+            return False
         try:
-            await asyncio.to_thread(self.clob.cancel, order_id)
+            await self._clob_bucket.acquire()
+            await self._run_clob(self.clob.cancel, order_id)
             logger.info("order_cancelled", order_id=order_id)
             return True
         except Exception as e:
             logger.error("order_cancel_failed", order_id=order_id, error=str(e))
             return False
 
+    async def cancel_orders(self, order_ids: list[str]) -> dict[str, bool]:
+        """Cancel several orders with a single signed CLOB request.
+
+        Returns order_id -> cancelled. Orders the exchange reports under
+        `not_canceled` (already filled, unknown, ...) map to False, as does
+        every ID when the request itself fails.
+
+        C-05 FIX: Async wrapper around sync CLOB call.
+        Addresses: CORE-06
+        """
+        ids = list(dict.fromkeys(oid for oid in order_ids if oid))
+        if not ids:
+            return {}
+        try:
+            await self._clob_bucket.acquire()
+            resp = await self._run_clob(self.clob.cancel_orders, ids)
+        except Exception as e:
+            logger.error("orders_cancel_failed", count=len(ids), error=str(e))
+            return dict.fromkeys(ids, False)
+
+        if isinstance(resp, dict) and "canceled" in resp:
+            done = set(resp["canceled"] or ())
+            results = {oid: oid in done for oid in ids}
+        else:
+            rejected = (resp.get("not_canceled") or {}) if isinstance(resp, dict) else {}
+            results = {oid: oid not in rejected for oid in ids}
+
+        failed = [oid for oid, ok in results.items() if not ok]
+        logger.info("orders_cancelled", count=len(ids) - len(failed), failed=failed)
+        return results
+
     async def cancel_all_orders(self) -> bool:
         """Cancel all open orders.
 
@@ -308,23 +757,34 @@ class PolymarketClient:
         Addresses: CORE-06, RISK-05 (kill switch)
         """
         try:
-            await asyncio.to_thread(self.clob.cancel_all)
+            # Concurrent kill-switch paths share one cancel_all request (and one token)
+            await self._coalesced("cancel_all", self._cancel_all)
             logger.info("all_orders_cancelled")
             return True
         except Exception as e:
             logger.error("cancel_all_failed", error=str(e))
             return False
 
+    async def _cancel_all(self) -> Any:
+        await self._clob_bucket.acquire()
+        return await self._run_clob(self.clob.cancel_all)
+
+    async def fetch_open_orders(self) -> list[dict[str, Any]]:
+        """Get all open orders, letting CLOB errors propagate.
+
+        For callers that must tell "no open orders" apart from "lookup failed"
+        (e.g. reconciliation, which drops orders missing from this list).
+        """
+        orders = await self._coalesced("get_orders", lambda: self._run_clob(self.clob.get_orders))
+        return orders if isinstance(orders, list) else []
+
     async def get_open_orders(self) -> list[dict[str, Any]]:
-        """Get all open orders.
+        """Get all open orders. Returns [] on failure.
 
         C-05 FIX: Async wrapper around sync CLOB call.
         """
         try:
-            orders = await asyncio.to_thread(self.clob.get_orders)
-            if isinstance(orders, list):
-                return orders
-            return orders if orders else []
+            return await self.fetch_open_orders()
         except Exception as e:
             logger.error("get_orders_failed", error=str(e))
             return []
@@ -335,43 +795,111 @@ class PolymarketClient:
         """Get positions for a wallet address.
 
         If wallet_address is None, returns the bot's own positions via Data API.
-        Used for copy trading (tracking whale wallets).
+        Used for copy trading (tracking whale wallets). A tracked wallet that
+        comes back empty is not re-polled for `empty_wallet_cooldown_seconds`.
+        Failures are logged and reported as no positions.
         """
-        # Use Data API for all position queries (CLOB client has no get_positions)
-        address = wallet_address
-        if address is None:
-            address = self.settings.funder_address or ""
-            if not address:
-                logger.warning("get_positions_skipped", reason="no wallet address configured")
-                return []
-
-        url = f"{self.settings.data_api_url}/positions"
-        params = {"user": address}
         try:
-            resp = await self.http.get(url, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            return data if isinstance(data, list) else []
+            return await self._fetch_positions(wallet_address)
         except Exception as e:
             logger.error(
                 "get_positions_failed",
-                wallet=address[:10] + "...",
+                wallet=wallet_address or self._funder,
                 error=str(e),
             )
             return []
 
+    async def _fetch_positions(self, wallet_address: str | None) -> list[dict[str, Any]]:
+        """get_positions without the error handling: request/parse failures raise."""
+        # Use Data API for all position queries (CLOB client has no get_positions)
+        address = wallet_address
+        if address is None:
+            address = self._funder
+            if not address:
+                logger.warning("get_positions_skipped", reason="no wallet address configured")
+                return []
+        else:
+            retry_at = self._empty_wallets.get(address)
+            if retry_at is not None and time.monotonic() < retry_at:
+                return []
+
+        resp = await self._get(self._positions_url, params={"user": address})
+        resp.raise_for_status()
+        data = serialization.loads(resp.content)
+        positions = data if isinstance(data, list) else []
+        if wallet_address is not None and self._empty_wallet_cooldown > 0:
+            if positions:
+                self._empty_wallets.pop(address, None)
+            else:
+                self._empty_wallets[address] = time.monotonic() + self._empty_wallet_cooldown
+        return positions
+
+    def attach_quote_feed(self, feed: WebSocketManager) -> None:
+        """Serve best bid/ask from `feed` for subscribed tokens when fresh.
+
+        Tokens the feed isn't subscribed to, or whose last snapshot is older
+        than `ws_quote_max_age_seconds`, still go to the REST order book.
+        """
+        self._quote_feed = feed
+
+    def _feed_quote(self, token_id: str) -> tuple[float | None, float | None] | None:
+        if self._quote_feed is None or self._quote_max_age <= 0:
+            return None
+        return self._quote_feed.get_quote(token_id, self._quote_max_age)
+
+    async def _get_book(self, token_id: str) -> Any:
+        """Fetch the order book for a token, shared for `orderbook_cache_ttl_seconds`.
+
+        get_price and get_best_bid_ask are often called back-to-back for the
+        same token; both read the same snapshot instead of hitting the CLOB twice.
+        """
+        return await self._cached(
+            self._book_cache,
+            self._book_locks,
+            token_id,
+            self._book_ttl,
+            lambda: self._run_clob(self.clob.get_order_book, token_id),
+        )
+
+    async def get_positions_batch(self, wallets: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Fetch positions for several wallets concurrently.
+
+        At most `api_concurrency` requests are in flight at once. Wallets whose
+        fetch failed are left out of the result so callers don't mistake a
+        failure for an empty portfolio.
+        """
+        unique = list(dict.fromkeys(wallets))
+        results = await asyncio.gather(
+            *(self._bounded(self._fetch_positions(w)) for w in unique),
+            return_exceptions=True,
+        )
+        positions: dict[str, list[dict[str, Any]]] = {}
+        for wallet, result in zip(unique, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "get_positions_batch_failed",
+                    wallet=wallet,
+                    error=str(result),
+                )
+                continue
+            positions[wallet] = result
+        return positions
+
     async def get_price(self, token_id: str) -> float | None:
         """Get current price for a token from the order book.
 
         C-05 FIX: Async wrapper around sync CLOB call.
         """
+        quote = self._feed_quote(token_id)
+        if quote is not None and quote[0] is not None:
+            return quote[0]
         try:
-            book = await asyncio.to_thread(self.clob.get_order_book, token_id)
+            book = await self._get_book(token_id)
             if book and hasattr(book, "bids") and book.bids:
                 return float(book.bids[0].price)
             return None
         except Exception as e:
-            logger.error("get_price_failed", token_id=token_id[:16] + "...", error=str(e))
+            logger.error("get_price_failed", token_id=token_id, error=str(e))
             return None
 
     async def get_best_bid_ask(self, token_id: str) -> tuple[float | None, float | None]:
@@ -379,8 +907,11 @@ class PolymarketClient:
 
         Returns (best_bid, best_ask). Either may be None if the book is empty.
         """
+        quote = self._feed_quote(token_id)
+        if quote is not None:
+            return quote
         try:
-            book = await asyncio.to_thread(self.clob.get_order_book, token_id)
+            book = await self._get_book(token_id)
             best_bid = (
                 float(book.bids[0].price) if book and hasattr(book, "bids") and book.bids else None
             )
@@ -389,5 +920,17 @@ class PolymarketClient:
             )
             return best_bid, best_ask
         except Exception as e:
-            logger.error("get_bid_ask_failed", token_id=token_id[:16] + "...", error=str(e))
+            logger.error("get_bid_ask_failed", token_id=token_id, error=str(e))
             return None, None
+
+    async def get_books_batch(
+        self, token_ids: list[str]
+    ) -> dict[str, tuple[float | None, float | None]]:
+        """Fetch best bid/ask for several tokens concurrently.
+
+        Bounded like get_positions_batch; repeated token IDs share one fetch via
+        the order book cache. Empty or failed books map to (None, None).
+        """
+        unique = list(dict.fromkeys(token_ids))
+        quotes = await asyncio.gather(*(self._bounded(self.get_best_bid_ask(t)) for t in unique))
+        return dict(zip(unique, quotes, strict=True))
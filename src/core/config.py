@@ -14,15 +14,36 @@ Audit fixes applied:
 
 from __future__ import annotations
 
+import hashlib
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
 import structlog
 import yaml
-from pydantic import SecretStr, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    SecretStr,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from . import serialization
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+
+    YAML_C_LOADER = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+    YAML_C_LOADER = False
+
 logger = structlog.get_logger()
 
 
@@ -37,6 +58,17 @@ def _find_project_root() -> Path:
 
 
 PROJECT_ROOT = _find_project_root()
+_STRATEGIES_PATH = PROJECT_ROOT / "config" / "strategies.yaml"
+_WALLETS_PATH = PROJECT_ROOT / "config" / "wallets.yaml"
+
+# H-22: Settings that must be non-empty when trading_mode == "live"
+_LIVE_REQUIRED_FIELDS = (
+    "wallet_private_key",
+    "polymarket_api_key",
+    "polymarket_api_secret",
+    "polymarket_api_passphrase",
+    "funder_address",
+)
 
 
 class Settings(BaseSettings):
@@ -49,6 +81,9 @@ class Settings(BaseSettings):
         env_file=str(PROJECT_ROOT / ".env"),
         env_file_encoding="utf-8",
         extra="ignore",
+        # BaseSettings re-validates every default; ours are literals known to be
+        # valid, so only values from the environment/.env go through validation
+        validate_default=False,
     )
 
     # M-01 FIX: Polymarket API credentials wrapped in SecretStr
@@ -85,6 +120,45 @@ class Settings(BaseSettings):
     # Health check HTTP server port (DEPLOY-03)
     health_port: int = 8080
 
+    # Gamma market responses are reused for this many seconds (0 disables caching)
+    gamma_cache_ttl_seconds: float = 3.0
+    # Market lists saved to .cache/ are reused on restart if younger than this (0 disables)
+    gamma_file_cache_ttl_seconds: float = 60.0
+    # Order book snapshots are shared between price lookups for this long
+    orderbook_cache_ttl_seconds: float = 0.15
+    # WebSocket book quotes younger than this are used instead of a REST fetch (0 disables)
+    ws_quote_max_age_seconds: float = 1.0
+    # Async USDC balance reads are shared between callers for this long (0 disables)
+    balance_cache_ttl_seconds: float = 0.5
+
+    # Worker threads reserved for blocking py-clob-client calls
+    clob_max_workers: int = 8
+    # Order place/cancel pacing: sustained calls per second and burst size (0 rate disables)
+    clob_orders_per_second: float = 10.0
+    clob_order_burst: int = 20
+    # Give up on an order whose submission takes longer than this (0 waits indefinitely)
+    order_submit_timeout_seconds: float = 0.0
+    # Gamma/Data API connection pool size (open sockets / idle sockets kept warm)
+    http_max_connections: int = 100
+    http_max_keepalive: int = 40
+    # Max concurrent requests when fanning out over wallets or order books
+    api_concurrency: int = 8
+    # Tracked wallets with no positions are re-polled at most this often (0 disables)
+    empty_wallet_cooldown_seconds: float = 60.0
+    # SQLite page cache and memory-mapped I/O window per connection, in MB (0 mmap disables)
+    db_cache_mb: int = 64
+    db_mmap_mb: int = 256
+    # Read-only SQLite connections serving queries beside the writer (0 reads on the writer)
+    db_read_connections: int = 4
+    # Seconds between ANALYZE + WAL truncation runs on the database (0 disables)
+    db_maintenance_interval_seconds: float = 3600.0
+    # Keep the full Gamma payload on Market.raw (debugging only; costs memory per market)
+    debug_keep_raw: bool = False
+
+    # (database_url, parsed path): Settings stays mutable, so db_path is reparsed
+    # only when database_url has changed since the last call
+    _db_path_cache: tuple[str, Path] | None = PrivateAttr(default=None)
+
     @field_validator("trading_mode")
     @classmethod
     def validate_trading_mode(cls, v: str) -> str:
@@ -109,17 +183,9 @@ class Settings(BaseSettings):
         if self.trading_mode != "live":
             return self
 
-        missing: list[str] = []
-        if not self.wallet_private_key.get_secret_value():
-            missing.append("wallet_private_key")
-        if not self.polymarket_api_key.get_secret_value():
-            missing.append("polymarket_api_key")
-        if not self.polymarket_api_secret.get_secret_value():
-            missing.append("polymarket_api_secret")
-        if not self.polymarket_api_passphrase.get_secret_value():
-            missing.append("polymarket_api_passphrase")
-        if not self.funder_address:
-            missing.append("funder_address")
+        # SecretStr is falsy when empty, so presence is checked without
+        # materializing the secret values
+        missing = [name for name in _LIVE_REQUIRED_FIELDS if not getattr(self, name)]
 
         if missing:
             raise ValueError(
@@ -136,10 +202,84 @@ class Settings(BaseSettings):
     def db_path(self) -> Path:
         """Extract SQLite file path from database URL."""
         url = self.database_url
+        cached = self._db_path_cache
+        if cached is not None and cached[0] == url:
+            return cached[1]
         if url.startswith("sqlite:///"):
-            rel_path = url[len("sqlite:///") :]
-            return PROJECT_ROOT / rel_path
-        return PROJECT_ROOT / "data" / "polybot.db"
+            path = PROJECT_ROOT / url[len("sqlite:///") :]
+        else:
+            path = PROJECT_ROOT / "data" / "polybot.db"
+        self._db_path_cache = (url, path)
+        return path
+
+
+def _load_yaml(path: Path) -> dict[str, Any]:
+    """Parse a YAML mapping, reusing a JSON copy when the file hasn't changed.
+
+    The copy lives next to the YAML as `.<name>.cache.json`, keyed by a hash
+    of the YAML bytes, so any edit invalidates it. Parsing uses the
+    libyaml-backed loader when available.
+    """
+    content = path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    cache = path.with_name(f".{path.name}.cache.json")
+    try:
+        cached = serialization.loads(cache.read_bytes())
+        if cached.get("source") == digest:
+            return cached["data"]  # type: ignore[no-any-return]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    raw = yaml.load(content, Loader=_YamlLoader)
+    # H-23 FIX: safe loaders return None for empty files
+    data: dict[str, Any] = raw if isinstance(raw, dict) else {}
+    _write_yaml_cache(cache, digest, data)
+    return data
+
+
+def _write_yaml_cache(cache: Path, digest: str, data: dict[str, Any]) -> None:
+    """Best effort: skip content JSON can't reproduce exactly (dates, int keys)."""
+    try:
+        encoded = serialization.dumps({"source": digest, "data": data})
+        if serialization.loads(encoded)["data"] != data:
+            return
+        tmp = cache.with_suffix(".tmp")
+        tmp.write_text(encoded, encoding="utf-8")
+        os.replace(tmp, cache)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+class _Section(BaseModel):
+    """Typed view of one strategies.yaml section; unknown keys are ignored."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class _GlobalSection(_Section):
+    max_position_pct: float = 15.0
+    max_open_positions: int = 10
+    min_edge_pct: float = 5.0
+    min_cash_reserve_pct: float = 10.0
+    daily_loss_limit_pct: float = 10.0
+    min_position_size_usd: float = 25.0
+
+
+class _FeesSection(_Section):
+    winner_fee_pct: float = 2.0
+    max_taker_fee_pct: float = 3.15
+    estimated_gas_usd: float = 0.03
+
+
+class _TakeProfitTier(_Section):
+    gain_pct: float
+    sell_pct: float
+
+
+class _PositionsSection(_Section):
+    take_profit: list[_TakeProfitTier] = []
+    stop_loss_pct: float = 25.0
+    trailing_stop_pct: float = 10.0
 
 
 class StrategyConfig:
@@ -152,15 +292,12 @@ class StrategyConfig:
 
     def __init__(self, config_path: Path | None = None):
         if config_path is None:
-            config_path = PROJECT_ROOT / "config" / "strategies.yaml"
+            config_path = _STRATEGIES_PATH
 
         if not config_path.exists():
             raise FileNotFoundError(f"Strategy config not found: {config_path}")
 
-        with open(config_path) as f:
-            raw = yaml.safe_load(f)
-            # H-23 FIX: safe_load returns None for empty files
-            self._data: dict[str, Any] = raw if isinstance(raw, dict) else {}
+        self._data = _load_yaml(config_path)
 
         if not self._data:
             logger.warning(
@@ -169,11 +306,28 @@ class StrategyConfig:
                 msg="Strategy config file is empty or invalid, using defaults",
             )
 
+        # Scalar sections are validated once here, so a malformed value (e.g. a
+        # non-numeric stop_loss_pct) fails at startup rather than mid-trade.
+        # pydantic's ValidationError is a ValueError, like the M-02 check below.
+        self._global = _GlobalSection.model_validate(self.global_config or {})
+        self._fees = _FeesSection.model_validate(self.fees or {})
+        self._positions = _PositionsSection.model_validate(self.positions or {})
+        self._take_profit_tiers: list[dict[str, float]] = [
+            tier.model_dump() for tier in self._positions.take_profit
+        ]
+
+        # Per-strategy (enabled, allocation_pct), parsed once for the hot getters
+        self._strategy_index: dict[str, tuple[bool, float]] = {}
+
         # M-02 FIX: Validate allocation totals
         self._validate_allocations()
 
     def _validate_allocations(self) -> None:
-        """M-02 FIX: Validate that enabled strategy allocations sum to ≤ 100%."""
+        """M-02 FIX: Validate that enabled strategy allocations sum to ≤ 100%.
+
+        Also builds the per-strategy index used by is_strategy_enabled and
+        get_strategy_allocation.
+        """
         strategies = self._data.get("strategies", {})
         if not isinstance(strategies, dict):
             return
@@ -182,9 +336,11 @@ class StrategyConfig:
         for name, cfg in strategies.items():
             if not isinstance(cfg, dict):
                 continue
-            if not cfg.get("enabled", False):
-                continue
+            enabled = bool(cfg.get("enabled", False))
             alloc = float(cfg.get("allocation_pct", 0.0))
+            self._strategy_index[name] = (enabled, alloc)
+            if not enabled:
+                continue
             if alloc < 0:
                 raise ValueError(f"Strategy '{name}' has negative allocation_pct: {alloc}")
             total_allocation += alloc
@@ -218,43 +374,44 @@ class StrategyConfig:
     def fees(self) -> dict[str, Any]:
         return self._data.get("fees", {})  # type: ignore[no-any-return]
 
-    # Global settings with defaults
-    @property
+    # Global settings with defaults, read from the validated sections and kept on
+    # the instance: the YAML doesn't change after load and risk checks read these per signal.
+    @cached_property
     def max_position_pct(self) -> float:
-        return float(self.global_config.get("max_position_pct", 15.0))
+        return self._global.max_position_pct
 
-    @property
+    @cached_property
     def max_open_positions(self) -> int:
-        return int(self.global_config.get("max_open_positions", 10))
+        return self._global.max_open_positions
 
-    @property
+    @cached_property
     def min_edge_pct(self) -> float:
-        return float(self.global_config.get("min_edge_pct", 5.0))
+        return self._global.min_edge_pct
 
-    @property
+    @cached_property
     def min_cash_reserve_pct(self) -> float:
-        return float(self.global_config.get("min_cash_reserve_pct", 10.0))
+        return self._global.min_cash_reserve_pct
 
-    @property
+    @cached_property
     def daily_loss_limit_pct(self) -> float:
-        return float(self.global_config.get("daily_loss_limit_pct", 10.0))
+        return self._global.daily_loss_limit_pct
 
-    @property
+    @cached_property
     def min_position_size_usd(self) -> float:
-        return float(self.global_config.get("min_position_size_usd", 25.0))
+        return self._global.min_position_size_usd
 
     # Fee helpers
-    @property
+    @cached_property
     def winner_fee_pct(self) -> float:
-        return float(self.fees.get("winner_fee_pct", 2.0))
+        return self._fees.winner_fee_pct
 
-    @property
+    @cached_property
     def max_taker_fee_pct(self) -> float:
-        return float(self.fees.get("max_taker_fee_pct", 3.15))
+        return self._fees.max_taker_fee_pct
 
-    @property
+    @cached_property
     def estimated_gas_usd(self) -> float:
-        return float(self.fees.get("estimated_gas_usd", 0.03))
+        return self._fees.estimated_gas_usd
 
     def get_strategy(self, name: str) -> dict[str, Any] | None:
         """Get configuration for a specific strategy."""
@@ -262,29 +419,25 @@ class StrategyConfig:
 
     def is_strategy_enabled(self, name: str) -> bool:
         """Check if a strategy is enabled."""
-        strategy = self.get_strategy(name)
-        if strategy is None:
-            return False
-        return strategy.get("enabled", False)  # type: ignore[no-any-return]
+        entry = self._strategy_index.get(name)
+        return entry[0] if entry else False
 
     def get_strategy_allocation(self, name: str) -> float:
         """Get allocation percentage for a strategy."""
-        strategy = self.get_strategy(name)
-        if strategy is None:
-            return 0.0
-        return float(strategy.get("allocation_pct", 0.0))
+        entry = self._strategy_index.get(name)
+        return entry[1] if entry else 0.0
 
     def get_take_profit_tiers(self) -> list[dict[str, float]]:
         """Get take-profit tier configuration."""
-        return self.positions.get("take_profit", [])  # type: ignore[no-any-return]
+        return self._take_profit_tiers
 
-    @property
+    @cached_property
     def stop_loss_pct(self) -> float:
-        return float(self.positions.get("stop_loss_pct", 25.0))
+        return self._positions.stop_loss_pct
 
-    @property
+    @cached_property
     def trailing_stop_pct(self) -> float:
-        return float(self.positions.get("trailing_stop_pct", 10.0))
+        return self._positions.trailing_stop_pct
 
 
 class WalletConfig:
@@ -295,15 +448,22 @@ class WalletConfig:
 
     def __init__(self, config_path: Path | None = None):
         if config_path is None:
-            config_path = PROJECT_ROOT / "config" / "wallets.yaml"
+            config_path = _WALLETS_PATH
 
         if not config_path.exists():
             raise FileNotFoundError(f"Wallet config not found: {config_path}")
 
-        with open(config_path) as f:
-            raw = yaml.safe_load(f)
-            # H-23 FIX: safe_load returns None for empty files
-            self._data: dict[str, Any] = raw if isinstance(raw, dict) else {}
+        self._data = _load_yaml(config_path)
+
+        # Built once: the wallet list doesn't change after load
+        self._enabled: list[dict[str, Any]] = [
+            w for w in self.wallets if w.get("enabled", False) and w.get("address")
+        ]
+        self._by_address: dict[str, dict[str, Any]] = {}
+        for w in self.wallets:
+            if w.get("address"):
+                # First entry wins, as with the old linear scan
+                self._by_address.setdefault(w["address"].lower(), w)
 
     @property
     def wallets(self) -> list[dict[str, Any]]:
@@ -311,17 +471,16 @@ class WalletConfig:
 
     @property
     def enabled_wallets(self) -> list[dict[str, Any]]:
-        return [w for w in self.wallets if w.get("enabled", False) and w.get("address")]
+        return self._enabled
 
     def get_wallet(self, address: str) -> dict[str, Any] | None:
         """Get wallet config by address (case-insensitive)."""
-        addr_lower = address.lower()
-        for w in self.wallets:
-            if w.get("address", "").lower() == addr_lower:
-                return w
-        return None
+        return self._by_address.get(address.lower())
 
 
+# Loaders are memoized: configuration is read once per process, and every
+# caller shares the same objects. clear_config_caches() forces a reload.
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
     """Load settings from environment / .env file."""
     return Settings()
@@ -329,9 +488,26 @@ def load_settings() -> Settings:
 
 def load_strategy_config(path: Path | None = None) -> StrategyConfig:
     """Load strategy configuration from YAML."""
-    return StrategyConfig(path)
+    return _load_strategy_config((path or _STRATEGIES_PATH).resolve())
 
 
 def load_wallet_config(path: Path | None = None) -> WalletConfig:
     """Load tracked wallet configuration from YAML."""
+    return _load_wallet_config((path or _WALLETS_PATH).resolve())
+
+
+@lru_cache(maxsize=8)
+def _load_strategy_config(path: Path) -> StrategyConfig:
+    return StrategyConfig(path)
+
+
+@lru_cache(maxsize=8)
+def _load_wallet_config(path: Path) -> WalletConfig:
     return WalletConfig(path)
+
+
+def clear_config_caches() -> None:
+    """Drop memoized settings and configs so the next load re-reads them."""
+    load_settings.cache_clear()
+    _load_strategy_config.cache_clear()
+    _load_wallet_config.cache_clear()
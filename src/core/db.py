@@ -8,27 +8,102 @@ Audit fixes applied:
 - H-19: Transaction context manager for multi-step operations
 - M-03: Proper JSON extraction instead of LIKE for metadata queries
 - M-22: WAL mode + busy timeout for concurrent access
+
+Writes go through a single writer connection; plain queries are served by a
+small pool of read-only connections so they don't queue behind it.
 """
 
 from __future__ import annotations
 
-import json
+import queue
 import sqlite3
-from collections.abc import Generator
+import sys
+import time
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import Any
 
 import structlog
 
+from . import serialization
 from .config import Settings
 
 logger = structlog.get_logger()
 
 
+# Filtered reads use a fixed set of query strings keyed by which filters are
+# present, so each variant hits sqlite3's statement cache instead of being
+# rebuilt (and re-prepared) from string concatenation on every call.
+_SQL_TRADES = {
+    (False, False): "SELECT * FROM trades ORDER BY created_at DESC LIMIT ?",
+    (True, False): "SELECT * FROM trades WHERE strategy = ? ORDER BY created_at DESC LIMIT ?",
+    (False, True): "SELECT * FROM trades WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+    (True, True): (
+        "SELECT * FROM trades WHERE strategy = ? AND status = ? ORDER BY created_at DESC LIMIT ?"
+    ),
+}
+_SQL_OPEN_POSITIONS_ALL = (
+    "SELECT * FROM positions WHERE status IN ('open', 'closing') ORDER BY opened_at DESC"
+)
+_SQL_OPEN_POSITIONS_BY_STRATEGY = (
+    "SELECT * FROM positions WHERE status IN ('open', 'closing') AND strategy = ?"
+    " ORDER BY opened_at DESC"
+)
+_SQL_CLOSED_POSITIONS_ALL = (
+    "SELECT * FROM positions WHERE status = 'closed' ORDER BY closed_at DESC LIMIT ?"
+)
+_SQL_CLOSED_POSITIONS_BY_STRATEGY = (
+    "SELECT * FROM positions WHERE status = 'closed' AND strategy = ?"
+    " ORDER BY closed_at DESC LIMIT ?"
+)
+
+_TRADE_INSERT = """INSERT{or_ignore} INTO trades
+    (order_id, strategy, market_id, token_id, side, price, size,
+     order_type, status, reasoning, created_at, updated_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'submitted', ?, ?, ?, ?)"""
+# RETURNING needs SQLite 3.35+; older builds fall back to INSERT OR IGNORE + SELECT
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_INSERT_TRADE_RETURNING = (
+    _TRADE_INSERT.format(or_ignore="")
+    + " ON CONFLICT(order_id) DO UPDATE SET order_id = excluded.order_id"
+    + " RETURNING id, created_at"
+)
+_SQL_INSERT_TRADE_OR_IGNORE = _TRADE_INSERT.format(or_ignore=" OR IGNORE")
+
+_SQL_UPDATE_TRADE_STATUS = "UPDATE trades SET status = ?, updated_at = ? WHERE order_id = ?"
+
+# Unrealized P&L is derived from the stored entry price, size and side in SQL,
+# so a price tick is one UPDATE with no SELECT round-trip
+_SQL_UPDATE_POSITION_PRICE = """UPDATE positions
+    SET current_price = :price,
+        unrealized_pnl = CASE WHEN side = 'BUY'
+            THEN (:price - entry_price) * size
+            ELSE (entry_price - :price) * size END
+    WHERE id = :id"""
+
+# Comfortably above the number of distinct statements this module issues
+_STATEMENT_CACHE_SIZE = 256
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted; one
+# tuple so concurrent callers never pair a second with another's prefix
+_ts_cache: tuple[int, str] = (-1, "")
+
+
 def _utcnow() -> str:
-    """UTC timestamp string."""
-    return datetime.now(UTC).isoformat()
+    """UTC timestamp string, e.g. 2026-02-13T09:30:00.123456+00:00.
+
+    The date/time part is formatted once per second; each call only fills in
+    the microseconds, so writes don't build a datetime object apiece.
+    """
+    global _ts_cache
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
 
 
 class Database:
@@ -40,23 +115,70 @@ class Database:
     def __init__(self, settings: Settings):
         self.db_path = settings.db_path
         self._conn: sqlite3.Connection | None = None
-        self._in_transaction: bool = False
+        # Nesting depth of transaction(); >0 means writes join an open transaction
+        self._tx_depth = 0
+        self._read_pool_size = settings.db_read_connections
+        self._cache_kib = settings.db_cache_mb * 1024
+        # mmap'd database files are unreliable on Windows; stick to read() syscalls there
+        self._mmap_bytes = 0 if sys.platform == "win32" else settings.db_mmap_mb * 1024 * 1024
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._all_readers: list[sqlite3.Connection] = []
 
     def initialize(self) -> None:
         """Create database and tables."""
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._conn = sqlite3.connect(str(self.db_path))
+        # Autocommit: single statements commit on their own, and multi-statement
+        # writes open BEGIN IMMEDIATE explicitly. Python's implicit BEGIN is
+        # DEFERRED, which can lose the read->write lock upgrade to another
+        # writer and fail with "database is locked" instead of waiting.
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            isolation_level=None,
+        )
         self._conn.row_factory = sqlite3.Row
         # M-22 FIX: WAL mode for concurrent reads + busy timeout to avoid lock errors
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
         self._conn.execute("PRAGMA busy_timeout=5000")  # Wait up to 5s for lock
         self._conn.execute("PRAGMA synchronous=NORMAL")  # Good balance for WAL mode
+        self._apply_cache_pragmas(self._conn)
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA wal_autocheckpoint=1000")  # pages (SQLite's default)
 
         self._create_tables()
-        logger.info("database_initialized", path=str(self.db_path))
+        # Upstream-recommended on open: ANALYZE only tables whose stats look stale
+        self._conn.execute("PRAGMA optimize=0x10002")
+        self._open_readers()
+        logger.info(
+            "database_initialized",
+            path=str(self.db_path),
+            read_connections=len(self._all_readers),
+        )
+
+    def _open_readers(self) -> None:
+        """Open the read-only connection pool (WAL lets them run beside the writer)."""
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        for _ in range(self._read_pool_size):
+            reader = sqlite3.connect(
+                uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA busy_timeout=5000")
+            self._apply_cache_pragmas(reader)
+            self._all_readers.append(reader)
+            self._readers.put(reader)
+
+    def _apply_cache_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Page cache and mmap window are per connection, so every connection gets them."""
+        # Negative cache_size is in KiB rather than pages
+        conn.execute(f"PRAGMA cache_size=-{self._cache_kib}")
+        conn.execute(f"PRAGMA mmap_size={self._mmap_bytes}")
 
     def _create_tables(self) -> None:
         """Create all required tables."""
@@ -103,7 +225,9 @@ class Database:
                 opened_at TEXT NOT NULL,
                 closed_at TEXT,
                 close_reason TEXT,
-                metadata TEXT
+                metadata TEXT,
+                source_wallet TEXT GENERATED ALWAYS AS
+                    (json_extract(metadata, '$.source_wallet')) VIRTUAL
             );
 
             -- Daily P&L snapshots
@@ -154,9 +278,38 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status);
             CREATE INDEX IF NOT EXISTS idx_positions_strategy ON positions(strategy);
             CREATE INDEX IF NOT EXISTS idx_whale_wallet ON whale_positions(wallet_address);
+
+            -- Composite indexes matching the filtered, ordered reads
+            CREATE INDEX IF NOT EXISTS idx_trades_strategy_status_created
+                ON trades(strategy, status, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_positions_status_strategy_opened
+                ON positions(status, strategy, opened_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_positions_status_closed_at
+                ON positions(status, closed_at DESC);
         """)
+        self._migrate_source_wallet()
         self._conn.commit()
 
+    def _migrate_source_wallet(self) -> None:
+        """Add positions.source_wallet to databases created before it existed.
+
+        ALTER TABLE can only add VIRTUAL generated columns; the index below
+        stores the extracted values, so lookups never parse metadata JSON.
+        """
+        assert self._conn is not None
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_xinfo(positions)")}
+        if "source_wallet" not in columns:
+            self._conn.execute(
+                """ALTER TABLE positions ADD COLUMN source_wallet TEXT
+                   GENERATED ALWAYS AS (json_extract(metadata, '$.source_wallet')) VIRTUAL"""
+            )
+            logger.info("database_migrated", column="positions.source_wallet")
+        self._conn.executescript("""
+            DROP INDEX IF EXISTS idx_positions_metadata_source_wallet;
+            CREATE INDEX IF NOT EXISTS idx_positions_source_wallet
+                ON positions(source_wallet);
+        """)
+
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
@@ -165,10 +318,49 @@ class Database:
 
     def close(self) -> None:
         """Close database connection."""
+        for reader in self._all_readers:
+            reader.close()
+        self._all_readers.clear()
+        self._readers = queue.Queue()
         if self._conn:
+            # Persist any planner statistics this session showed to be useful
+            self._conn.execute("PRAGMA optimize")
             self._conn.close()
+            self._conn = None
             logger.info("database_closed")
 
+    def maintenance(self) -> None:
+        """Refresh query planner statistics and truncate the WAL file.
+
+        Meant for a periodic job; both steps are cheap on a database this size.
+        """
+        self.conn.execute("ANALYZE")
+        busy, wal_pages, checkpointed = self.conn.execute(
+            "PRAGMA wal_checkpoint(TRUNCATE)"
+        ).fetchone()
+        logger.info(
+            "database_maintenance",
+            checkpoint_blocked=bool(busy),
+            wal_pages=wal_pages,
+            checkpointed_pages=checkpointed,
+        )
+
+    @contextmanager
+    def read(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow a read-only connection for a query.
+
+        Inside transaction() (or with the pool disabled) this yields the writer,
+        so reads still see the transaction's own uncommitted rows.
+        """
+        if self._tx_depth or not self._all_readers:
+            yield self.conn
+            return
+        reader = self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+
     # H-19 FIX: Transaction context manager for multi-step operations
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Connection, None, None]:
@@ -180,24 +372,30 @@ class Database:
                 db.open_position(...)
             # COMMIT on success, ROLLBACK on exception
 
-        Individual methods skip their own commit() when inside a transaction.
+        Writes made inside the block join it instead of committing on their own.
+        Nesting is allowed: only the outermost block takes the write lock with
+        BEGIN IMMEDIATE and commits; inner blocks are savepoints, so a failing
+        inner block rolls back just its own statements.
         """
         conn = self.conn
-        conn.execute("BEGIN IMMEDIATE")
-        self._in_transaction = True
+        depth = self._tx_depth
+        if depth == 0:
+            begin, commit, rollback = "BEGIN IMMEDIATE", "COMMIT", ["ROLLBACK"]
+        else:
+            name = f"polybot_tx_{depth}"
+            begin, commit = f"SAVEPOINT {name}", f"RELEASE {name}"
+            rollback = [f"ROLLBACK TO {name}", f"RELEASE {name}"]
+        conn.execute(begin)
+        self._tx_depth = depth + 1
         try:
             yield conn
-            conn.execute("COMMIT")
-        except Exception:
-            conn.execute("ROLLBACK")
+            conn.execute(commit)
+        except BaseException:
+            for stmt in rollback:
+                conn.execute(stmt)
             raise
         finally:
-            self._in_transaction = False
-
-    def _commit(self) -> None:
-        """Commit unless we're inside an explicit transaction (H-19)."""
-        if not self._in_transaction:
-            self.conn.commit()
+            self._tx_depth = depth
 
     # ─── Trade Operations ─────────────────────────────────────────
 
@@ -216,56 +414,63 @@ class Database:
     ) -> int:
         """Record a new trade.
 
-        H-18 FIX: Uses INSERT OR IGNORE to prevent overwriting existing trades.
-        If a trade with the same order_id already exists, returns the existing row ID.
+        H-18 FIX: An existing trade with the same order_id is never overwritten;
+        its row ID is returned instead.
         """
         now = _utcnow()
-        cursor = self.conn.execute(
-            """INSERT OR IGNORE INTO trades
-               (order_id, strategy, market_id, token_id, side, price, size,
-                order_type, status, reasoning, created_at, updated_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'submitted', ?, ?, ?, ?)""",
-            (
-                order_id,
-                strategy,
-                market_id,
-                token_id,
-                side,
-                price,
-                size,
-                order_type,
-                reasoning,
-                now,
-                now,
-                json.dumps(metadata) if metadata else None,
-            ),
+        params = (
+            order_id,
+            strategy,
+            market_id,
+            token_id,
+            side,
+            price,
+            size,
+            order_type,
+            reasoning,
+            now,
+            now,
+            serialization.dumps(metadata) if metadata else None,
         )
-        self._commit()
 
-        if cursor.rowcount == 0:
-            # Trade already existed — return existing row ID
-            row = self.conn.execute(
-                "SELECT id FROM trades WHERE order_id = ?", (order_id,)
-            ).fetchone()
-            existing_id = row["id"] if row else -1
+        if _SQLITE_HAS_RETURNING:
+            # One statement either way: the conflict branch rewrites order_id
+            # with itself (no column changes) just so RETURNING yields the
+            # existing row, whose created_at predates this call.
+            row = self.conn.execute(_SQL_INSERT_TRADE_RETURNING, params).fetchone()
+            trade_id, inserted = row["id"], row["created_at"] == now
+        else:
+            cursor = self.conn.execute(_SQL_INSERT_TRADE_OR_IGNORE, params)
+            trade_id, inserted = cursor.lastrowid, cursor.rowcount > 0
+            if not inserted:
+                row = self.conn.execute(
+                    "SELECT id FROM trades WHERE order_id = ?", (order_id,)
+                ).fetchone()
+                trade_id = row["id"] if row else -1
+
+        if not inserted:
             logger.warning(
                 "trade_already_exists",
                 order_id=order_id,
-                existing_id=existing_id,
+                existing_id=trade_id,
             )
-            return existing_id
+            return trade_id  # type: ignore
 
         logger.info(
             "trade_recorded",
-            trade_id=cursor.lastrowid,
+            trade_id=trade_id,
             order_id=order_id,
             strategy=strategy,
             side=side,
         )
-        return cursor.lastrowid  # type: ignore
+        return trade_id  # type: ignore
 
     def update_trade_status(self, order_id: str, status: str, **kwargs: Any) -> None:
         """Update trade status (filled, cancelled, etc.)."""
+        if not kwargs:
+            self.conn.execute(_SQL_UPDATE_TRADE_STATUS, (status, _utcnow(), order_id))
+            return
+
         sets = ["status = ?", "updated_at = ?"]
         vals: list[Any] = [status, _utcnow()]
 
@@ -279,7 +484,6 @@ class Database:
             f"UPDATE trades SET {', '.join(sets)} WHERE order_id = ?",
             vals,
         )
-        self._commit()
 
     def get_trades(
         self,
@@ -288,21 +492,26 @@ class Database:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Query trade history."""
-        query = "SELECT * FROM trades WHERE 1=1"
-        params: list[Any] = []
+        return [dict(row) for row in self.iter_trades(strategy, status, limit)]
 
-        if strategy:
-            query += " AND strategy = ?"
-            params.append(strategy)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
+    def iter_trades(
+        self,
+        strategy: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+    ) -> Iterator[sqlite3.Row]:
+        """Like get_trades(), but yields sqlite3.Row objects without a dict copy per row.
 
-        query += " ORDER BY created_at DESC LIMIT ?"
+        For single-pass callers; rows support row["column"] but not .get().
+        """
+        params: list[Any] = [v for v in (strategy, status) if v]
         params.append(limit)
+        query = _SQL_TRADES[(bool(strategy), bool(status))]
 
-        rows = self.conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+        # Fetched eagerly so the read connection goes straight back to the pool
+        with self.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return iter(rows)
 
     # ─── Position Operations ──────────────────────────────────────
 
@@ -334,10 +543,9 @@ class Database:
                 entry_price,
                 stop_loss_price,
                 now,
-                json.dumps(metadata) if metadata else None,
+                serialization.dumps(metadata) if metadata else None,
             ),
         )
-        self._commit()
         return cursor.lastrowid  # type: ignore
 
     def set_position_closing(self, position_id: int, close_reason: str) -> None:
@@ -351,7 +559,6 @@ class Database:
             " WHERE id = ? AND status = 'open'",
             (close_reason, position_id),
         )
-        self._commit()
 
     def close_position(
         self,
@@ -367,32 +574,20 @@ class Database:
                WHERE id = ? AND status IN ('open', 'closing')""",
             (realized_pnl, close_reason, now, position_id),
         )
-        self._commit()
 
     def update_position_price(self, position_id: int, current_price: float) -> None:
         """Update current price and unrealized P&L for a position."""
-        row = self.conn.execute(
-            "SELECT entry_price, size, side FROM positions WHERE id = ?",
-            (position_id,),
-        ).fetchone()
+        self.conn.execute(_SQL_UPDATE_POSITION_PRICE, {"id": position_id, "price": current_price})
 
-        if not row:
+    def update_position_prices_bulk(self, updates: list[tuple[int, float]]) -> None:
+        """Apply many (position_id, current_price) updates with a single commit."""
+        if not updates:
             return
-
-        entry_price = row["entry_price"]
-        size = row["size"]
-        side = row["side"]
-
-        if side == "BUY":
-            unrealized_pnl = (current_price - entry_price) * size
-        else:
-            unrealized_pnl = (entry_price - current_price) * size
-
-        self.conn.execute(
-            "UPDATE positions SET current_price = ?, unrealized_pnl = ? WHERE id = ?",
-            (current_price, unrealized_pnl, position_id),
-        )
-        self._commit()
+        with self.transaction():
+            self.conn.executemany(
+                _SQL_UPDATE_POSITION_PRICE,
+                [{"id": position_id, "price": price} for position_id, price in updates],
+            )
 
     def update_position_trailing_stop(self, position_id: int, trailing_stop_price: float) -> None:
         """Update the trailing stop price for a position."""
@@ -400,7 +595,6 @@ class Database:
             "UPDATE positions SET trailing_stop_price = ? WHERE id = ?",
             (trailing_stop_price, position_id),
         )
-        self._commit()
 
     def update_position_partial_close(
         self, position_id: int, remaining_size: float, take_profit_triggered: int
@@ -410,26 +604,26 @@ class Database:
             "UPDATE positions SET size = ?, take_profit_triggered = ? WHERE id = ?",
             (remaining_size, take_profit_triggered, position_id),
         )
-        self._commit()
 
     def get_open_positions(self, strategy: str | None = None) -> list[dict[str, Any]]:
         """Get all open or closing positions (both need price monitoring)."""
-        query = "SELECT * FROM positions WHERE status IN ('open', 'closing')"
-        params: list[Any] = []
+        return [dict(row) for row in self.iter_open_positions(strategy)]
 
-        if strategy:
-            query += " AND strategy = ?"
-            params.append(strategy)
-
-        query += " ORDER BY opened_at DESC"
-        rows = self.conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+    def iter_open_positions(self, strategy: str | None = None) -> Iterator[sqlite3.Row]:
+        """Like get_open_positions(), but yields sqlite3.Row objects (see iter_trades)."""
+        with self.read() as conn:
+            if strategy:
+                rows = conn.execute(_SQL_OPEN_POSITIONS_BY_STRATEGY, (strategy,)).fetchall()
+            else:
+                rows = conn.execute(_SQL_OPEN_POSITIONS_ALL).fetchall()
+        return iter(rows)
 
     def count_open_positions(self) -> int:
         """Count open/closing positions (for risk limit checks)."""
-        row = self.conn.execute(
-            "SELECT COUNT(*) as cnt FROM positions WHERE status IN ('open', 'closing')"
-        ).fetchone()
+        with self.read() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) as cnt FROM positions WHERE status IN ('open', 'closing')"
+            ).fetchone()
         return row["cnt"] if row else 0
 
     # ─── Daily P&L ────────────────────────────────────────────────
@@ -441,22 +635,23 @@ class Database:
                VALUES (?, ?)""",
             (date, starting_balance),
         )
-        self._commit()
 
     def get_daily_pnl(self, date: str) -> dict[str, Any] | None:
         """Get P&L for a specific date."""
-        row = self.conn.execute("SELECT * FROM daily_pnl WHERE date = ?", (date,)).fetchone()
+        with self.read() as conn:
+            row = conn.execute("SELECT * FROM daily_pnl WHERE date = ?", (date,)).fetchone()
         return dict(row) if row else None
 
     def get_today_realized_pnl(self) -> float:
         """Get today's realized P&L."""
         today = datetime.now(UTC).strftime("%Y-%m-%d")
-        row = self.conn.execute(
-            """SELECT COALESCE(SUM(realized_pnl), 0) as total
-               FROM positions WHERE status = 'closed'
-               AND closed_at >= ?""",
-            (today,),
-        ).fetchone()
+        with self.read() as conn:
+            row = conn.execute(
+                """SELECT COALESCE(SUM(realized_pnl), 0) as total
+                   FROM positions WHERE status = 'closed'
+                   AND closed_at >= ?""",
+                (today,),
+            ).fetchone()
         return float(row["total"]) if row else 0.0
 
     # ─── Strategy State ───────────────────────────────────────────
@@ -466,16 +661,16 @@ class Database:
         self.conn.execute(
             """INSERT OR REPLACE INTO strategy_state (strategy, state, updated_at)
                VALUES (?, ?, ?)""",
-            (strategy, json.dumps(state), _utcnow()),
+            (strategy, serialization.dumps(state), _utcnow()),
         )
-        self._commit()
 
     def load_strategy_state(self, strategy: str) -> dict[str, Any] | None:
         """Load strategy state from last run."""
-        row = self.conn.execute(
-            "SELECT state FROM strategy_state WHERE strategy = ?", (strategy,)
-        ).fetchone()
-        return json.loads(row["state"]) if row else None
+        with self.read() as conn:
+            row = conn.execute(
+                "SELECT state FROM strategy_state WHERE strategy = ?", (strategy,)
+            ).fetchone()
+        return serialization.loads(row["state"]) if row else None
 
     # ─── Whale Positions (Copy Trading) ───────────────────────────
 
@@ -494,14 +689,34 @@ class Database:
                VALUES (?, ?, ?, ?, ?, ?)""",
             (wallet_address, market_id, token_id, size, avg_price, _utcnow()),
         )
-        self._commit()
+
+    def upsert_whale_positions_bulk(
+        self,
+        wallet_address: str,
+        rows: list[tuple[str, str, float, float | None]],
+    ) -> None:
+        """Upsert many (market_id, token_id, size, avg_price) rows with a single commit."""
+        if not rows:
+            return
+        now = _utcnow()
+        with self.transaction():
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO whale_positions
+                   (wallet_address, market_id, token_id, size, avg_price, last_seen_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                [
+                    (wallet_address, market_id, token_id, size, avg_price, now)
+                    for market_id, token_id, size, avg_price in rows
+                ],
+            )
 
     def get_whale_positions(self, wallet_address: str) -> list[dict[str, Any]]:
         """Get stored positions for a whale wallet."""
-        rows = self.conn.execute(
-            "SELECT * FROM whale_positions WHERE wallet_address = ?",
-            (wallet_address,),
-        ).fetchall()
+        with self.read() as conn:
+            rows = conn.execute(
+                "SELECT * FROM whale_positions WHERE wallet_address = ?",
+                (wallet_address,),
+            ).fetchall()
         return [dict(row) for row in rows]
 
     def delete_whale_position(self, wallet_address: str, market_id: str, token_id: str) -> None:
@@ -511,11 +726,22 @@ class Database:
                WHERE wallet_address = ? AND market_id = ? AND token_id = ?""",
             (wallet_address, market_id, token_id),
         )
-        self._commit()
+
+    def delete_whale_positions_bulk(self, wallet_address: str, keys: list[tuple[str, str]]) -> None:
+        """Delete many (market_id, token_id) whale positions with a single commit."""
+        if not keys:
+            return
+        with self.transaction():
+            self.conn.executemany(
+                """DELETE FROM whale_positions
+                   WHERE wallet_address = ? AND market_id = ? AND token_id = ?""",
+                [(wallet_address, market_id, token_id) for market_id, token_id in keys],
+            )
 
     def get_all_whale_positions(self) -> list[dict[str, Any]]:
         """Get all stored whale positions across all wallets."""
-        rows = self.conn.execute("SELECT * FROM whale_positions").fetchall()
+        with self.read() as conn:
+            rows = conn.execute("SELECT * FROM whale_positions").fetchall()
         return [dict(row) for row in rows]
 
     # ─── Whale Copy Performance ───────────────────────────────────
@@ -523,31 +749,27 @@ class Database:
     def get_positions_by_wallet_source(self, wallet_address: str) -> list[dict[str, Any]]:
         """Get all positions opened due to copying a specific wallet.
 
-        M-03 FIX: Uses json_extract() instead of LIKE for reliable JSON queries.
+        M-03 FIX: Matches the json_extract()-generated source_wallet column
+        instead of LIKE on the metadata text.
         """
-        rows = self.conn.execute(
-            """SELECT * FROM positions
-               WHERE json_extract(metadata, '$.source_wallet') = ?
-               ORDER BY opened_at DESC""",
-            (wallet_address,),
-        ).fetchall()
+        with self.read() as conn:
+            rows = conn.execute(
+                """SELECT * FROM positions
+                   WHERE source_wallet = ?
+                   ORDER BY opened_at DESC""",
+                (wallet_address,),
+            ).fetchall()
         return [dict(row) for row in rows]
 
     def get_closed_positions(
         self, strategy: str | None = None, limit: int = 500
     ) -> list[dict[str, Any]]:
         """Get closed positions, optionally filtered by strategy."""
-        query = "SELECT * FROM positions WHERE status = 'closed'"
-        params: list[Any] = []
-
-        if strategy:
-            query += " AND strategy = ?"
-            params.append(strategy)
-
-        query += " ORDER BY closed_at DESC LIMIT ?"
-        params.append(limit)
-
-        rows = self.conn.execute(query, params).fetchall()
+        with self.read() as conn:
+            if strategy:
+                rows = conn.execute(_SQL_CLOSED_POSITIONS_BY_STRATEGY, (strategy, limit)).fetchall()
+            else:
+                rows = conn.execute(_SQL_CLOSED_POSITIONS_ALL, (limit,)).fetchall()
         return [dict(row) for row in rows]
 
     def update_daily_pnl_end_of_day(
@@ -578,7 +800,6 @@ class Database:
                 date_str,
             ),
         )
-        self._commit()
 
     # ─── Bot Metadata (key-value store, H-15) ─────────────────────
 
@@ -592,12 +813,12 @@ class Database:
                updated_at = excluded.updated_at""",
             (key, value, now),
         )
-        self._commit()
 
     def get_metadata(self, key: str) -> str | None:
         """Get a metadata value by key, or None if not found."""
-        row = self.conn.execute(
-            "SELECT value FROM bot_metadata WHERE key = ?",
-            (key,),
-        ).fetchone()
+        with self.read() as conn:
+            row = conn.execute(
+                "SELECT value FROM bot_metadata WHERE key = ?",
+                (key,),
+            ).fetchone()
         return row["value"] if row else None
@@ -0,0 +1,55 @@
+"""
+Small on-disk cache for API responses that should survive a restart.
+
+Entries are raw response bytes, one file per key, and expire by file age.
+Writes go through a temp file and os.replace so a crash never leaves a
+half-written entry behind.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class FileCache:
+    """Byte blobs keyed by string, stored under `directory` for `ttl` seconds."""
+
+    def __init__(self, directory: Path, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> bytes | None:
+        """Cached bytes for `key`, or None if missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """Store `data` for `key`. Failures are logged, never raised."""
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("file_cache_write_failed", path=str(path), error=str(e))
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,75 @@
+"""
+Process-wide HTTP client for the Gamma and Data APIs.
+
+Every PolymarketClient in the process shares one connection pool, so warm
+keep-alive (and HTTP/2) connections are reused instead of each client paying
+its own TCP+TLS handshakes. Call shutdown_shared_client() once at exit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+
+import httpx
+import structlog
+
+from .config import Settings
+
+logger = structlog.get_logger()
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_shared: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _build_client(settings: Settings) -> httpx.AsyncClient:
+    # Gamma/Data calls all hit the same two hosts: keep connections warm and
+    # multiplex over HTTP/2 when available to skip repeated TCP+TLS handshakes.
+    # httpx advertises br/zstd in Accept-Encoding itself when their decoders are installed.
+    # The transport retries failed connects itself; PolymarketClient._get() handles 429/5xx.
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_keepalive_connections=settings.http_max_keepalive,
+            max_connections=settings.http_max_connections,
+            keepalive_expiry=30.0,
+        ),
+        retries=3,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        headers={"Accept": "application/json"},
+    )
+
+
+def get_shared_client(settings: Settings) -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use.
+
+    Pool limits come from the first caller's settings. A client left over
+    from another event loop (or already closed) is replaced, since its
+    connections can't be used from this loop.
+    """
+    global _shared, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared is None or _shared.is_closed or _shared_loop is not loop:
+        _shared = _build_client(settings)
+        _shared_loop = loop
+        logger.info(
+            "http_client_initialized",
+            http2=HTTP2_AVAILABLE,
+            event_loop=type(loop).__module__,
+        )
+    return _shared
+
+
+async def shutdown_shared_client() -> None:
+    """Close the shared client's connections. Safe to call more than once."""
+    global _shared, _shared_loop
+    client, _shared, _shared_loop = _shared, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("http_client_closed")
@@ -2,6 +2,7 @@
 Token bucket rate limiter for Polymarket API.
 
 Enforces 60 orders/minute with exponential backoff on rate limit errors.
+RateLimiterGroup keeps a separate limiter per route group (orders, reads).
 
 Addresses: CORE-07
 Audit fixes: H-16, H-17
@@ -10,8 +11,11 @@ Audit fixes: H-16, H-17
 from __future__ import annotations
 
 import asyncio
+import math
+import random
 import time
-from collections import deque
+from array import array
+from bisect import bisect_left
 
 import structlog
 
@@ -20,16 +24,27 @@ logger = structlog.get_logger()
 # H-17: Number of consecutive successes required to reset the error counter
 _CONSECUTIVE_SUCCESS_THRESHOLD = 3
 
+# 429 backoff: exponential cap (seconds) and the minimum wait after any 429
+_MAX_BACKOFF_SECONDS = 60.0
+_MIN_BACKOFF_SECONDS = 0.25
+# Most jitter added on top of a server-supplied Retry-After
+_MAX_RETRY_AFTER_JITTER = 5.0
+
 
 class RateLimiter:
     """Token bucket rate limiter.
 
     Polymarket CLOB API allows 60 orders per minute.
     This limiter tracks request timestamps and blocks when the limit is approached.
+    The timestamps live in a fixed ring of max_requests entries: the slot about
+    to be reused holds the oldest grant, so checking the window is one lookup.
 
     Audit fixes:
     - H-16: Backoff sleep released from lock to avoid blocking all coroutines.
     - H-17: Error counter only resets after N consecutive successes.
+
+    Callers waiting for a window slot queue on the lock in arrival order;
+    only the head sleeps, and exactly until its slot frees up.
     """
 
     def __init__(self, max_requests: int = 55, window_seconds: float = 60.0):
@@ -41,23 +56,24 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._timestamps: deque[float] = deque()
+        # Grant times, oldest at _next (never-used slots are -inf, i.e. expired).
+        # Unboxed C doubles: storing a grant doesn't allocate a float object.
+        self._slots = array("d", [-math.inf]) * max_requests
+        self._next = 0
         self._lock = asyncio.Lock()
         self._backoff_until: float = 0.0
         self._consecutive_rate_limits: int = 0
         self._consecutive_successes: int = 0  # H-17
 
-    def _prune_old(self) -> None:
-        """Remove timestamps older than the window."""
-        cutoff = time.monotonic() - self.window_seconds
-        while self._timestamps and self._timestamps[0] < cutoff:
-            self._timestamps.popleft()
-
     @property
     def current_usage(self) -> int:
         """Number of requests in the current window."""
-        self._prune_old()
-        return len(self._timestamps)
+        # The ring is two ascending runs, [_next:] (older) then [:_next], so the
+        # expired grants are found by bisecting each run instead of a full scan
+        cutoff = time.monotonic() - self.window_seconds
+        slots, head = self._slots, self._next
+        expired = bisect_left(slots, cutoff, head) - head + bisect_left(slots, cutoff, 0, head)
+        return self.max_requests - expired
 
     @property
     def remaining(self) -> int:
@@ -67,49 +83,73 @@ class RateLimiter:
     async def acquire(self) -> None:
         """Wait until a request slot is available, then acquire it.
 
-        H-16: Backoff sleep and window-wait sleep happen OUTSIDE the lock
-        to avoid blocking all other coroutines.
+        H-16: The backoff sleep happens OUTSIDE the lock so it never holds up
+        other coroutines. The window wait happens under it on purpose (as in
+        TokenBucket): nobody else could get a slot meanwhile anyway, and the
+        lock hands off to one waiter at a time instead of every waiter
+        waking to poll the window.
         """
-        # Phase 1: Wait for backoff outside the lock (H-16)
-        now = time.monotonic()
-        if now < self._backoff_until:
-            wait = self._backoff_until - now
-            logger.warning("rate_limit_backoff", wait_seconds=round(wait, 1))
-            await asyncio.sleep(wait)
-
-        # Phase 2: Acquire slot — loop until we get one
-        while True:
-            sleep_time = 0.0
-            async with self._lock:
-                self._prune_old()
-                if len(self._timestamps) < self.max_requests:
-                    # Slot available — claim it and return
-                    self._timestamps.append(time.monotonic())
-                    return
-
-                # No slot — calculate how long to wait for the oldest to expire
-                sleep_time = self._timestamps[0] + self.window_seconds - time.monotonic()
-
-            # H-16: Sleep OUTSIDE the lock so other coroutines can proceed
-            if sleep_time > 0:
+        # Uncontended fast path: no backoff, nobody queued on the lock and the
+        # oldest slot has expired. No await between check and claim, so this
+        # can't race another coroutine.
+        if not self._backoff_until and not self._lock.locked():
+            now = time.monotonic()
+            if self._slots[self._next] + self.window_seconds <= now:
+                self._slots[self._next] = now
+                self._next = (self._next + 1) % self.max_requests
+                return
+
+        # Phase 1: Wait for backoff outside the lock (H-16). _backoff_until is
+        # 0.0 outside a backoff, so the common path skips the clock read.
+        if self._backoff_until:
+            now = time.monotonic()
+            if now < self._backoff_until:
+                wait = self._backoff_until - now
+                logger.warning("rate_limit_backoff", wait_seconds=round(wait, 1))
+                await asyncio.sleep(wait)
+            else:
+                self._backoff_until = 0.0
+
+        # Phase 2: Claim a slot, sleeping until the oldest one expires if full
+        async with self._lock:
+            while True:
+                # The slot about to be reused holds the oldest grant
+                wait = self._slots[self._next] + self.window_seconds - time.monotonic()
+                if wait <= 0:
+                    break
                 logger.info(
                     "rate_limit_wait",
-                    wait_seconds=round(sleep_time, 1),
-                    current=len(self._timestamps),
+                    wait_seconds=round(wait, 1),
                     max=self.max_requests,
                 )
-                await asyncio.sleep(sleep_time + 0.1)
-
-    def record_rate_limit(self) -> None:
-        """Record a 429 rate limit response and apply exponential backoff."""
+                await asyncio.sleep(wait)
+            self._slots[self._next] = time.monotonic()
+            self._next = (self._next + 1) % self.max_requests
+
+    def record_rate_limit(self, retry_after: float | None = None) -> None:
+        """Record a 429 rate limit response and back off.
+
+        When the server sent a Retry-After, wait that long plus up to
+        min(retry_after, 5s) of jitter: it knows when its window rolls over.
+        Otherwise back off exponentially with "full jitter", drawing the wait
+        uniformly from [0, cap] so callers that hit the limit together don't
+        all retry at the same instant.
+        """
         self._consecutive_rate_limits += 1
         self._consecutive_successes = 0  # H-17: reset success streak
-        backoff = min(2**self._consecutive_rate_limits, 60)  # Max 60s backoff
+        if retry_after is not None:
+            cap = retry_after
+            backoff = retry_after + random.uniform(0.0, min(retry_after, _MAX_RETRY_AFTER_JITTER))
+        else:
+            cap = min(2.0**self._consecutive_rate_limits, _MAX_BACKOFF_SECONDS)
+            backoff = max(_MIN_BACKOFF_SECONDS, random.uniform(0.0, cap))
         self._backoff_until = time.monotonic() + backoff
         logger.warning(
             "rate_limit_hit",
             consecutive=self._consecutive_rate_limits,
-            backoff_seconds=backoff,
+            backoff_seconds=round(backoff, 2),
+            cap_seconds=cap,
+            retry_after=retry_after,
         )
 
     def record_success(self) -> None:
@@ -128,3 +168,77 @@ class RateLimiter:
                 )
             self._consecutive_rate_limits = 0
             self._consecutive_successes = 0
+
+
+class RateLimiterGroup:
+    """Independent RateLimiters keyed by route group.
+
+    Polymarket meters order submission separately from reads, so each group
+    gets its own window and lock: polling markets never spends (or waits
+    behind) the order budget.
+    """
+
+    def __init__(self, limits: dict[str, tuple[int, float]] | None = None):
+        """Initialize one limiter per group.
+
+        Args:
+            limits: {tag: (max_requests, window_seconds)}; defaults to
+                55 orders and 300 reads per minute
+        """
+        if limits is None:
+            limits = {"orders": (55, 60.0), "reads": (300, 60.0)}
+        self._buckets = {
+            tag: RateLimiter(max_requests, window_seconds)
+            for tag, (max_requests, window_seconds) in limits.items()
+        }
+
+    def __getitem__(self, tag: str) -> RateLimiter:
+        return self._buckets[tag]
+
+    async def acquire(self, tag: str) -> None:
+        """Acquire a slot from the `tag` group's limiter."""
+        await self._buckets[tag].acquire()
+
+
+class TokenBucket:
+    """Continuously refilling token bucket for smoothing bursts.
+
+    Unlike RateLimiter's per-window budget, this paces calls to `rate` per
+    second while allowing short bursts of up to `capacity`. A rate of 0
+    disables throttling.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, n: float = 1) -> None:
+        """Wait until `n` tokens are available, then take them.
+
+        The wait happens under the lock on purpose: waiters are served in
+        arrival order and each one only sleeps for its own deficit.
+        """
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            if self._tokens < n:
+                wait = (n - self._tokens) / self.rate
+                logger.debug("token_bucket_wait", wait_seconds=round(wait, 3))
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens = max(0.0, self._tokens - n)
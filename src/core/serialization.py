@@ -0,0 +1,41 @@
+"""
+JSON encoding helpers.
+
+Uses orjson when it is installed (the `speedups` extra) and falls back to the
+stdlib json module otherwise, so behaviour is identical either way.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document from bytes or str.
+
+    Raises ValueError (json.JSONDecodeError) on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Encode `obj` as compact JSON text.
+
+    `default` is called for objects the encoder can't handle, as with json.dumps.
+    Values orjson rejects (e.g. ints wider than 64 bits) go through the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default, separators=(",", ":"))
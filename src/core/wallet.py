@@ -7,11 +7,19 @@ Prevents: Pitfall 2 (proxy wallet confusion)
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import time
+from collections.abc import Awaitable
+from functools import lru_cache
+from typing import Any, cast
 
+import requests
 import structlog
 from eth_account import Account
-from web3 import Web3
+from eth_typing import ChecksumAddress, HexAddress, HexStr
+from requests.adapters import HTTPAdapter
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from web3.types import TxParams
 
 from .config import Settings
 
@@ -19,18 +27,68 @@ logger = structlog.get_logger()
 
 # Native USDC contract on Polygon (NOT bridged USDC.e)
 # C-04 FIX: Was using bridged USDC.e (0x2791Bca1f...) which returns wrong balances
+# Stored EIP-55 checksummed, so it can be passed to web3 as-is
 USDC_ADDRESS = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
 
-# Minimal ERC20 ABI for balanceOf
-USDC_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function",
-    }
-]
+# USDC has 6 decimal places on Polygon; raw balances are integer base units
+USDC_DECIMALS = 6
+_USDC_SCALE: int = 10**USDC_DECIMALS
+
+# Kept-alive connections to the RPC host, shared by every wallet in the process;
+# web3 retries failed requests itself
+_RPC_POOL_CONNECTIONS = 4
+_RPC_POOL_MAXSIZE = 16
+
+# ERC20 balanceOf(address) selector: keccak256("balanceOf(address)")[:4]
+_BALANCE_OF_SELECTOR = "0x70a08231"
+
+# Process-wide sync RPC clients (and their pooled sessions) by RPC URL
+_rpc_clients: dict[str, tuple[Web3, requests.Session]] = {}
+
+
+@lru_cache(maxsize=4096)
+def checksum_address(address: str) -> ChecksumAddress:
+    """EIP-55 checksum an address, memoized.
+
+    Checksumming keccak-hashes the address on every call; the set of addresses
+    we touch (funder, tracked whales) is small and fixed.
+    """
+    return Web3.to_checksum_address(address)
+
+
+def get_rpc_client(rpc_url: str) -> Web3:
+    """Return the process-wide Web3 client for `rpc_url`, creating it on first use.
+
+    Every WalletManager pointed at the same node shares one keep-alive
+    connection pool instead of each paying its own TCP+TLS handshakes.
+    Call close_rpc_clients() once at exit.
+    """
+    entry = _rpc_clients.get(rpc_url)
+    if entry is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_RPC_POOL_CONNECTIONS,
+            pool_maxsize=_RPC_POOL_MAXSIZE,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # M-23 FIX: Add connection timeout for web3 RPC calls
+        w3 = Web3(
+            Web3.HTTPProvider(
+                rpc_url,
+                request_kwargs={"timeout": 30},
+                session=session,
+            )
+        )
+        entry = _rpc_clients[rpc_url] = (w3, session)
+    return entry[0]
+
+
+def close_rpc_clients() -> None:
+    """Close every shared RPC session. Safe to call more than once."""
+    while _rpc_clients:
+        _, (_, session) = _rpc_clients.popitem()
+        session.close()
 
 
 class WalletManager:
@@ -43,18 +101,24 @@ class WalletManager:
     def __init__(self, settings: Settings):
         self.settings = settings
         self._w3: Web3 | None = None
+        # Async client for balance checks made from the event loop
+        self._aw3: AsyncWeb3[AsyncHTTPProvider] | None = None
         self._account: Any = None
         self._funder_address: str = ""
+        self._funder_checksum = ChecksumAddress(HexAddress(HexStr("")))
+        # Virtual balance in paper mode, None when live. Trading mode is fixed
+        # once the wallet is initialized, so balance reads skip the settings
+        self._paper_balance: float | None = None
+        # eth_call params for balanceOf(funder), built once the funder is known
+        self._balance_of: TxParams | None = None
+        # Last async USDC read as (monotonic time, balance); the lock makes
+        # concurrent callers share one in-flight RPC
+        self._balance_cached: tuple[float, float] | None = None
+        self._balance_lock = asyncio.Lock()
 
     def initialize(self) -> None:
         """Initialize web3 connection and derive addresses."""
-        # M-23 FIX: Add connection timeout for web3 RPC calls
-        self._w3 = Web3(
-            Web3.HTTPProvider(
-                self.settings.polygon_rpc_url,
-                request_kwargs={"timeout": 30},
-            )
-        )
+        self._w3 = get_rpc_client(self.settings.polygon_rpc_url)
 
         if not self._w3.is_connected():
             logger.error("polygon_connection_failed", rpc_url=self.settings.polygon_rpc_url)
@@ -62,6 +126,18 @@ class WalletManager:
 
         logger.info("polygon_connected", rpc_url=self.settings.polygon_rpc_url)
 
+        if not self.settings.is_live:
+            self._paper_balance = float(self.settings.paper_balance_usd)
+
+        # The sync provider blocks the event loop for a full RPC round-trip;
+        # async callers go through this client instead
+        self._aw3 = AsyncWeb3(
+            AsyncHTTPProvider(
+                self.settings.polygon_rpc_url,
+                request_kwargs={"timeout": 30},
+            )
+        )
+
         # Derive account from private key
         pk = self.settings.wallet_private_key.get_secret_value()
         if pk:
@@ -73,6 +149,16 @@ class WalletManager:
             else:
                 self._funder_address = self._account.address
 
+            # The funder never changes, so neither does the calldata: encode it
+            # once rather than going through a Contract proxy per balance check
+            self._funder_checksum = checksum_address(self._funder_address)
+            self._balance_of = {
+                "to": ChecksumAddress(HexAddress(HexStr(USDC_ADDRESS))),
+                "data": HexStr(
+                    _BALANCE_OF_SELECTOR + self._funder_checksum[2:].lower().rjust(64, "0")
+                ),
+            }
+
             logger.info(
                 "wallet_initialized",
                 signing_address=self._account.address,
@@ -107,31 +193,82 @@ class WalletManager:
         In paper mode, returns the virtual paper balance.
         Addresses: CORE-03
         """
+        # Paper mode: return virtual balance
+        if self._paper_balance is not None:
+            return self._paper_balance
+        return self.get_usdc_balance_raw() / _USDC_SCALE
+
+    def get_usdc_balance_raw(self) -> int:
+        """Get the funder's USDC balance in integer base units (micro-USDC).
+
+        Exact, unlike the float from get_usdc_balance(); use it where balances
+        are compared or summed. In paper mode, the virtual balance is scaled
+        to base units.
+        """
+        if self._paper_balance is not None:
+            return round(self._paper_balance * _USDC_SCALE)
+
         if self._w3 is None:
             raise RuntimeError("Web3 not initialized. Call initialize() first.")
 
-        # Paper mode: return virtual balance
-        if not self.settings.is_live:
-            paper_balance = getattr(self.settings, "paper_balance_usd", 100.0)
-            logger.debug("paper_balance_used", balance=paper_balance)
-            return float(paper_balance)
-
         if not self.is_initialized:
             logger.debug("usdc_balance_zero", reason="wallet not initialized (no private key)")
-            return 0.0
+            return 0
 
+        assert self._balance_of is not None
         try:
-            usdc_contract = self._w3.eth.contract(
-                address=Web3.to_checksum_address(USDC_ADDRESS),
-                abi=USDC_ABI,
+            raw_balance = int.from_bytes(self._w3.eth.call(self._balance_of), "big")
+            logger.info(
+                "usdc_balance_checked",
+                balance=raw_balance / _USDC_SCALE,
+                address=self.funder_address,
             )
-            raw_balance = usdc_contract.functions.balanceOf(
-                Web3.to_checksum_address(self.funder_address)
-            ).call()
+            return raw_balance
+
+        except Exception as e:
+            logger.error("usdc_balance_check_failed", error=str(e))
+            raise
+
+    async def aget_usdc_balance(self) -> float:
+        """Async get_usdc_balance(): awaits the RPC instead of blocking the loop.
+
+        Same paper-mode and uninitialized-wallet behaviour as the sync version.
+        Calls within balance_cache_ttl_seconds of a read share its result, and
+        concurrent callers wait on one in-flight RPC instead of each sending
+        their own.
+        """
+        if self._paper_balance is not None:
+            return self._paper_balance
 
-            # USDC has 6 decimal places on Polygon
-            balance = raw_balance / 1e6
+        if self._aw3 is None:
+            raise RuntimeError("Web3 not initialized. Call initialize() first.")
 
+        if not self.is_initialized:
+            logger.debug("usdc_balance_zero", reason="wallet not initialized (no private key)")
+            return 0.0
+
+        ttl = self.settings.balance_cache_ttl_seconds
+        if ttl <= 0:
+            return await self._fetch_usdc_balance()
+
+        hit = self._balance_cached
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+        async with self._balance_lock:
+            # Another caller may have refreshed the balance while we waited
+            hit = self._balance_cached
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+            balance = await self._fetch_usdc_balance()
+            self._balance_cached = (time.monotonic(), balance)
+            return balance
+
+    async def _fetch_usdc_balance(self) -> float:
+        assert self._aw3 is not None and self._balance_of is not None
+        try:
+            raw_balance = await self._aw3.eth.call(self._balance_of)
+            balance = int.from_bytes(raw_balance, "big") / _USDC_SCALE
             logger.info("usdc_balance_checked", balance=balance, address=self.funder_address)
             return float(balance)
 
@@ -151,7 +288,7 @@ class WalletManager:
             return 0.0
 
         try:
-            raw_balance = self._w3.eth.get_balance(Web3.to_checksum_address(self.funder_address))
+            raw_balance = self._w3.eth.get_balance(self._funder_checksum)
             balance = float(self._w3.from_wei(raw_balance, "ether"))
             logger.info("matic_balance_checked", balance=balance)
             return balance
@@ -160,32 +297,104 @@ class WalletManager:
             logger.error("matic_balance_check_failed", error=str(e))
             raise
 
+    async def aget_matic_balance(self) -> float:
+        """Async get_matic_balance(). Returns 0.0 if the wallet is not initialized."""
+        if self._aw3 is None:
+            raise RuntimeError("Web3 not initialized. Call initialize() first.")
+
+        if not self.is_initialized:
+            return 0.0
+
+        try:
+            raw_balance = await self._aw3.eth.get_balance(self._funder_checksum)
+            balance = float(self._aw3.from_wei(raw_balance, "ether"))
+            logger.info("matic_balance_checked", balance=balance)
+            return balance
+
+        except Exception as e:
+            logger.error("matic_balance_check_failed", error=str(e))
+            raise
+
+    async def aclose(self) -> None:
+        """Close the async provider's HTTP session. Safe to call more than once.
+
+        The sync client is shared process-wide; see close_rpc_clients().
+        """
+        if self._aw3 is not None:
+            await self._aw3.provider.disconnect()
+
+    def _get_balances(self) -> tuple[float, float]:
+        """USDC and MATIC balances, fetched in one JSON-RPC batch when live.
+
+        Falls back to the two separate calls in paper mode (USDC is virtual
+        there) or if the provider rejects batched requests.
+        """
+        assert self._w3 is not None
+        if self._paper_balance is None and self._balance_of is not None:
+            try:
+                with self._w3.batch_requests() as batch:
+                    batch.add(self._w3.eth.call(self._balance_of))
+                    batch.add(self._w3.eth.get_balance(self._funder_checksum))
+                    raw_usdc, raw_matic = batch.execute()
+                usdc = int.from_bytes(cast(bytes, raw_usdc), "big") / _USDC_SCALE
+                matic = float(self._w3.from_wei(cast(int, raw_matic), "ether"))
+                logger.info("wallet_balances_checked", usdc=usdc, matic=matic)
+                return usdc, matic
+            except Exception as e:
+                logger.debug("rpc_batch_failed", error=str(e))
+        return self.get_usdc_balance(), self.get_matic_balance()
+
     def verify_connection(self) -> dict[str, bool | str | float]:
         """Verify wallet setup: connection, balances, address derivation.
 
         Returns a status dict for health checks.
         """
-        status: dict[str, bool | str | float] = {
-            "connected": False,
-            "signing_address": "",
-            "funder_address": "",
-            "usdc_balance": 0.0,
-            "matic_balance": 0.0,
-        }
+        status = self._base_status()
 
         try:
             if self._w3 and self._w3.is_connected():
                 status["connected"] = True
 
-            if self._account:
-                status["signing_address"] = self._account.address
-                status["funder_address"] = self._funder_address
-
             if status["connected"] and self._funder_address:
-                status["usdc_balance"] = self.get_usdc_balance()
-                status["matic_balance"] = self.get_matic_balance()
+                status["usdc_balance"], status["matic_balance"] = self._get_balances()
 
         except Exception as e:
             logger.error("wallet_verification_failed", error=str(e))
 
         return status
+
+    async def averify_connection(self) -> dict[str, bool | str | float]:
+        """Async verify_connection().
+
+        The connection probe and both balance reads run concurrently on the
+        async provider instead of blocking the event loop one after another.
+        """
+        status = self._base_status()
+        if self._aw3 is None:
+            return status
+
+        checks: list[Awaitable[Any]] = [self._aw3.is_connected()]
+        if self._funder_address:
+            checks += [self.aget_usdc_balance(), self.aget_matic_balance()]
+        connected, *balances = await asyncio.gather(*checks, return_exceptions=True)
+
+        status["connected"] = connected is True
+        for key, value in zip(("usdc_balance", "matic_balance"), balances, strict=False):
+            if isinstance(value, BaseException):
+                logger.error("wallet_verification_failed", error=str(value))
+            elif status["connected"]:
+                status[key] = value
+        return status
+
+    def _base_status(self) -> dict[str, bool | str | float]:
+        status: dict[str, bool | str | float] = {
+            "connected": False,
+            "signing_address": "",
+            "funder_address": "",
+            "usdc_balance": 0.0,
+            "matic_balance": 0.0,
+        }
+        if self._account:
+            status["signing_address"] = self._account.address
+            status["funder_address"] = self._funder_address
+        return status
@@ -13,7 +13,6 @@ Audit fixes applied:
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from collections.abc import Callable, Coroutine
 from typing import Any
@@ -21,6 +20,7 @@ from typing import Any
 import structlog
 import websockets
 
+from . import serialization
 from .config import Settings
 
 logger = structlog.get_logger()
@@ -41,7 +41,7 @@ class WebSocketManager:
     Features:
     - Auto-reconnect with exponential backoff
     - Subscribe/unsubscribe to specific token price feeds
-    - Distributes price updates to registered callbacks
+    - Distributes price updates to registered callbacks, coalesced per token
     - Stale data detection with forced reconnect (M-14)
     - Clear stale references on disconnect (H-21)
     - Auth headers when API key available (H-20)
@@ -52,42 +52,61 @@ class WebSocketManager:
         self._settings = settings
         self._ws: Any = None
         self._subscribed_tokens: set[str] = set()
-        self._callbacks: list[PriceCallback] = []
+        # Immutable, so dispatch can iterate it while a callback registers another
+        self._callbacks: tuple[PriceCallback, ...] = ()
         self._last_message_time: float = 0
         self._running: bool = False
         self._reconnect_delay: float = 1.0
         self._max_reconnect_delay: float = 60.0
         self._latest_prices: dict[str, float] = {}
+        # token_id -> (best_bid, best_ask, monotonic receive time) from book snapshots
+        self._quotes: dict[str, tuple[float | None, float | None, float]] = {}
         self._heartbeat_task: asyncio.Task[None] | None = None
+        # Latest (price, timestamp) per token not yet passed to callbacks. The
+        # receive loop only overwrites entries, so a burst of ticks for one
+        # token reaches the callbacks once, with the newest price.
+        self._pending: dict[str, tuple[float, float]] = {}
+        self._pending_event = asyncio.Event()
+        self._dispatch_task: asyncio.Task[None] | None = None
 
     def register_callback(self, callback: PriceCallback) -> None:
         """Register a callback for price updates."""
-        self._callbacks.append(callback)
+        self._callbacks += (callback,)
 
     def subscribe(self, token_ids: list[str]) -> None:
         """Add token IDs to subscription list.
 
         If already connected, sends subscription message immediately.
         """
-        new_tokens = set(token_ids) - self._subscribed_tokens
-        self._subscribed_tokens.update(token_ids)
+        # One pass, no temporary sets: most calls re-send tokens we already track
+        subscribed = self._subscribed_tokens
+        new_tokens: list[str] = []
+        for tid in token_ids:
+            if tid not in subscribed:
+                subscribed.add(tid)
+                new_tokens.append(tid)
         logger.info("ws_tokens_subscribed", count=len(token_ids), new=len(new_tokens))
 
         # If already connected, send subscribe for the new tokens immediately
         if new_tokens and self.is_connected:
-            asyncio.ensure_future(self._send_subscribe(list(new_tokens)))
+            asyncio.ensure_future(self._send_subscribe(new_tokens))
 
     def unsubscribe(self, token_ids: list[str]) -> None:
         """Remove token IDs from subscription list.
 
         If already connected, sends unsubscribe message immediately.
         """
-        self._subscribed_tokens -= set(token_ids)
-        # Remove stale prices for unsubscribed tokens
+        subscribed = self._subscribed_tokens
+        removed: list[str] = []
         for tid in token_ids:
+            if tid in subscribed:
+                subscribed.discard(tid)
+                removed.append(tid)
+            # Remove stale prices for unsubscribed tokens
             self._latest_prices.pop(tid, None)
-        if self.is_connected:
-            asyncio.ensure_future(self._send_unsubscribe(token_ids))
+            self._quotes.pop(tid, None)
+        if removed and self.is_connected:
+            asyncio.ensure_future(self._send_unsubscribe(removed))
 
     def get_latest_price(self, token_id: str) -> float | None:
         """Get last known price for a token.
@@ -98,6 +117,13 @@ class WebSocketManager:
             return None
         return self._latest_prices.get(token_id)
 
+    def get_quote(self, token_id: str, max_age: float) -> tuple[float | None, float | None] | None:
+        """Best (bid, ask) from the last book snapshot, if newer than `max_age` seconds."""
+        quote = self._quotes.get(token_id)
+        if quote is None or time.monotonic() - quote[2] > max_age:
+            return None
+        return quote[0], quote[1]
+
     @property
     def is_connected(self) -> bool:
         return self._ws is not None and not self._ws.closed
@@ -116,16 +142,22 @@ class WebSocketManager:
     async def start(self) -> None:
         """Start the WebSocket connection loop."""
         self._running = True
-        while self._running:
-            try:
-                await self._connect_and_listen()
-            except Exception as e:
-                if not self._running:
-                    break
-                logger.error("ws_connection_error", error=str(e))
-                # H-21 FIX: Clear stale reference on disconnect
-                self._clear_connection()
-                await self._backoff()
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        try:
+            while self._running:
+                try:
+                    await self._connect_and_listen()
+                except Exception as e:
+                    if not self._running:
+                        break
+                    logger.error("ws_connection_error", error=str(e))
+                    # H-21 FIX: Clear stale reference on disconnect
+                    self._clear_connection()
+                    await self._backoff()
+        finally:
+            if self._dispatch_task and not self._dispatch_task.done():
+                self._dispatch_task.cancel()
+            self._dispatch_task = None
 
     async def stop(self) -> None:
         """Stop the WebSocket connection."""
@@ -144,6 +176,7 @@ class WebSocketManager:
         """H-21 FIX: Clear stale WebSocket reference and mark data as stale."""
         self._ws = None
         self._last_message_time = 0  # Mark as stale
+        self._quotes.clear()
 
     async def _connect_and_listen(self) -> None:
         """Connect to WebSocket and process messages."""
@@ -176,10 +209,15 @@ class WebSocketManager:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_monitor())
 
             try:
-                # Listen for messages
-                async for message in ws:
+                # Listen for messages. Frames are taken as raw bytes: the JSON
+                # parser reads UTF-8 itself, so decoding to str first is wasted.
+                while True:
+                    try:
+                        message = await ws.recv(decode=False)
+                    except websockets.ConnectionClosedOK:
+                        break
                     self._last_message_time = time.monotonic()
-                    await self._handle_message(message)
+                    self._handle_message(message)
             finally:
                 # Cancel heartbeat on disconnect
                 if self._heartbeat_task and not self._heartbeat_task.done():
@@ -241,7 +279,7 @@ class WebSocketManager:
             "assets_ids": token_ids,
             "channels": ["book"],
         }
-        await self._ws.send(json.dumps(msg))
+        await self._ws.send(serialization.dumps(msg))
         logger.info("ws_subscribed", token_count=len(token_ids))
 
     async def _send_unsubscribe(self, token_ids: list[str]) -> None:
@@ -254,15 +292,22 @@ class WebSocketManager:
             "assets_ids": token_ids,
             "channels": ["book"],
         }
-        await self._ws.send(json.dumps(msg))
+        await self._ws.send(serialization.dumps(msg))
         logger.info("ws_unsubscribed", token_count=len(token_ids))
 
-    async def _handle_message(self, raw_message: str | bytes) -> None:
-        """Parse and distribute a WebSocket message."""
+    def _handle_message(self, raw_message: str | bytes) -> None:
+        """Parse a WebSocket message and queue its price for the callbacks.
+
+        Never awaits, so a slow callback can't hold up the receive loop;
+        _dispatch_loop() delivers the queued prices.
+        """
         try:
-            data = json.loads(raw_message)
+            data = serialization.loads(raw_message)
             msg_type = data.get("type", "")
 
+            if "bids" in data or "asks" in data:
+                self._record_quote(data)
+
             if msg_type in ("book", "price_change"):
                 token_id = data.get("asset_id", data.get("token_id", ""))
                 price = data.get("price", data.get("best_bid", 0))
@@ -271,17 +316,51 @@ class WebSocketManager:
                     price_float = float(price)
                     timestamp = float(data.get("timestamp", time.time()))
                     self._latest_prices[token_id] = price_float
+                    self._pending[token_id] = (price_float, timestamp)
+                    self._pending_event.set()
 
-                    # Notify all callbacks
-                    for callback in self._callbacks:
-                        try:
-                            await callback(token_id, price_float, timestamp)
-                        except Exception as e:
-                            logger.error("ws_callback_error", error=str(e))
-
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (KeyError, TypeError, ValueError) as e:
             logger.debug("ws_message_parse_error", error=str(e))
 
+    async def _dispatch_loop(self) -> None:
+        """Deliver queued prices to the callbacks whenever new ones arrive."""
+        while True:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            await self._dispatch_pending()
+
+    async def _dispatch_pending(self) -> None:
+        """Run the callbacks once per token for every queued price."""
+        batch, self._pending = self._pending, {}
+        callbacks = self._callbacks
+        for token_id, (price, timestamp) in batch.items():
+            # Notify all callbacks concurrently; one failing doesn't stop the rest
+            results = await asyncio.gather(
+                *(callback(token_id, price, timestamp) for callback in callbacks),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("ws_callback_error", error=str(result))
+
+    def _record_quote(self, data: dict[str, Any]) -> None:
+        """Keep the best bid/ask from a book snapshot for PolymarketClient reads."""
+        token_id = data.get("asset_id", data.get("token_id", ""))
+        if not token_id:
+            return
+        try:
+            bids = [float(level["price"]) for level in data.get("bids") or ()]
+            asks = [float(level["price"]) for level in data.get("asks") or ()]
+        except (KeyError, TypeError, ValueError) as e:
+            # Keep the previous quote rather than one built from a partial book
+            logger.debug("ws_book_parse_error", token_id=token_id, error=str(e))
+            return
+        self._quotes[token_id] = (
+            max(bids) if bids else None,
+            min(asks) if asks else None,
+            time.monotonic(),
+        )
+
     async def _backoff(self) -> None:
         """Exponential backoff before reconnection."""
         logger.info("ws_reconnecting", delay=self._reconnect_delay)
@@ -7,6 +7,7 @@ Addresses: CORE-05 (orders), CORE-07 (rate limiting integration)
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -74,8 +75,11 @@ class OrderManager:
         self._risk_manager = risk_manager
         self._notifier = notifier
         self._paper_mode = paper_mode
-        # H-04 FIX: Bounded queue to prevent unbounded memory growth
-        self._signal_queue: asyncio.Queue[Signal] = asyncio.Queue(maxsize=MAX_SIGNAL_QUEUE_SIZE)
+        # H-04 FIX: Bounded queue to prevent unbounded memory growth.
+        # A plain deque plus a wake-up Event: submit never awaits, and the
+        # processor only waits on the Event when the queue is empty.
+        self._signal_queue: deque[Signal] = deque()
+        self._signal_event = asyncio.Event()
         self._running = False
 
     def set_risk_manager(self, risk_manager: RiskManager) -> None:
@@ -84,16 +88,20 @@ class OrderManager:
 
     async def submit_signal(self, signal: Signal) -> None:
         """Add a signal to the processing queue."""
-        try:
-            self._signal_queue.put_nowait(signal)
-        except asyncio.QueueFull:
+        if len(self._signal_queue) >= MAX_SIGNAL_QUEUE_SIZE:
             logger.warning(
                 "signal_queue_full",
                 strategy=signal.strategy,
                 dropped_side=signal.side,
-                queue_size=self._signal_queue.qsize(),
+                queue_size=len(self._signal_queue),
             )
             return
+        self._signal_queue.append(signal)
+        self._signal_event.set()
+
+        if not self._paper_mode:
+            # Fetch tick size / neg-risk / fee rate while the signal waits in the queue
+            self.client.prime_order_context(signal.token_id)
 
         logger.info(
             "signal_queued",
@@ -101,7 +109,7 @@ class OrderManager:
             side=signal.side,
             price=signal.price,
             size=signal.size,
-            queue_size=self._signal_queue.qsize(),
+            queue_size=len(self._signal_queue),
         )
 
     async def process_signals(self) -> None:
@@ -111,13 +119,13 @@ class OrderManager:
 
         while self._running:
             try:
-                # Wait for next signal with timeout (to check _running flag)
-                try:
-                    signal = await asyncio.wait_for(self._signal_queue.get(), timeout=1.0)
-                except TimeoutError:
+                if not self._signal_queue:
+                    # Sleep until submit_signal() or stop() sets the event
+                    self._signal_event.clear()
+                    await self._signal_event.wait()
                     continue
 
-                await self._execute_signal(signal)
+                await self._execute_signal(self._signal_queue.popleft())
 
             except Exception as e:
                 logger.error("signal_processing_error", error=str(e))
@@ -126,6 +134,7 @@ class OrderManager:
     async def stop(self) -> None:
         """Stop processing signals."""
         self._running = False
+        self._signal_event.set()  # Wake the processing loop so it sees the flag
         logger.info("order_manager_stopped")
 
     def _drain_signal_queue(self) -> int:
@@ -133,13 +142,8 @@ class OrderManager:
 
         C-10 FIX: Used by kill switch to prevent queued signals from executing.
         """
-        drained = 0
-        while not self._signal_queue.empty():
-            try:
-                self._signal_queue.get_nowait()
-                drained += 1
-            except asyncio.QueueEmpty:
-                break
+        drained = len(self._signal_queue)
+        self._signal_queue.clear()
         if drained > 0:
             logger.warning("signal_queue_drained", count=drained)
         return drained
@@ -466,4 +470,4 @@ class OrderManager:
 
     def get_pending_count(self) -> int:
         """Number of signals waiting to be processed."""
-        return self._signal_queue.qsize()
+        return len(self._signal_queue)
@@ -117,24 +117,23 @@ class PositionManager:
         Evaluates TP/SL/trailing for all positions matching this token.
         This is registered as a WebSocket callback.
         """
-        positions = self.db.get_open_positions()
-
-        for position in positions:
-            if position["token_id"] != token_id:
-                continue
-
-            pos_id = position["id"]
-
+        positions = [
+            position
+            for position in self.db.get_open_positions()
+            if position["token_id"] == token_id
             # C-08: Skip positions already being closed
-            if pos_id in self._closing_positions:
-                continue
-
+            and position["id"] not in self._closing_positions
             # Skip positions already in "closing" state (C-07)
-            if position.get("status") == "closing":
-                continue
+            and position.get("status") != "closing"
+        ]
+        if not positions:
+            return
 
-            # Update current price in DB
-            self.db.update_position_price(pos_id, price)
+        # Update current price in DB for every matching position in one commit
+        self.db.update_position_prices_bulk([(position["id"], price) for position in positions])
+
+        for position in positions:
+            pos_id = position["id"]
 
             # Calculate P&L percentage (M-15: uses per-share prices)
             entry_price = position["entry_price"]
@@ -125,8 +125,7 @@ class RiskManager:
         # H-14: Duplicate market check — prevent any duplicate positions on same market
         # Blocks both cross-strategy AND same-strategy duplicates.
         if not signal.metadata.get("is_exit", False):
-            open_positions = self.db.get_open_positions()
-            for p in open_positions:
+            for p in self.db.iter_open_positions():
                 if p["market_id"] == signal.market_id:
                     return (
                         False,
@@ -265,22 +264,19 @@ class RiskManager:
             usdc = 0.0
 
         # Add unrealized value from open positions
-        positions = self.db.get_open_positions()
-        position_value = sum(
-            p.get("current_price", p.get("entry_price", 0)) * p.get("size", 0) for p in positions
-        )
+        position_value = sum(p["current_price"] * p["size"] for p in self.db.iter_open_positions())
 
         return float(usdc + position_value)
 
     def _get_total_unrealized_pnl(self) -> float:
         """Sum unrealized P&L across all open positions (C-11)."""
-        positions = self.db.get_open_positions()
-        return float(sum(p.get("unrealized_pnl", 0.0) for p in positions))
+        return float(sum(p["unrealized_pnl"] for p in self.db.iter_open_positions()))
 
     def _get_strategy_exposure(self, strategy: str) -> float:
         """Get current capital deployed by a specific strategy."""
-        positions = self.db.get_open_positions(strategy=strategy)
-        return float(sum(p.get("entry_price", 0) * p.get("size", 0) for p in positions))
+        return float(
+            sum(p["entry_price"] * p["size"] for p in self.db.iter_open_positions(strategy))
+        )
 
     def _persist_kill_switch_state(self, active: bool) -> None:
         """Persist kill switch state to DB (H-15)."""
@@ -24,15 +24,22 @@ import asyncio
 import signal
 import sys
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
 import structlog
 
 from .core.client import PolymarketClient
-from .core.config import Settings, load_settings, load_strategy_config, load_wallet_config
+from .core.config import (
+    YAML_C_LOADER,
+    Settings,
+    load_settings,
+    load_strategy_config,
+    load_wallet_config,
+)
 from .core.db import Database
-from .core.rate_limiter import RateLimiter
-from .core.wallet import WalletManager
+from .core.http import shutdown_shared_client
+from .core.rate_limiter import RateLimiterGroup
+from .core.wallet import WalletManager, close_rpc_clients
 from .core.websocket import WebSocketManager
 from .execution.order_manager import OrderManager
 from .execution.position_manager import PositionManager
@@ -72,7 +79,10 @@ class TradingBot:
         self._wallet = WalletManager(settings)
         self._db = Database(settings)
         self._ws = WebSocketManager(settings)
-        self._rate_limiter = RateLimiter()
+        # Subscribed tokens are priced from pushed book snapshots when fresh
+        self._client.attach_quote_feed(self._ws)
+        # Orders and reads are metered separately, so reads never eat the order budget
+        self._rate_limiters = RateLimiterGroup()
 
         # Notifications
         self._notifier = TelegramNotifier(settings)
@@ -82,7 +92,7 @@ class TradingBot:
         self._order_manager = OrderManager(
             self._client,
             self._db,
-            self._rate_limiter,
+            self._rate_limiters["orders"],
             notifier=self._notifier,
             paper_mode=not settings.is_live,
         )
@@ -131,7 +141,7 @@ class TradingBot:
 
         # 3. Wallet
         self._wallet.initialize()
-        balance = self._wallet.get_usdc_balance()
+        balance = await self._wallet.aget_usdc_balance()
         logger.info("wallet_initialized", usdc_balance=balance)
 
         if balance < 1.0 and self._settings.is_live:
@@ -327,6 +337,11 @@ class TradingBot:
         resolution_task = asyncio.create_task(self._market_resolution_loop())
         tasks.append(resolution_task)
 
+        # Start periodic database maintenance
+        if self._settings.db_maintenance_interval_seconds > 0:
+            maintenance_task = asyncio.create_task(self._db_maintenance_loop())
+            tasks.append(maintenance_task)
+
         logger.info(
             "bot_started",
             strategies=[s.name for s in self._strategies],
@@ -389,8 +404,11 @@ class TradingBot:
         await self._health_server.stop()
         self._health_server.set_ready(False)
 
-        # 8. Close API client
+        # 8. Close API client and the shared HTTP pool
         await self._client.close()
+        await shutdown_shared_client()
+        await self._wallet.aclose()
+        close_rpc_clients()
 
         # 9. Close database last
         self._db.close()
@@ -488,6 +506,24 @@ class TradingBot:
             except TimeoutError:
                 continue
 
+    async def _db_maintenance_loop(self) -> None:
+        """Periodically refresh DB planner stats and keep the WAL file bounded."""
+        interval = self._settings.db_maintenance_interval_seconds
+        while not self._shutdown_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(),
+                    timeout=interval,
+                )
+                break  # Shutdown requested
+            except TimeoutError:
+                pass
+
+            try:
+                self._db.maintenance()
+            except Exception:
+                logger.exception("database_maintenance_error")
+
     async def _daily_pnl_summary_loop(self) -> None:
         """Send daily P&L summary via Telegram at UTC midnight."""
         from datetime import timedelta
@@ -521,18 +557,18 @@ class TradingBot:
             try:
                 # Get all open markets with positions
                 positions = self._db.get_open_positions()
-                market_ids = {p["market_id"] for p in positions}
+                market_ids = list({p["market_id"] for p in positions})
 
-                for market_id in market_ids:
-                    # M-05: Respect rate limiter for each API call
-                    await self._rate_limiter.acquire()
-                    # Check if market is resolved via API
-                    market = await self._client.get_market(market_id)
+                # M-05: Respect rate limiter for each API call
+                for _ in market_ids:
+                    await self._rate_limiters.acquire("reads")
+                # Check if markets are resolved via API, all lookups in flight together
+                markets = await self._client.get_markets_batch(market_ids)
+
+                for market_id, market in zip(market_ids, markets, strict=True):
                     if market and not market.active:
-                        # Market is no longer active — check raw data for resolution info
-                        outcome = market.raw.get(
-                            "resolution", market.raw.get("winning_outcome", "")
-                        )
+                        # Market is no longer active — check for resolution info
+                        outcome = market.resolution
                         if outcome:
                             logger.info(
                                 "market_resolved",
@@ -601,6 +637,15 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the bot's event loop, using uvloop when it is installed."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return asyncio.new_event_loop()
+    return cast(asyncio.AbstractEventLoop, uvloop.new_event_loop())
+
+
 def main() -> None:
     """CLI entry point for the trading bot."""
     args = parse_args()
@@ -637,11 +682,15 @@ def main() -> None:
     if settings.is_live:
         logger.warning("LIVE_TRADING_MODE — real money at risk")
 
+    if not YAML_C_LOADER:
+        # Config still loads, just through the slower pure-Python parser
+        logger.warning("yaml_c_loader_unavailable", hint="install PyYAML built with libyaml")
+
     # Create and run bot
     bot = TradingBot(settings)
 
     # Register signal handlers for graceful shutdown
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, bot.request_shutdown)
@@ -671,6 +720,7 @@ async def _print_status(bot: TradingBot) -> None:
     print(json.dumps(status, indent=2, default=str))
 
     await bot._client.close()
+    await shutdown_shared_client()
     bot._db.close()
 
 
@@ -709,6 +759,7 @@ async def _execute_kill_switch(bot: TradingBot) -> None:
 
     # Cleanup
     await bot._client.close()
+    await shutdown_shared_client()
     bot._db.close()
 
 
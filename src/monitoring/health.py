@@ -142,10 +142,10 @@ class HealthChecker:
                 message=f"Error: {e}",
             )
 
-    def check_wallet(self) -> ComponentHealth:
+    async def check_wallet(self) -> ComponentHealth:
         """Check wallet balance."""
         try:
-            balance = self._wallet.get_usdc_balance()
+            balance = await self._wallet.aget_usdc_balance()
             if balance < 1.0:
                 return ComponentHealth(
                     name="wallet",
@@ -189,10 +189,10 @@ class HealthChecker:
 
     async def get_system_health(self) -> SystemHealth:
         """Run all health checks and return aggregated result."""
-        # Run sync checks immediately, async check awaited
+        # Run sync checks immediately, async checks awaited
         components = [
             self.check_database(),
-            self.check_wallet(),
+            await self.check_wallet(),
             self.check_websocket(),
             await self.check_api(),
         ]
@@ -13,6 +13,34 @@ from pathlib import Path
 
 import structlog
 
+from ..core import serialization
+
+# Console output shortens these long hex IDs to this many characters; the
+# rotating file log keeps them whole so it stays queryable (CORE-09).
+_SHORT_ID_FIELDS = {
+    "token_id": 16,
+    "market_id": 16,
+    "condition_id": 16,
+    "wallet": 10,
+    "address": 10,
+}
+
+
+def shorten_ids(
+    _logger: object, _method: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    """Truncate long ID fields at render time instead of at every call site."""
+    for key, keep in _SHORT_ID_FIELDS.items():
+        value = event_dict.get(key)
+        if isinstance(value, str) and len(value) > keep + 3:
+            event_dict[key] = value[:keep] + "..."
+    return event_dict
+
+
+def _render_json(obj: object, **kwargs: object) -> str:
+    """JSONRenderer serializer backed by orjson when it is installed."""
+    return serialization.dumps(obj, default=kwargs.get("default"))  # type: ignore[arg-type]
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -30,7 +58,10 @@ def setup_logging(
         max_bytes: Max size per log file before rotation (default 10 MB).
         backup_count: Number of rotated log files to keep (default 5).
     """
-    # Shared processors for all output
+    level = getattr(logging, log_level.upper(), logging.INFO)
+
+    # Shared processors for all output. Level filtering happens in the bound
+    # logger itself (see wrapper_class), so no processor runs for dropped events.
     shared_processors: list[structlog.types.Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
@@ -42,7 +73,9 @@ def setup_logging(
     ]
 
     if json_output:
-        renderer: structlog.types.Processor = structlog.processors.JSONRenderer()
+        renderer: structlog.types.Processor = structlog.processors.JSONRenderer(
+            serializer=_render_json
+        )
     else:
         renderer = structlog.dev.ConsoleRenderer(colors=True)
 
@@ -52,18 +85,20 @@ def setup_logging(
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Methods below `level` are no-ops: no event dict, no processors
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
     # Configure the stdlib root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    root_logger.setLevel(level)
 
     # Formatter that structlog will use
     formatter = structlog.stdlib.ProcessorFormatter(
         processors=[
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            shorten_ids,
             renderer,
         ],
     )
@@ -81,7 +116,7 @@ def setup_logging(
         file_json_formatter = structlog.stdlib.ProcessorFormatter(
             processors=[
                 structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                structlog.processors.JSONRenderer(),
+                structlog.processors.JSONRenderer(serializer=_render_json),
             ],
         )
         file_handler = logging.handlers.RotatingFileHandler(
@@ -98,7 +133,7 @@ def setup_logging(
         logging.getLogger(noisy_logger).setLevel(logging.WARNING)
 
 
-def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str | None = None) -> structlog.typing.FilteringBoundLogger:
     """Get a configured structlog logger.
 
     Args:
@@ -111,7 +146,7 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
 
 
 def log_trade(
-    logger: structlog.stdlib.BoundLogger,
+    logger: structlog.typing.FilteringBoundLogger,
     *,
     event: str,
     strategy: str,
@@ -151,7 +186,7 @@ def log_trade(
 
 
 def log_risk_rejection(
-    logger: structlog.stdlib.BoundLogger,
+    logger: structlog.typing.FilteringBoundLogger,
     *,
     strategy: str,
     market_id: str,
@@ -171,7 +206,7 @@ def log_risk_rejection(
 
 
 def log_position_event(
-    logger: structlog.stdlib.BoundLogger,
+    logger: structlog.typing.FilteringBoundLogger,
     *,
     event: str,
     strategy: str,
@@ -82,7 +82,7 @@ class PnLTracker:
             logger.info("pnl_tracker_initialized", starting_balance=self._starting_balance)
         else:
             # First run today — record current portfolio value as starting balance
-            balance = self._wallet.get_usdc_balance()
+            balance = await self._wallet.aget_usdc_balance()
             positions = self._db.get_open_positions()
             positions_value = sum(
                 (p["current_price"] or p["entry_price"]) * p["size"] for p in positions
@@ -99,7 +99,7 @@ class PnLTracker:
     def get_snapshot(self) -> PnLSnapshot:
         """Get current P&L snapshot."""
         usdc_balance = self._wallet.get_usdc_balance()
-        positions = self._db.get_open_positions()
+        positions = list(self._db.iter_open_positions())
 
         positions_value = 0.0
         unrealized_pnl = 0.0
@@ -107,7 +107,7 @@ class PnLTracker:
 
         for pos in positions:
             pos_value = (pos["current_price"] or pos["entry_price"]) * pos["size"]
-            pos_unrealized = pos.get("unrealized_pnl", 0.0)
+            pos_unrealized = pos["unrealized_pnl"]
             positions_value += pos_value
             unrealized_pnl += pos_unrealized
 
@@ -130,11 +130,10 @@ class PnLTracker:
 
         # M-11: Sum fees from today's filled trades
         today_str = datetime.now(UTC).strftime("%Y-%m-%d")
-        today_trades = self._db.get_trades(status="filled", limit=500)
         total_fees_today = sum(
-            t.get("fees", 0.0) or 0.0
-            for t in today_trades
-            if (t.get("created_at") or "").startswith(today_str)
+            t["fees"] or 0.0
+            for t in self._db.iter_trades(status="filled", limit=500)
+            if t["created_at"].startswith(today_str)
         )
 
         # Compute daily return
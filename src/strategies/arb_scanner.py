@@ -182,8 +182,10 @@ class ArbScanner(BaseStrategy):
         Returns an ArbOpportunity if yes+no < threshold, None otherwise.
         """
         # H-12: Fetch live prices from CLOB orderbook (best ask = price to buy)
-        _, yes_ask = await self._client.get_best_bid_ask(market.yes_token_id)
-        _, no_ask = await self._client.get_best_bid_ask(market.no_token_id)
+        # Both sides are fetched concurrently
+        books = await self._client.get_books_batch([market.yes_token_id, market.no_token_id])
+        _, yes_ask = books[market.yes_token_id]
+        _, no_ask = books[market.no_token_id]
 
         # Fall back to Gamma prices if orderbook is empty
         yes_price = yes_ask if yes_ask is not None else market.yes_price
@@ -341,7 +343,7 @@ class ArbScanner(BaseStrategy):
         logger.info(
             "arb_opportunity_detected",
             market=opp.market.question[:60],
-            condition_id=opp.market.condition_id[:16],
+            condition_id=opp.market.condition_id,
             yes_price=opp.yes_price,
             no_price=opp.no_price,
             total_price=round(opp.total_price, 4),
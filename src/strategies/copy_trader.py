@@ -126,19 +126,32 @@ class CopyTrader(BaseStrategy):
 
         signals: list[Signal] = []
 
+        # COPY-01: Poll Data API for all tracked wallets concurrently
+        positions_by_wallet = await self._client.get_positions_batch(
+            [w["address"] for w in enabled_wallets]
+        )
+
         for wallet_cfg in enabled_wallets:
             address = wallet_cfg["address"]
             wallet_name = wallet_cfg.get("name", address[:10])
             max_allocation = wallet_cfg.get("max_allocation_usd", float("inf"))
+            if address not in positions_by_wallet:
+                # Fetch failed (logged by the client); keep last known positions
+                continue
 
             try:
-                new_signals = await self._process_wallet(address, wallet_name, max_allocation)
+                new_signals = await self._process_wallet(
+                    address,
+                    wallet_name,
+                    max_allocation,
+                    positions_by_wallet[address],
+                )
                 signals.extend(new_signals)
             except Exception:
                 logger.exception(
                     "copy_trader_wallet_error",
                     wallet=wallet_name,
-                    address=address[:10] + "...",
+                    address=address,
                 )
 
         return signals
@@ -148,13 +161,12 @@ class CopyTrader(BaseStrategy):
         address: str,
         wallet_name: str,
         max_allocation: float,
+        current_positions: list[dict[str, Any]],
     ) -> list[Signal]:
-        """Process a single whale wallet: fetch positions, detect changes, emit signals.
+        """Process a single whale wallet: detect position changes, emit signals.
 
         H-10 FIX: Detects both entries (BUY) and exits/reductions (SELL).
         """
-        # COPY-01: Poll Data API for current positions
-        current_positions = await self._client.get_positions(address)
 
         # Build lookup of current positions
         current_lookup: dict[tuple[str, str], dict[str, Any]] = {}
@@ -271,7 +283,7 @@ class CopyTrader(BaseStrategy):
                 logger.warning(
                     "copy_exit_no_price",
                     wallet=wallet_name,
-                    token_id=token_id[:16],
+                    token_id=token_id,
                 )
                 continue
 
@@ -314,7 +326,7 @@ class CopyTrader(BaseStrategy):
             logger.info(
                 "copy_exit_signal",
                 wallet=wallet_name,
-                market_id=market_id[:16],
+                market_id=market_id,
                 exit_type=exit_type,
                 reduction_pct=round(reduction_pct, 1),
                 exit_size_usd=round(exit_size_usd, 2),
@@ -349,7 +361,7 @@ class CopyTrader(BaseStrategy):
                 logger.info(
                     "whale_position_increased",
                     wallet=wallet_name,
-                    market_id=market_id[:16],
+                    market_id=market_id,
                     prev_size=prev_size,
                     new_size=pos_data["size"],
                 )
@@ -360,7 +372,7 @@ class CopyTrader(BaseStrategy):
                 logger.warning(
                     "copy_skip_no_price",
                     wallet=wallet_name,
-                    token_id=token_id[:16],
+                    token_id=token_id,
                 )
                 continue
 
@@ -373,7 +385,7 @@ class CopyTrader(BaseStrategy):
                 logger.debug(
                     "copy_skip_conviction",
                     wallet=wallet_name,
-                    market_id=market_id[:16],
+                    market_id=market_id,
                     whale_current_value_usd=round(whale_current_value_usd, 2),
                     min_required=self._min_whale_position_usd,
                 )
@@ -388,7 +400,7 @@ class CopyTrader(BaseStrategy):
                     logger.info(
                         "copy_skip_slippage",
                         wallet=wallet_name,
-                        market_id=market_id[:16],
+                        market_id=market_id,
                         whale_entry=whale_entry,
                         current_price=current_price,
                         slippage_pct=round(slippage_pct, 2),
@@ -459,7 +471,7 @@ class CopyTrader(BaseStrategy):
             logger.info(
                 "copy_signal_generated",
                 wallet=wallet_name,
-                market_id=market_id[:16],
+                market_id=market_id,
                 whale_value_usd=round(whale_current_value_usd, 2),
                 trade_size=round(trade_size, 2),
                 current_price=round(current_price, 4),
@@ -546,20 +558,17 @@ class CopyTrader(BaseStrategy):
         # Delete positions no longer held
         saved = self._db.get_whale_positions(address)
         saved_keys = {(p["market_id"], p["token_id"]) for p in saved}
-        current_keys = set(positions.keys())
-
-        for key in saved_keys - current_keys:
-            market_id, token_id = key
-            self._db.delete_whale_position(address, market_id, token_id)
-
-        # Upsert current positions
-        for (market_id, token_id), data in positions.items():
-            self._db.upsert_whale_position(
-                wallet_address=address,
-                market_id=market_id,
-                token_id=token_id,
-                size=data["size"],
-                avg_price=data.get("avg_price"),
+        stale = list(saved_keys - set(positions.keys()))
+
+        # One commit for the whole snapshot instead of one per token
+        with self._db.transaction():
+            self._db.delete_whale_positions_bulk(address, stale)
+            self._db.upsert_whale_positions_bulk(
+                address,
+                [
+                    (market_id, token_id, data["size"], data.get("avg_price"))
+                    for (market_id, token_id), data in positions.items()
+                ],
             )
 
     # ─── COPY-06: Per-wallet performance tracking ─────────────────
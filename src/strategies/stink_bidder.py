@@ -20,7 +20,6 @@ Audit fixes: H-08, H-09, M-16, M-25
 
 from __future__ import annotations
 
-import asyncio
 import random
 from typing import TYPE_CHECKING, Any
 
@@ -48,7 +47,7 @@ class StinkBidder(BaseStrategy):
 
     Audit fixes:
     - H-08: _active_orders populated after order submission via DB cross-reference.
-    - H-09: Sync CLOB calls wrapped in asyncio.to_thread().
+    - H-09: Sync CLOB calls run off the event loop (client's CLOB thread pool).
     - M-16: Skip resolved/closed markets before bidding.
     - M-25: Signal.size is always in USD (C-06 convention).
     """
@@ -146,7 +145,7 @@ class StinkBidder(BaseStrategy):
             if market.closed or market.resolved:
                 logger.debug(
                     "stink_skip_closed_or_resolved",
-                    market_id=market.condition_id[:16],
+                    market_id=market.condition_id,
                     closed=market.closed,
                     resolved=market.resolved,
                 )
@@ -207,13 +206,12 @@ class StinkBidder(BaseStrategy):
 
         H-08: Also scans for orders from our strategy in the DB that we may
         have missed tracking (e.g., from a restart).
-        H-09: Sync CLOB calls wrapped in asyncio.to_thread().
+        H-09: Sync CLOB calls run off the event loop via the client.
         """
         try:
-            # H-09: Wrap sync CLOB call in asyncio.to_thread()
-            open_orders = await asyncio.to_thread(self._client.clob.get_orders)
-            if not isinstance(open_orders, list):
-                open_orders = []
+            # H-09: Sync CLOB call runs on the client's CLOB thread pool; errors
+            # propagate so a failed lookup can't look like "every order filled"
+            open_orders = await self._client.fetch_open_orders()
 
             open_order_ids = {o.get("orderID") for o in open_orders}
 
@@ -272,7 +270,7 @@ class StinkBidder(BaseStrategy):
             self.set_state("active_orders", self._active_orders)
             logger.info(
                 "stink_bid_slot_reserved",
-                market_id=signal.market_id[:16],
+                market_id=signal.market_id,
                 price=signal.price,
             )
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -31,6 +31,7 @@ def settings(tmp_db_path: str) -> Settings:
         trading_mode="paper",
         log_level="DEBUG",
         database_url=f"sqlite:///{tmp_db_path}",
+        gamma_file_cache_ttl_seconds=0,
     )
 
 
@@ -110,5 +111,7 @@ def mock_wallet() -> MagicMock:
     wallet = MagicMock()
     wallet.get_usdc_balance.return_value = 500.0
     wallet.get_matic_balance.return_value = 1.0
+    wallet.aget_usdc_balance = AsyncMock(return_value=500.0)
+    wallet.aget_matic_balance = AsyncMock(return_value=1.0)
     wallet.funder_address = "0x" + "11" * 20
     return wallet
@@ -18,6 +18,11 @@ def mock_deps():
     client.get_markets = AsyncMock()
     client.get_best_bid_ask = AsyncMock(return_value=(None, None))
 
+    async def _books_batch(token_ids):
+        return {t: await client.get_best_bid_ask(t) for t in token_ids}
+
+    client.get_books_batch = AsyncMock(side_effect=_books_batch)
+
     db = MagicMock(spec=Database)
     db.load_strategy_state.return_value = {}
 
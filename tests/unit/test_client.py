@@ -0,0 +1,749 @@
+"""Unit tests for the Polymarket API client wrapper."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from src.core.client import Market, PolymarketClient
+from src.core.config import PROJECT_ROOT, Settings, StrategyConfig
+from src.core.file_cache import FileCache
+from src.core.http import shutdown_shared_client
+from src.core.websocket import WebSocketManager
+
+
+def _gamma_market(condition_id: str, volume: float = 1000.0) -> dict[str, Any]:
+    return {
+        "conditionId": condition_id,
+        "question": f"Question {condition_id}?",
+        "volume": volume,
+        "liquidity": 500.0,
+        "active": True,
+        "tokens": [
+            {"token_id": f"{condition_id}-yes", "outcome": "Yes", "price": 0.4},
+            {"token_id": f"{condition_id}-no", "outcome": "No", "price": 0.6},
+        ],
+    }
+
+
+class _GammaStub:
+    """Counts requests and answers them like the Gamma API."""
+
+    def __init__(self) -> None:
+        self.calls: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request)
+        path = request.url.path
+        if path == "/markets":
+            return httpx.Response(200, json=[_gamma_market("c1"), _gamma_market("c2")])
+        if path == "/markets/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json=_gamma_market(path.rsplit("/", 1)[-1]))
+
+
+@pytest.fixture
+def gamma() -> _GammaStub:
+    return _GammaStub()
+
+
+@pytest.fixture
+def client(
+    settings: Settings, strategy_config: StrategyConfig, gamma: _GammaStub
+) -> PolymarketClient:
+    c = PolymarketClient(settings, strategy_config)
+    c._http_client = httpx.AsyncClient(transport=httpx.MockTransport(gamma))
+    return c
+
+
+class TestLazyImports:
+    """Importing the client module must not pay the signing-stack import cost."""
+
+    def test_import_does_not_load_clob_or_web3(self):
+        code = (
+            "import sys\n"
+            "import src.core.client\n"
+            "heavy = ('py_clob_client', 'eth_account', 'web3')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == ""
+
+
+class TestMarketFromGamma:
+    """Market parsing from Gamma payloads."""
+
+    def test_tokens_matched_by_outcome(self):
+        data = _gamma_market("c1")
+        data["tokens"].reverse()
+        market = Market.from_gamma(data)
+        assert market.yes_token_id == "c1-yes"
+        assert market.no_token_id == "c1-no"
+        assert market.yes_price == 0.4
+
+    def test_tokens_fall_back_to_index(self):
+        data = _gamma_market("c1")
+        for token in data["tokens"]:
+            del token["outcome"]
+        market = Market.from_gamma(data)
+        assert (market.yes_token_id, market.no_token_id) == ("c1-yes", "c1-no")
+
+    def test_missing_tokens(self):
+        market = Market.from_gamma({"conditionId": "c1"})
+        assert market.yes_token_id == market.no_token_id == ""
+
+    def test_resolution_parsed(self):
+        data = _gamma_market("c1") | {"active": False, "winning_outcome": "Yes"}
+        assert Market.from_gamma(data).resolution == "Yes"
+
+    def test_raw_not_kept_by_default(self, monkeypatch):
+        data = _gamma_market("c1")
+        assert Market.from_gamma(data).raw == {}
+        monkeypatch.setattr(Market, "store_raw", True)
+        assert Market.from_gamma(data).raw is data
+
+    def test_keep_raw_overrides_class_default(self, monkeypatch):
+        data = _gamma_market("c1")
+        assert Market.from_gamma(data, keep_raw=True).raw is data
+        monkeypatch.setattr(Market, "store_raw", True)
+        assert Market.from_gamma(data, keep_raw=False).raw == {}
+
+    def test_slots(self):
+        market = Market.from_gamma(_gamma_market("c1"))
+        assert not hasattr(market, "__dict__")
+
+
+class TestGammaCache:
+    """Gamma responses are reused within the TTL and coalesced when concurrent."""
+
+    @pytest.mark.asyncio
+    async def test_get_markets_cached_within_ttl(self, client: PolymarketClient, gamma):
+        first = await client.get_markets(limit=10)
+        second = await client.get_markets(limit=10)
+        assert [m.condition_id for m in first] == ["c1", "c2"]
+        assert [m.condition_id for m in second] == ["c1", "c2"]
+        assert len(gamma.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_shared(self, client: PolymarketClient, gamma):
+        await client.get_markets(limit=10)
+        await client.get_markets(limit=20)
+        assert len(gamma.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_coalesce(self, client: PolymarketClient, gamma):
+        results = await asyncio.gather(*(client.get_market("c9") for _ in range(5)))
+        assert all(m is not None and m.condition_id == "c9" for m in results)
+        assert len(gamma.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_market_cached_as_none(self, client: PolymarketClient, gamma):
+        assert await client.get_market("missing") is None
+        assert await client.get_market("missing") is None
+        assert len(gamma.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_list_fetch_seeds_market_cache(self, client: PolymarketClient, gamma):
+        await client.get_markets()
+        market = await client.get_market("c2")
+        assert market is not None and market.condition_id == "c2"
+        assert len(gamma.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self, client: PolymarketClient, gamma):
+        client._gamma_ttl = 0
+        await client.get_market("c1")
+        await client.get_market("c1")
+        assert len(gamma.calls) == 2
+
+
+class TestClobExecutor:
+    """Blocking CLOB calls run on the client's dedicated thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_run_clob_uses_named_pool(self, client: PolymarketClient):
+        client._clob_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clob")
+        try:
+            name = await client._run_clob(lambda: threading.current_thread().name)
+        finally:
+            await client.close()
+        assert name.startswith("clob")
+        assert client._clob_pool is None
+
+    @pytest.mark.asyncio
+    async def test_run_clob_without_pool_falls_back(self, client: PolymarketClient):
+        assert await client._run_clob(sum, [1, 2, 3]) == 6
+
+
+def _book(bid: float, ask: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        bids=[SimpleNamespace(price=str(bid))],
+        asks=[SimpleNamespace(price=str(ask))],
+    )
+
+
+class TestOrderBookCache:
+    """get_price and get_best_bid_ask share one order book fetch per TTL window."""
+
+    @pytest.fixture
+    def clob(self, client: PolymarketClient) -> MagicMock:
+        clob = MagicMock()
+        clob.get_order_book.return_value = _book(0.45, 0.55)
+        client._clob_client = clob
+        return clob
+
+    @pytest.mark.asyncio
+    async def test_price_and_bid_ask_share_fetch(self, client: PolymarketClient, clob):
+        assert await client.get_price("tok") == 0.45
+        assert await client.get_best_bid_ask("tok") == (0.45, 0.55)
+        clob.get_order_book.assert_called_once_with("tok")
+
+    @pytest.mark.asyncio
+    async def test_expired_book_refetched(self, client: PolymarketClient, clob):
+        client._book_ttl = 0
+        await client.get_price("tok")
+        await client.get_price("tok")
+        assert clob.get_order_book.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_not_cached(self, client: PolymarketClient, clob):
+        clob.get_order_book.side_effect = [RuntimeError("boom"), _book(0.3, 0.4)]
+        assert await client.get_best_bid_ask("tok") == (None, None)
+        assert await client.get_best_bid_ask("tok") == (0.3, 0.4)
+
+    @pytest.mark.asyncio
+    async def test_order_placement_invalidates_book(self, client: PolymarketClient, clob):
+        clob.create_and_post_order.return_value = {"orderID": "o1"}
+        await client.get_price("tok")
+        await client.create_and_place_order("tok", "BUY", 0.45, 10)
+        await client.get_price("tok")
+        assert clob.get_order_book.call_count == 2
+
+
+class TestQuoteFeed:
+    """Fresh WebSocket book snapshots short-circuit the REST order book."""
+
+    @pytest.fixture
+    def clob(self, client: PolymarketClient) -> MagicMock:
+        clob = MagicMock()
+        clob.get_order_book.return_value = _book(0.45, 0.55)
+        client._clob_client = clob
+        return clob
+
+    @pytest.fixture
+    def ws(self, client: PolymarketClient, settings: Settings) -> WebSocketManager:
+        ws = WebSocketManager(settings)
+        client.attach_quote_feed(ws)
+        return ws
+
+    @pytest.mark.asyncio
+    async def test_fresh_quote_used(self, client: PolymarketClient, clob, ws):
+        ws._handle_message(
+            '{"event_type": "book", "asset_id": "tok",'
+            ' "bids": [{"price": "0.40", "size": "5"}, {"price": "0.42", "size": "1"}],'
+            ' "asks": [{"price": "0.47", "size": "3"}, {"price": "0.44", "size": "2"}]}'
+        )
+        assert await client.get_best_bid_ask("tok") == (0.42, 0.44)
+        assert await client.get_price("tok") == 0.42
+        clob.get_order_book.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_or_unknown_token_falls_back(self, client: PolymarketClient, clob, ws):
+        ws._quotes["tok"] = (0.1, 0.2, time.monotonic() - 10)
+        assert await client.get_best_bid_ask("tok") == (0.45, 0.55)
+        assert await client.get_price("other") == 0.45
+        assert clob.get_order_book.call_count == 2
+
+
+class TestOrderSubmitTimeout:
+    """Slow order submissions are abandoned and cancelled if they land late."""
+
+    @pytest.fixture
+    def clob(self, client: PolymarketClient) -> MagicMock:
+        clob = MagicMock()
+        release = threading.Event()
+
+        def slow_post(order_args):
+            release.wait(1.0)
+            return {"orderID": "late"}
+
+        clob.create_and_post_order.side_effect = slow_post
+        clob.release = release
+        client._clob_client = clob
+        return clob
+
+    @pytest.mark.asyncio
+    async def test_timeout_reports_failure_and_cancels_late_ack(
+        self, client: PolymarketClient, clob
+    ):
+        result = await client.create_and_place_order("tok", "BUY", 0.45, 10, timeout=0.01)
+        assert result.success is False
+        assert "exceeded" in result.error
+
+        clob.release.set()
+        for _ in range(100):
+            if clob.cancel.called:
+                break
+            await asyncio.sleep(0.01)
+        clob.cancel.assert_called_once_with("late")
+
+    @pytest.mark.asyncio
+    async def test_no_timeout_waits(self, client: PolymarketClient, clob):
+        clob.release.set()
+        result = await client.create_and_place_order("tok", "BUY", 0.45, 10, timeout=0)
+        assert result.success is True
+        assert result.order_id == "late"
+        clob.cancel.assert_not_called()
+
+
+class TestCancelOrders:
+    """cancel_orders cancels a batch of IDs in one CLOB request."""
+
+    @pytest.fixture
+    def clob(self, client: PolymarketClient) -> MagicMock:
+        clob = MagicMock()
+        client._clob_client = clob
+        return clob
+
+    @pytest.mark.asyncio
+    async def test_single_request_with_partial_result(self, client: PolymarketClient, clob):
+        clob.cancel_orders.return_value = {"canceled": ["o1"], "not_canceled": {"o2": "filled"}}
+        assert await client.cancel_orders(["o1", "o2", "o1"]) == {"o1": True, "o2": False}
+        clob.cancel_orders.assert_called_once_with(["o1", "o2"])
+        clob.cancel.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_marks_all_failed(self, client: PolymarketClient, clob):
+        clob.cancel_orders.side_effect = RuntimeError("down")
+        assert await client.cancel_orders(["o1", "o2"]) == {"o1": False, "o2": False}
+
+    @pytest.mark.asyncio
+    async def test_empty_is_noop(self, client: PolymarketClient, clob):
+        assert await client.cancel_orders([]) == {}
+        assert await client.cancel_orders([""]) == {}
+        clob.cancel_orders.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cancel_order_without_id(self, client: PolymarketClient, clob):
+        assert await client.cancel_order("") is False
+        clob.cancel.assert_not_called()
+
+
+class TestPrimeOrderContext:
+    """Order-signing metadata is fetched in the background once per token."""
+
+    @pytest.mark.asyncio
+    async def test_primes_once(self, client: PolymarketClient):
+        clob = MagicMock()
+        client._clob_client = clob
+        client.prime_order_context("tok")
+        client.prime_order_context("tok")
+        await asyncio.gather(*client._background)
+        clob.get_tick_size.assert_called_once_with("tok")
+        clob.get_neg_risk.assert_called_once_with("tok")
+        clob.get_fee_rate_bps.assert_called_once_with("tok")
+
+    @pytest.mark.asyncio
+    async def test_failure_allows_retry(self, client: PolymarketClient):
+        clob = MagicMock()
+        clob.get_neg_risk.side_effect = RuntimeError("down")
+        client._clob_client = clob
+        client.prime_order_context("tok")
+        await asyncio.gather(*client._background)
+        assert "tok" not in client._primed_tokens
+
+    def test_noop_without_clob(self, client: PolymarketClient):
+        client.prime_order_context("tok")
+        assert client._background == set()
+
+
+class TestHttpClientSetup:
+    """initialize() builds a pooled, keep-alive HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_http_client_pooled(self, settings: Settings, strategy_config: StrategyConfig):
+        c = PolymarketClient(settings, strategy_config)
+        await c.initialize()
+        try:
+            assert c.http.timeout.connect == 5.0
+            pool = c.http._transport._pool  # type: ignore[attr-defined]
+            assert pool._max_connections == settings.http_max_connections
+            assert pool._max_keepalive_connections == settings.http_max_keepalive
+            assert c.http.headers["Accept"] == "application/json"
+        finally:
+            await c.close()
+            await shutdown_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_pool(
+        self, settings: Settings, strategy_config: StrategyConfig
+    ):
+        a = PolymarketClient(settings, strategy_config)
+        b = PolymarketClient(settings, strategy_config)
+        await a.initialize()
+        await b.initialize()
+        try:
+            assert a.http is b.http
+            shared = a.http
+            await a.close()
+            assert not shared.is_closed
+        finally:
+            await b.close()
+            await shutdown_shared_client()
+        assert shared.is_closed
+
+
+class TestBatchFanOut:
+    """Batch helpers fan out concurrently and isolate per-item failures."""
+
+    @pytest.mark.asyncio
+    async def test_positions_batch_omits_failures(self, client: PolymarketClient):
+        async def fetch_positions(wallet):
+            if wallet == "0xbad":
+                raise RuntimeError("boom")
+            return [{"wallet": wallet}]
+
+        client._fetch_positions = fetch_positions  # type: ignore[method-assign]
+        result = await client.get_positions_batch(["0xa", "0xbad", "0xa"])
+        assert result == {"0xa": [{"wallet": "0xa"}]}
+
+    @pytest.mark.asyncio
+    async def test_fanout_bounded(self, client: PolymarketClient):
+        client._fanout_sem = asyncio.Semaphore(2)
+        in_flight = peak = 0
+
+        async def fetch_positions(wallet):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        client._fetch_positions = fetch_positions  # type: ignore[method-assign]
+        await client.get_positions_batch([f"0x{i}" for i in range(6)])
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_books_batch(self, client: PolymarketClient):
+        clob = MagicMock()
+        clob.get_order_book.side_effect = lambda t: _book(0.1, 0.2) if t == "a" else None
+        client._clob_client = clob
+        result = await client.get_books_batch(["a", "b", "a"])
+        assert result == {"a": (0.1, 0.2), "b": (None, None)}
+        assert clob.get_order_book.call_count == 2
+
+
+class TestHttpRetry:
+    """Gamma/Data GETs retry on 429/5xx and give up after a bounded number of tries."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        delays: list[float] = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr("src.core.client.asyncio.sleep", fake_sleep)
+        return delays
+
+    def _client_with(self, client: PolymarketClient, responses: list[httpx.Response]):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return responses[min(len(calls), len(responses)) - 1]
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_retries_then_succeeds(self, client: PolymarketClient, no_sleep):
+        calls = self._client_with(
+            client, [httpx.Response(503), httpx.Response(200, json=_gamma_market("c1"))]
+        )
+        market = await client.get_market("c1")
+        assert market is not None and market.condition_id == "c1"
+        assert len(calls) == 2
+        assert len(no_sleep) == 1
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self, client: PolymarketClient, no_sleep):
+        self._client_with(
+            client,
+            [
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json=[]),
+            ],
+        )
+        assert await client.get_positions("0xabc") == []
+        assert no_sleep == [2.0]
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after_http_date(self, client: PolymarketClient, no_sleep):
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=3), usegmt=True)
+        self._client_with(
+            client,
+            [
+                httpx.Response(429, headers={"Retry-After": when}),
+                httpx.Response(200, json=[]),
+            ],
+        )
+        assert await client.get_positions("0xabc") == []
+        assert 1.0 < no_sleep[0] <= 3.0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_tries(self, client: PolymarketClient, no_sleep):
+        calls = self._client_with(client, [httpx.Response(502)])
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_markets()
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, client: PolymarketClient, no_sleep):
+        calls = self._client_with(client, [httpx.Response(404)])
+        assert await client.get_market("nope") is None
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_positions_batch_skips_failed_wallet(self, client: PolymarketClient, no_sleep):
+        def handler(request):
+            if request.url.params["user"] == "0xdown":
+                return httpx.Response(503)
+            return httpx.Response(200, json=[{"size": 1}])
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        result = await client.get_positions_batch(["0xup", "0xdown"])
+        assert result == {"0xup": [{"size": 1}]}
+        # The single-wallet API still reports a failure as no positions
+        assert await client.get_positions("0xdown") == []
+
+
+class TestGammaFileCache:
+    """Market lists persist across restarts but are only read on first fetch."""
+
+    @pytest.fixture
+    def disk_client(self, client: PolymarketClient, tmp_path) -> PolymarketClient:
+        client._file_cache = FileCache(tmp_path, ttl=60)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_restart_served_from_disk(
+        self, disk_client: PolymarketClient, gamma, settings: Settings
+    ):
+        await disk_client.get_markets()
+        assert len(gamma.calls) == 1
+
+        restarted = PolymarketClient(settings, disk_client.strategy_config)
+        restarted._http_client = disk_client._http_client
+        restarted._file_cache = disk_client._file_cache
+        markets = await restarted.get_markets()
+        assert [m.condition_id for m in markets] == ["c1", "c2"]
+        assert len(gamma.calls) == 1
+
+        # Later fetches in the same process go to the API again
+        restarted._markets_cache.clear()
+        await restarted.get_markets()
+        assert len(gamma.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, disk_client: PolymarketClient, gamma, settings: Settings):
+        await disk_client.get_markets()
+        disk_client.invalidate_market_caches()
+        restarted = PolymarketClient(settings, disk_client.strategy_config)
+        restarted._http_client = disk_client._http_client
+        restarted._file_cache = disk_client._file_cache
+        await restarted.get_markets()
+        assert len(gamma.calls) == 2
+
+
+class TestMarketFiltering:
+    """get_markets drops low-volume, low-liquidity and incomplete markets."""
+
+    @pytest.mark.asyncio
+    async def test_filters_before_parsing(self, client: PolymarketClient, monkeypatch):
+        payload = [
+            _gamma_market("keep", volume=5000),
+            _gamma_market("thin", volume=10),
+            _gamma_market("one_token", volume=5000) | {"tokens": [{"token_id": "x"}]},
+            _gamma_market("no_tokens", volume=5000) | {"tokens": None},
+        ]
+        client._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json=payload))
+        )
+        parsed: list[str] = []
+        original = Market.from_gamma.__func__
+
+        def spy(cls, data, keep_raw=None):
+            parsed.append(data["conditionId"])
+            return original(cls, data, keep_raw)
+
+        monkeypatch.setattr(Market, "from_gamma", classmethod(spy))
+        markets = await client.get_markets(min_volume=1000)
+        assert [m.condition_id for m in markets] == ["keep"]
+        assert parsed == ["keep"]
+
+    @pytest.mark.asyncio
+    async def test_filters_sent_to_gamma(self, client: PolymarketClient):
+        seen: list[httpx.QueryParams] = []
+
+        def handler(request):
+            seen.append(request.url.params)
+            return httpx.Response(200, json=[_gamma_market("c1", volume=5000), {"question": "?"}])
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        markets = await client.get_markets(min_volume=1000, min_liquidity=0)
+        assert [m.condition_id for m in markets] == ["c1"]
+        assert seen[0]["volume_num_min"] == "1000"
+        assert "liquidity_num_min" not in seen[0]
+
+    @pytest.mark.asyncio
+    async def test_malformed_markets_skipped(self, client: PolymarketClient):
+        payload = [_gamma_market("bad", volume=5000) | {"volume": "n/a"}, _gamma_market("ok")]
+        client._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json=payload))
+        )
+        markets = await client.get_markets()
+        assert [m.condition_id for m in markets] == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_debug_keep_raw(self, client: PolymarketClient, settings: Settings):
+        assert (await client.get_market("c1")).raw == {}
+
+        settings.debug_keep_raw = True
+        debug = PolymarketClient(settings, client.strategy_config)
+        debug._http_client = client._http_client
+        assert (await debug.get_market("c1")).raw["conditionId"] == "c1"
+
+
+class TestCredentials:
+    """CLOB credentials are materialized once from Settings."""
+
+    def test_build_creds(self, settings: Settings, strategy_config: StrategyConfig):
+        c = PolymarketClient(settings, strategy_config)
+        creds = c._build_creds()
+        assert creds.api_key == settings.polymarket_api_key.get_secret_value()
+        assert creds.api_secret == settings.polymarket_api_secret.get_secret_value()
+        assert creds.api_passphrase == settings.polymarket_api_passphrase.get_secret_value()
+
+
+class TestEmptyWalletCooldown:
+    """Tracked wallets that return no positions are not re-polled immediately."""
+
+    def _serve(self, client: PolymarketClient, bodies: list[Any]) -> list[httpx.Request]:
+        calls: list[httpx.Request] = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=bodies[min(len(calls), len(bodies)) - 1])
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_empty_wallet_skipped_during_cooldown(self, client: PolymarketClient):
+        calls = self._serve(client, [[]])
+        assert await client.get_positions("0xwhale") == []
+        assert await client.get_positions("0xwhale") == []
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cooldown_expires(self, client: PolymarketClient):
+        calls = self._serve(client, [[], [{"size": 1}]])
+        await client.get_positions("0xwhale")
+        client._empty_wallets["0xwhale"] = 0.0
+        assert await client.get_positions("0xwhale") == [{"size": 1}]
+        assert "0xwhale" not in client._empty_wallets
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_with_zero(self, client: PolymarketClient):
+        client._empty_wallet_cooldown = 0
+        calls = self._serve(client, [[]])
+        await client.get_positions("0xwhale")
+        await client.get_positions("0xwhale")
+        assert len(calls) == 2
+
+
+class TestCoalescedClobCalls:
+    """Concurrent get_open_orders / cancel_all_orders share one CLOB request."""
+
+    @pytest.fixture
+    def slow_clob(self, client: PolymarketClient) -> MagicMock:
+        clob = MagicMock()
+
+        def slow(result):
+            def call():
+                threading.Event().wait(0.05)
+                return result
+
+            return call
+
+        clob.get_orders.side_effect = slow([{"orderID": "o1"}])
+        clob.cancel_all.side_effect = slow(None)
+        client._clob_client = clob
+        return clob
+
+    @pytest.mark.asyncio
+    async def test_get_open_orders_coalesced(self, client: PolymarketClient, slow_clob):
+        results = await asyncio.gather(*(client.get_open_orders() for _ in range(4)))
+        assert all(r == [{"orderID": "o1"}] for r in results)
+        assert slow_clob.get_orders.call_count == 1
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_coalesced(self, client: PolymarketClient, slow_clob):
+        results = await asyncio.gather(*(client.cancel_all_orders() for _ in range(3)))
+        assert results == [True, True, True]
+        assert slow_clob.cancel_all.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_shared(self, client: PolymarketClient, slow_clob):
+        await client.get_open_orders()
+        await client.get_open_orders()
+        assert slow_clob.get_orders.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self, client: PolymarketClient, slow_clob):
+        slow_clob.get_orders.side_effect = RuntimeError("down")
+        results = await asyncio.gather(*(client.get_open_orders() for _ in range(2)))
+        assert results == [[], []]
+
+
+class TestGetMarketsBatch:
+    """get_markets_batch returns markets in request order, None for misses."""
+
+    @pytest.mark.asyncio
+    async def test_order_and_missing(self, client: PolymarketClient, gamma):
+        markets = await client.get_markets_batch(["c1", "missing", "c2"])
+        assert [m.condition_id if m else None for m in markets] == ["c1", None, "c2"]
+        assert len(gamma.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_isolated(self, client: PolymarketClient):
+        def handler(request):
+            if request.url.path.endswith("/bad"):
+                raise httpx.ConnectError("down")
+            return httpx.Response(200, json=_gamma_market("ok"))
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        markets = await client.get_markets_batch(["ok", "bad"])
+        assert markets[0] is not None and markets[1] is None
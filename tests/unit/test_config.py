@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from src.core.config import Settings, StrategyConfig
+import pytest
+import yaml
+
+from src.core import config as config_module
+from src.core.config import Settings, StrategyConfig, WalletConfig
 
 
 class TestSettings:
@@ -21,6 +25,12 @@ class TestSettings:
         assert isinstance(settings.db_path, Path)
         assert str(settings.db_path).endswith("test.db")
 
+    def test_db_path_cached_until_url_changes(self, settings: Settings):
+        """db_path is parsed once, and again only after database_url is reassigned."""
+        assert settings.db_path is settings.db_path
+        settings.database_url = "sqlite:///elsewhere/other.db"
+        assert settings.db_path.parts[-2:] == ("elsewhere", "other.db")
+
     def test_is_live_mode(self, settings: Settings):
         """is_live returns True only in live mode."""
         settings.trading_mode = "live"
@@ -33,6 +43,17 @@ class TestSettings:
         # But should be accessible
         assert settings.wallet_private_key.get_secret_value().startswith("0x")
 
+    def test_live_mode_requires_credentials(self):
+        """H-22: live mode lists every missing credential."""
+        with pytest.raises(ValueError, match="polymarket_api_secret, polymarket_api_passphrase"):
+            Settings(
+                _env_file=None,
+                trading_mode="live",
+                wallet_private_key="0x" + "ab" * 32,
+                polymarket_api_key="key",
+                funder_address="0x" + "11" * 20,
+            )
+
 
 class TestStrategyConfig:
     """Tests for StrategyConfig YAML loading."""
@@ -64,6 +85,13 @@ class TestStrategyConfig:
         assert tiers[0]["sell_pct"] == 50
         assert tiers[1]["gain_pct"] == 100
 
+    def test_scalars_parsed_once(self, strategy_config: StrategyConfig):
+        """Scalar getters are computed on first access, then read from the instance."""
+        assert strategy_config.max_position_pct == 15
+        strategy_config._data["global"]["max_position_pct"] = 99
+        assert strategy_config.max_position_pct == 15
+        assert "max_position_pct" in vars(strategy_config)
+
     def test_fee_parameters(self, strategy_config: StrategyConfig):
         """Fee parameters loaded correctly."""
         assert strategy_config.winner_fee_pct == 2
@@ -85,3 +113,94 @@ class TestStrategyConfig:
     def test_get_missing_strategy(self, strategy_config: StrategyConfig):
         """Missing strategy returns None."""
         assert strategy_config.get_strategy("nonexistent") is None
+
+    def test_empty_file_uses_defaults(self, tmp_path: Path):
+        """H-23: an empty YAML file loads as an empty config."""
+        path = tmp_path / "strategies.yaml"
+        path.write_text("")
+        config = StrategyConfig(path)
+        assert config.strategies == {}
+        assert config.max_position_pct == 15.0
+
+    def test_malformed_values_fail_at_load(self, tmp_path: Path):
+        """Typed sections reject bad values when the file is loaded, not on first use."""
+        path = tmp_path / "strategies.yaml"
+        path.write_text("positions:\n  stop_loss_pct: lots\n")
+        with pytest.raises(ValueError, match="stop_loss_pct"):
+            StrategyConfig(path)
+
+        path.write_text("positions:\n  take_profit:\n    - gain_pct: 50\n")
+        with pytest.raises(ValueError, match="sell_pct"):
+            StrategyConfig(path)
+
+
+class TestWalletConfig:
+    """Tests for WalletConfig YAML loading."""
+
+    def test_lookup_and_enabled(self, tmp_path: Path):
+        path = tmp_path / "wallets.yaml"
+        path.write_text(
+            "wallets:\n"
+            "  - {name: a, address: '0xAbC', enabled: true}\n"
+            "  - {name: b, address: '0xdef', enabled: false}\n"
+            "  - {name: c, enabled: true}\n"
+        )
+        config = WalletConfig(path)
+        assert [w["name"] for w in config.enabled_wallets] == ["a"]
+        assert config.get_wallet("0xabc")["name"] == "a"
+        assert config.get_wallet("0xDEF")["name"] == "b"
+        assert config.get_wallet("0x123") is None
+
+
+class TestYamlCache:
+    """Parsed YAML is reused from a JSON sidecar until the file changes."""
+
+    def test_sidecar_reused_and_invalidated(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "wallets.yaml"
+        path.write_text("wallets:\n  - {name: a, address: '0xa', enabled: true}\n")
+        assert [w["name"] for w in WalletConfig(path).enabled_wallets] == ["a"]
+        assert (tmp_path / ".wallets.yaml.cache.json").exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed despite fresh cache")
+
+        monkeypatch.setattr(config_module.yaml, "load", fail)
+        assert [w["name"] for w in WalletConfig(path).enabled_wallets] == ["a"]
+        monkeypatch.undo()
+
+        path.write_text("wallets:\n  - {name: b, address: '0xb', enabled: true}\n")
+        assert [w["name"] for w in WalletConfig(path).enabled_wallets] == ["b"]
+
+    def test_c_loader_used_when_available(self):
+        assert config_module.YAML_C_LOADER == yaml.__with_libyaml__
+
+    def test_non_json_content_not_cached(self, tmp_path: Path):
+        path = tmp_path / "strategies.yaml"
+        path.write_text("global:\n  start: 2024-01-01\n")
+        StrategyConfig(path)
+        assert not (tmp_path / ".strategies.yaml.cache.json").exists()
+
+
+class TestLoaders:
+    """load_* helpers read each config once per process."""
+
+    def test_memoized_until_cleared(self, tmp_path: Path):
+        path = tmp_path / "wallets.yaml"
+        path.write_text("wallets: []\n")
+        try:
+            first = config_module.load_wallet_config(path)
+            assert config_module.load_wallet_config(path) is first
+            config_module.clear_config_caches()
+            assert config_module.load_wallet_config(path) is not first
+        finally:
+            config_module.clear_config_caches()
+
+    def test_default_path_normalized(self):
+        try:
+            default = config_module.load_strategy_config()
+            explicit = config_module.load_strategy_config(
+                config_module.PROJECT_ROOT / "config" / "strategies.yaml"
+            )
+            assert default is explicit
+        finally:
+            config_module.clear_config_caches()
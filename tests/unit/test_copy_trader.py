@@ -103,6 +103,18 @@ def mock_client() -> MagicMock:
     """Mock PolymarketClient."""
     client = MagicMock()
     client.get_positions = AsyncMock(return_value=[])
+
+    async def _positions_batch(wallets):
+        # Mirrors PolymarketClient.get_positions_batch: failed wallets are omitted
+        result = {}
+        for w in wallets:
+            try:
+                result[w] = await client.get_positions(w)
+            except Exception:
+                continue
+        return result
+
+    client.get_positions_batch = AsyncMock(side_effect=_positions_batch)
     client.get_price = AsyncMock(return_value=0.50)
     client.get_market = AsyncMock(
         return_value=Market(
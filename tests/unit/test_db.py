@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from src.core.db import Database
+import sqlite3
+from datetime import UTC, datetime
+
+import pytest
+
+from src.core import db as db_module
+from src.core.config import Settings
+from src.core.db import Database, _utcnow
 
 
 class TestDatabase:
@@ -14,6 +21,103 @@ class TestDatabase:
         count = db.count_open_positions()
         assert count == 0
 
+    def test_cache_pragmas(self, db: Database):
+        """Page cache, temp store and mmap settings are applied."""
+        assert db.conn.execute("PRAGMA cache_size").fetchone()[0] == -64 * 1024
+        assert db.conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        with db.read() as conn:
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64 * 1024
+
+    def test_writes_leave_no_open_transaction(self, db: Database):
+        """Standalone writes commit immediately (autocommit, no implicit BEGIN)."""
+        db.set_metadata("k", "v")
+        db.upsert_whale_positions_bulk("0xw", [("m1", "t1", 1.0, None)])
+        assert not db.conn.in_transaction
+
+    def test_bulk_write_joins_outer_transaction(self, db: Database):
+        """A bulk write inside transaction() is rolled back with it."""
+        try:
+            with db.transaction():
+                db.upsert_whale_positions_bulk("0xw", [("m1", "t1", 1.0, None)])
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        assert db.get_whale_positions("0xw") == []
+
+    def test_nested_transaction_rolls_back_inner_only(self, db: Database):
+        """An inner transaction() is a savepoint; the outer one still commits."""
+        with db.transaction():
+            db.set_metadata("outer", "1")
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.set_metadata("inner", "1")
+                    raise RuntimeError("abort inner")
+        assert db.get_metadata("outer") == "1"
+        assert db.get_metadata("inner") is None
+        assert not db.conn.in_transaction
+
+    def test_source_wallet_lookup_uses_index(self, db: Database):
+        """Source-wallet lookups read the indexed generated column."""
+        db.open_position(
+            "m1", "t1", "copy_trader", "BUY", 0.4, 10.0, metadata={"source_wallet": "0xw"}
+        )
+        db.open_position("m2", "t2", "copy_trader", "BUY", 0.4, 10.0)
+
+        assert [p["market_id"] for p in db.get_positions_by_wallet_source("0xw")] == ["m1"]
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM positions WHERE source_wallet = ?", ("0xw",)
+        ).fetchall()
+        assert any("idx_positions_source_wallet" in row["detail"] for row in plan)
+
+    def test_source_wallet_migration(self, settings: Settings):
+        """A positions table from before source_wallet gains the column on open."""
+        legacy = sqlite3.connect(settings.db_path)
+        legacy.execute(
+            """CREATE TABLE positions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, market_id TEXT NOT NULL,
+                token_id TEXT NOT NULL, strategy TEXT NOT NULL, side TEXT NOT NULL,
+                entry_price REAL NOT NULL, size REAL NOT NULL, current_price REAL,
+                unrealized_pnl REAL DEFAULT 0, realized_pnl REAL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'open', stop_loss_price REAL,
+                take_profit_triggered INTEGER DEFAULT 0, trailing_stop_price REAL,
+                opened_at TEXT NOT NULL, closed_at TEXT, close_reason TEXT, metadata TEXT)"""
+        )
+        legacy.execute(
+            "INSERT INTO positions (market_id, token_id, strategy, side, entry_price, size,"
+            " opened_at, metadata) VALUES ('m1', 't1', 'copy_trader', 'BUY', 0.4, 1.0,"
+            " '2026-01-01', '{\"source_wallet\": \"0xold\"}')"
+        )
+        legacy.commit()
+        legacy.close()
+
+        database = Database(settings)
+        database.initialize()
+        try:
+            assert len(database.get_positions_by_wallet_source("0xold")) == 1
+        finally:
+            database.close()
+
+    def test_utcnow_is_iso_utc(self):
+        """_utcnow() parses as an aware UTC datetime close to the current time."""
+        before = datetime.now(UTC)
+        stamp = datetime.fromisoformat(_utcnow())
+        assert stamp.utcoffset() is not None and stamp.utcoffset().total_seconds() == 0
+        assert abs((stamp - before).total_seconds()) < 1
+
+    def test_close_twice_is_safe(self, db: Database):
+        """close() can be called again (the fixture closes too)."""
+        db.close()
+        db.close()
+
+    def test_maintenance_analyzes_and_truncates_wal(self, db: Database):
+        """maintenance() populates planner stats and empties the WAL."""
+        db.open_position("m1", "t1", "arb", "BUY", 0.40, 10.0)
+        db.maintenance()
+
+        assert db.conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+        wal = db.db_path.with_name(db.db_path.name + "-wal")
+        assert not wal.exists() or wal.stat().st_size == 0
+
     def test_record_trade(self, db: Database):
         """Can record a trade and retrieve it."""
         row_id = db.record_trade(
@@ -35,6 +139,25 @@ class TestDatabase:
         assert trades[0]["price"] == 0.45
         assert trades[0]["size"] == 10.0
 
+    def test_record_duplicate_trade_returns_existing_id(self, db: Database):
+        """H-18: re-recording an order_id keeps the original row untouched."""
+        first = db.record_trade("dup-1", "arb", "m1", "t1", "BUY", 0.50, 10.0)
+        again = db.record_trade("dup-1", "arb", "m1", "t1", "SELL", 0.90, 99.0)
+
+        assert again == first
+        trades = db.get_trades()
+        assert len(trades) == 1
+        assert trades[0]["side"] == "BUY"
+        assert trades[0]["size"] == 10.0
+
+    def test_record_duplicate_trade_without_returning(
+        self, db: Database, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Older SQLite builds use INSERT OR IGNORE plus a lookup."""
+        monkeypatch.setattr(db_module, "_SQLITE_HAS_RETURNING", False)
+        first = db.record_trade("dup-2", "arb", "m1", "t1", "BUY", 0.50, 10.0)
+        assert db.record_trade("dup-2", "arb", "m1", "t1", "BUY", 0.50, 10.0) == first
+
     def test_update_trade_status(self, db: Database):
         """Can update trade status after fill."""
         db.record_trade(
@@ -53,6 +176,29 @@ class TestDatabase:
         assert len(trades) == 1
         assert trades[0]["status"] == "filled"
 
+    def test_get_trades_filters(self, db: Database):
+        """Strategy and status filters combine; no filter returns everything."""
+        db.record_trade("o1", "arb", "m1", "t1", "BUY", 0.5, 1.0)
+        db.record_trade("o2", "arb", "m1", "t1", "BUY", 0.5, 1.0)
+        db.record_trade("o3", "copy_trading", "m1", "t1", "BUY", 0.5, 1.0)
+        db.update_trade_status("o1", "filled")
+
+        assert len(db.get_trades()) == 3
+        assert len(db.get_trades(limit=2)) == 2
+        assert [t["order_id"] for t in db.get_trades(strategy="arb", status="filled")] == ["o1"]
+        assert db.get_trades(strategy="copy_trading", status="filled") == []
+
+    def test_iter_variants_yield_rows(self, db: Database):
+        """iter_* readers return sqlite3.Row objects matching the list readers."""
+        db.record_trade("o1", "arb", "m1", "t1", "BUY", 0.5, 1.0)
+        db.open_position("m1", "t1", "arb", "BUY", 0.40, 10.0)
+
+        trades = list(db.iter_trades(strategy="arb"))
+        positions = list(db.iter_open_positions("arb"))
+        assert isinstance(trades[0], sqlite3.Row)
+        assert trades[0]["order_id"] == "o1"
+        assert [dict(p) for p in positions] == db.get_open_positions("arb")
+
     def test_open_close_position(self, db: Database):
         """Can open and close a position."""
         pos_id = db.open_position(
@@ -93,6 +239,29 @@ class TestDatabase:
         # Unrealized PnL = (0.50 - 0.40) * 10 = 1.0
         assert abs(positions[0]["unrealized_pnl"] - 1.0) < 0.01
 
+    def test_update_position_price_sell_side(self, db: Database):
+        """SELL positions gain when the price falls; unknown IDs are a no-op."""
+        pos_id = db.open_position("m1", "t1", "copy_trading", "SELL", 0.60, 10.0)
+
+        db.update_position_price(pos_id, current_price=0.50)
+        db.update_position_price(pos_id + 999, current_price=0.10)
+
+        position = db.get_open_positions()[0]
+        assert position["current_price"] == 0.50
+        assert abs(position["unrealized_pnl"] - 1.0) < 0.01
+
+    def test_update_position_prices_bulk(self, db: Database):
+        """Bulk price update computes unrealized PnL per side."""
+        buy_id = db.open_position("m1", "t1", "copy_trading", "BUY", 0.40, 10.0)
+        sell_id = db.open_position("m2", "t2", "copy_trading", "SELL", 0.60, 5.0)
+
+        db.update_position_prices_bulk([(buy_id, 0.50), (sell_id, 0.50)])
+
+        by_id = {p["id"]: p for p in db.get_open_positions()}
+        assert by_id[buy_id]["current_price"] == 0.50
+        assert abs(by_id[buy_id]["unrealized_pnl"] - 1.0) < 0.01
+        assert abs(by_id[sell_id]["unrealized_pnl"] - 0.5) < 0.01
+
     def test_get_open_positions_by_strategy(self, db: Database):
         """Filtering positions by strategy works."""
         db.open_position("m1", "t1", "copy_trading", "BUY", 0.45, 10.0)
@@ -157,6 +326,21 @@ class TestDatabase:
         assert len(positions) == 1
         assert positions[0]["size"] == 2000.0
 
+    def test_whale_positions_bulk(self, db: Database):
+        """Bulk upsert and delete of whale positions."""
+        db.upsert_whale_positions_bulk(
+            "0xwhale1",
+            [("m1", "t1", 100.0, 0.5), ("m2", "t2", 200.0, None)],
+        )
+        db.upsert_whale_positions_bulk("0xwhale1", [("m1", "t1", 150.0, 0.55)])
+
+        positions = {p["market_id"]: p for p in db.get_whale_positions("0xwhale1")}
+        assert positions["m1"]["size"] == 150.0
+        assert positions["m2"]["avg_price"] is None
+
+        db.delete_whale_positions_bulk("0xwhale1", [("m1", "t1")])
+        assert [p["market_id"] for p in db.get_whale_positions("0xwhale1")] == ["m2"]
+
     def test_get_today_realized_pnl(self, db: Database):
         """Today's realized PnL starts at 0."""
         assert db.get_today_realized_pnl() == 0.0
@@ -341,3 +525,34 @@ class TestDatabase:
         )
         # Should return None since record was never created
         assert db.get_daily_pnl("2099-01-01") is None
+
+
+class TestReadPool:
+    """Queries run on read-only connections alongside the writer."""
+
+    def test_reads_use_read_only_connection(self, db: Database):
+        db.set_metadata("kill_switch", "off")
+        with db.read() as conn:
+            assert conn is not db.conn
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM bot_metadata")
+        # Committed writes are visible to the pool
+        assert db.get_metadata("kill_switch") == "off"
+
+    def test_reads_inside_transaction_see_uncommitted_rows(self, db: Database):
+        with db.transaction():
+            db.open_position("m1", "t1", "arb", "BUY", 0.40, 10.0)
+            with db.read() as conn:
+                assert conn is db.conn
+            assert db.count_open_positions() == 1
+
+    def test_pool_disabled_reads_on_writer(self, settings: Settings):
+        settings.db_read_connections = 0
+        database = Database(settings)
+        database.initialize()
+        try:
+            with database.read() as conn:
+                assert conn is database.conn
+            assert database.get_trades() == []
+        finally:
+            database.close()
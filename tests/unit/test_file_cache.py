@@ -0,0 +1,38 @@
+"""Unit tests for the on-disk response cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from src.core.file_cache import FileCache
+
+
+class TestFileCache:
+    def test_roundtrip(self, tmp_path: Path):
+        cache = FileCache(tmp_path / "gamma", ttl=60)
+        assert cache.get("k") is None
+        cache.set("k", b"[1, 2]")
+        assert cache.get("k") == b"[1, 2]"
+        assert cache.get("other") is None
+
+    def test_expired_entry_ignored(self, tmp_path: Path):
+        cache = FileCache(tmp_path, ttl=60)
+        cache.set("k", b"[]")
+        (path,) = tmp_path.glob("*.json")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.get("k") is None
+
+    def test_invalidate(self, tmp_path: Path):
+        cache = FileCache(tmp_path, ttl=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.invalidate()
+        assert cache.get("a") is None and cache.get("b") is None
+
+    def test_missing_directory_is_empty(self, tmp_path: Path):
+        cache = FileCache(tmp_path / "nope", ttl=60)
+        assert cache.get("k") is None
+        cache.invalidate()
@@ -2,24 +2,52 @@
 
 from __future__ import annotations
 
+import logging
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import structlog
 
 from src.monitoring.health import ComponentStatus, HealthChecker, SystemHealth
-from src.monitoring.logger import get_logger, log_trade, setup_logging
+from src.monitoring.logger import get_logger, log_trade, setup_logging, shorten_ids
 from src.monitoring.pnl import PnLSnapshot, PnLTracker
 
 
 class TestLogger:
     """Tests for structured logging setup."""
 
+    def test_shorten_ids(self):
+        """Long token/wallet IDs are truncated at render time; others untouched."""
+        event = {
+            "token_id": "1234567890123456789012",
+            "wallet": "0xabcdef0123456789",
+            "order_id": "0x" + "f" * 64,
+        }
+        out = shorten_ids(None, "info", dict(event))
+        assert out["token_id"] == "1234567890123456..."
+        assert out["wallet"] == "0xabcdef01..."
+        assert out["order_id"] == event["order_id"]
+
+    def test_shorten_ids_keeps_short_values(self):
+        assert shorten_ids(None, "info", {"token_id": "t1"}) == {"token_id": "t1"}
+
     def test_setup_logging(self):
         """Logging setup should not raise."""
         setup_logging(log_level="DEBUG", json_output=False)
         logger = get_logger("test")
         assert logger is not None
 
+    def test_levels_below_threshold_are_noops(self):
+        """Sub-threshold log methods short-circuit in the bound logger."""
+        setup_logging(log_level="WARNING", json_output=False)
+        try:
+            wrapper = structlog.get_config()["wrapper_class"]
+            bound = wrapper(logging.getLogger("test_levels"), [], {})
+            assert bound.is_enabled_for(logging.WARNING)
+            assert not bound.is_enabled_for(logging.INFO)
+        finally:
+            setup_logging(log_level="DEBUG", json_output=False)
+
     def test_log_trade(self, caplog):
         """log_trade should produce structured output."""
         setup_logging(log_level="DEBUG", json_output=False)
@@ -122,15 +150,17 @@ class TestHealthChecker:
         result = health_checker.check_database()
         assert result.status == ComponentStatus.HEALTHY
 
-    def test_check_wallet_healthy(self, health_checker):
+    @pytest.mark.asyncio
+    async def test_check_wallet_healthy(self, health_checker):
         """Wallet with balance > $1 should be healthy."""
-        result = health_checker.check_wallet()
+        result = await health_checker.check_wallet()
         assert result.status == ComponentStatus.HEALTHY
 
-    def test_check_wallet_low_balance(self, health_checker, mock_wallet):
+    @pytest.mark.asyncio
+    async def test_check_wallet_low_balance(self, health_checker, mock_wallet):
         """Wallet with balance < $1 should be degraded."""
-        mock_wallet.get_usdc_balance.return_value = 0.50
-        result = health_checker.check_wallet()
+        mock_wallet.aget_usdc_balance.return_value = 0.50
+        result = await health_checker.check_wallet()
         assert result.status == ComponentStatus.DEGRADED
 
     @pytest.mark.asyncio
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.core.client import OrderResult
 from src.core.rate_limiter import RateLimiter
-from src.execution.order_manager import OrderManager, Signal
+from src.execution.order_manager import MAX_SIGNAL_QUEUE_SIZE, OrderManager, Signal
 
 
 class TestSignal:
@@ -53,6 +54,40 @@ class TestOrderManager:
         await order_manager.submit_signal(sample_signal)
         assert order_manager.get_pending_count() == 1
 
+    @pytest.mark.asyncio
+    async def test_submit_signal_primes_order_context(
+        self, order_manager: OrderManager, mock_client: MagicMock, sample_signal: Signal
+    ):
+        """Live signals start loading the token's signing metadata while queued."""
+        await order_manager.submit_signal(sample_signal)
+        mock_client.prime_order_context.assert_called_once_with(sample_signal.token_id)
+
+    @pytest.mark.asyncio
+    async def test_queue_bounded(self, order_manager: OrderManager, sample_signal: Signal):
+        """Signals past MAX_SIGNAL_QUEUE_SIZE are dropped (H-04)."""
+        for _ in range(MAX_SIGNAL_QUEUE_SIZE + 5):
+            await order_manager.submit_signal(sample_signal)
+        assert order_manager.get_pending_count() == MAX_SIGNAL_QUEUE_SIZE
+        assert order_manager._drain_signal_queue() == MAX_SIGNAL_QUEUE_SIZE
+        assert order_manager.get_pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_process_signals_wakes_on_submit_and_stop(
+        self, order_manager: OrderManager, sample_signal: Signal
+    ):
+        """The processor sleeps while idle and wakes for new signals and stop()."""
+        executed = asyncio.Event()
+        order_manager._execute_signal = AsyncMock(side_effect=lambda s: executed.set())
+        task = asyncio.create_task(order_manager.process_signals())
+        await asyncio.sleep(0)
+
+        await order_manager.submit_signal(sample_signal)
+        await asyncio.wait_for(executed.wait(), timeout=0.5)
+        order_manager._execute_signal.assert_awaited_once_with(sample_signal)
+
+        await order_manager.stop()
+        await asyncio.wait_for(task, timeout=0.5)
+
     @pytest.mark.asyncio
     async def test_cancel_all(self, order_manager: OrderManager, mock_client: MagicMock):
         """Cancel all delegates to client."""
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import time
+from array import array
 
 import pytest
 
-from src.core.rate_limiter import RateLimiter
+from src.core.rate_limiter import RateLimiter, RateLimiterGroup, TokenBucket
 
 
 class TestRateLimiter:
@@ -57,6 +58,70 @@ class TestRateLimiter:
         limiter.record_rate_limit()
         assert limiter._consecutive_rate_limits == 2
 
+    def test_backoff_is_jittered_within_cap(self, monkeypatch: pytest.MonkeyPatch):
+        """Backoff is drawn from [floor, 2**n], capped at 60s."""
+        limiter = RateLimiter()
+        draws: list[tuple[float, float]] = []
+
+        def fake_uniform(lo: float, hi: float) -> float:
+            draws.append((lo, hi))
+            return hi / 2
+
+        monkeypatch.setattr("src.core.rate_limiter.random.uniform", fake_uniform)
+        for _ in range(8):
+            before = time.monotonic()
+            limiter.record_rate_limit()
+        assert [hi for _, hi in draws] == [2, 4, 8, 16, 32, 60, 60, 60]
+        assert limiter._backoff_until - before == pytest.approx(30, abs=0.5)
+
+        monkeypatch.setattr("src.core.rate_limiter.random.uniform", lambda lo, hi: 0.0)
+        before = time.monotonic()
+        limiter.record_rate_limit()
+        assert limiter._backoff_until - before >= 0.25
+
+    def test_retry_after_overrides_exponential(self, monkeypatch: pytest.MonkeyPatch):
+        """A server Retry-After is honoured, with jitter capped at 5s."""
+        limiter = RateLimiter()
+        draws: list[tuple[float, float]] = []
+
+        def fake_uniform(lo: float, hi: float) -> float:
+            draws.append((lo, hi))
+            return hi
+
+        monkeypatch.setattr("src.core.rate_limiter.random.uniform", fake_uniform)
+        for _ in range(3):
+            limiter.record_rate_limit()
+        before = time.monotonic()
+        limiter.record_rate_limit(retry_after=0.2)
+        assert limiter._backoff_until - before == pytest.approx(0.4, abs=0.05)
+
+        limiter.record_rate_limit(retry_after=30.0)
+        assert draws[-2:] == [(0.0, 0.2), (0.0, 5.0)]
+
+    @pytest.mark.asyncio
+    async def test_uncontended_acquire_skips_lock(self):
+        """Free slots are claimed without entering the lock."""
+
+        class NoEnterLock(asyncio.Lock):
+            async def __aenter__(self) -> None:
+                raise AssertionError("lock entered on the fast path")
+
+        limiter = RateLimiter(max_requests=3, window_seconds=60.0)
+        limiter._lock = NoEnterLock()
+        for _ in range(3):
+            await limiter.acquire()
+        assert limiter.remaining == 0
+        with pytest.raises(AssertionError):
+            await limiter.acquire()
+
+    @pytest.mark.asyncio
+    async def test_expired_backoff_is_cleared(self):
+        """A drained backoff resets to the 0.0 sentinel on the next acquire."""
+        limiter = RateLimiter(max_requests=5, window_seconds=1.0)
+        limiter._backoff_until = time.monotonic() - 1.0
+        await limiter.acquire()
+        assert limiter._backoff_until == 0.0
+
     @pytest.mark.asyncio
     async def test_sliding_window_clears(self):
         """Requests outside the window should be cleared."""
@@ -69,6 +134,16 @@ class TestRateLimiter:
         await asyncio.sleep(0.15)
         assert limiter.remaining == 5
 
+    def test_current_usage_across_ring_wrap(self):
+        """Usage counts live grants on both sides of the ring's cursor."""
+        limiter = RateLimiter(max_requests=5, window_seconds=10.0)
+        now = time.monotonic()
+        # Cursor at 2: slots 2-4 are the oldest grants, 0-1 the newest
+        limiter._slots[:] = array("d", [now - 2, now - 1, now - 30, now - 20, now - 5])
+        limiter._next = 2
+        assert limiter.current_usage == 3
+        assert limiter.remaining == 2
+
     @pytest.mark.asyncio
     async def test_acquire_waits_when_full(self):
         """Acquire should block when rate limit is reached."""
@@ -80,3 +155,73 @@ class TestRateLimiter:
         await limiter.acquire()  # Should wait for window to slide
         elapsed = time.monotonic() - start
         assert elapsed >= 0.1  # Should have waited some time
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_respect_limit(self):
+        """Queued acquirers are released one window slot at a time."""
+        limiter = RateLimiter(max_requests=2, window_seconds=0.1)
+        start = time.monotonic()
+        done: list[float] = []
+
+        async def worker() -> None:
+            await limiter.acquire()
+            done.append(time.monotonic() - start)
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+        done.sort()
+        # Two immediately, then two per elapsed window
+        assert done[1] < 0.05
+        assert done[2] >= 0.09 and done[4] >= 0.19
+
+
+class TestRateLimiterGroup:
+    """Each route group has its own window."""
+
+    def test_default_groups(self):
+        group = RateLimiterGroup()
+        assert group["orders"].max_requests == 55
+        assert group["reads"].max_requests == 300
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_spend_order_budget(self):
+        group = RateLimiterGroup({"orders": (2, 60.0), "reads": (10, 60.0)})
+        for _ in range(5):
+            await group.acquire("reads")
+        assert group["orders"].remaining == 2
+        assert group["reads"].remaining == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_tag_raises(self):
+        with pytest.raises(KeyError):
+            await RateLimiterGroup().acquire("auth")
+
+
+class TestTokenBucket:
+    """Tests for the burst-smoothing TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self):
+        bucket = TokenBucket(rate=1.0, capacity=5)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.1
+        assert bucket.available < 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables(self):
+        bucket = TokenBucket(rate=0, capacity=0)
+        await asyncio.wait_for(bucket.acquire(), timeout=0.1)
+
+    def test_refill_capped_at_capacity(self):
+        bucket = TokenBucket(rate=1000.0, capacity=3)
+        bucket._updated -= 10
+        assert bucket.available == 3
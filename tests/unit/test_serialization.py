@@ -0,0 +1,40 @@
+"""Unit tests for the JSON helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.core import serialization
+
+
+class TestLoads:
+    """loads() accepts bytes or str and behaves like json.loads."""
+
+    @pytest.mark.parametrize("payload", [b'{"a": [1, 2.5, null]}', '{"a": [1, 2.5, null]}'])
+    def test_roundtrip(self, payload):
+        assert serialization.loads(payload) == {"a": [1, 2.5, None]}
+
+    def test_invalid_raises_value_error(self):
+        with pytest.raises(ValueError):
+            serialization.loads(b"{not json")
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert serialization.loads(b"[1]") == [1]
+
+
+class TestDumps:
+    """dumps() returns compact JSON text with an optional default hook."""
+
+    def test_compact_text(self):
+        assert serialization.dumps({"a": [1, None]}) == '{"a":[1,null]}'
+
+    def test_default_hook(self):
+        assert serialization.dumps({"s": {1}}, default=sorted) == '{"s":[1]}'
+
+    def test_big_int_falls_back_to_stdlib(self):
+        assert serialization.dumps(2**70) == str(2**70)
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert serialization.dumps({"a": 1}) == '{"a":1}'
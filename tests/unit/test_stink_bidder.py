@@ -16,9 +16,8 @@ from src.strategies.stink_bidder import StinkBidder
 def mock_deps():
     client = MagicMock()
     client.get_markets = AsyncMock()
-    # Mock CLOB client inside client
-    client.clob = MagicMock()
-    client.clob.get_orders = MagicMock(return_value=[])
+    # Open orders come from the client's CLOB wrapper
+    client.fetch_open_orders = AsyncMock(return_value=[])
 
     db = MagicMock(spec=Database)
     db.load_strategy_state.return_value = {}
@@ -72,7 +71,7 @@ class TestStinkBidder:
         bidder._state = {"active_orders": {"order1": {"market_id": "m1"}}}
 
         # CLOB has this order, so it should stay
-        mock_deps["client"].clob.get_orders.return_value = [{"orderID": "order1"}]
+        mock_deps["client"].fetch_open_orders.return_value = [{"orderID": "order1"}]
 
         await bidder.initialize()
 
@@ -86,7 +85,7 @@ class TestStinkBidder:
         bidder._active_orders = {"order1": {"market_id": "m1"}, "order2": {"market_id": "m2"}}
 
         # CLOB only has order2 (order1 filled or cancelled)
-        mock_deps["client"].clob.get_orders.return_value = [{"orderID": "order2"}]
+        mock_deps["client"].fetch_open_orders.return_value = [{"orderID": "order2"}]
 
         # Calling evaluate triggers reconcile
         mock_deps["client"].get_markets.return_value = []
@@ -96,11 +95,20 @@ class TestStinkBidder:
         assert "order2" in bidder._active_orders
         assert "order1" not in bidder._active_orders
 
+    @pytest.mark.asyncio
+    async def test_reconcile_keeps_orders_when_lookup_fails(self, bidder, mock_deps):
+        bidder._active_orders = {"order1": {"market_id": "m1"}}
+        mock_deps["client"].fetch_open_orders.side_effect = RuntimeError("CLOB down")
+        mock_deps["client"].get_markets.return_value = []
+        await bidder.evaluate()
+
+        assert "order1" in bidder._active_orders
+
     @pytest.mark.asyncio
     async def test_evaluate_at_capacity(self, bidder, mock_deps):
         # Max bids is 2
         bidder._active_orders = {"order1": {"market_id": "m1"}, "order2": {"market_id": "m2"}}
-        mock_deps["client"].clob.get_orders.return_value = [
+        mock_deps["client"].fetch_open_orders.return_value = [
             {"orderID": "order1"},
             {"orderID": "order2"},
         ]
@@ -148,7 +156,7 @@ class TestStinkBidder:
     async def test_evaluate_skips_existing_market(self, bidder, mock_deps):
         # Already have a bid on m1
         bidder._active_orders = {"order1": {"market_id": "m1"}}
-        mock_deps["client"].clob.get_orders.return_value = [{"orderID": "order1"}]
+        mock_deps["client"].fetch_open_orders.return_value = [{"orderID": "order1"}]
 
         market = Market(
             condition_id="m1",
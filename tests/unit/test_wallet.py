@@ -0,0 +1,202 @@
+"""Unit tests for wallet helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import SecretStr
+from web3 import Web3
+
+from src.core.config import Settings
+from src.core.wallet import (
+    USDC_ADDRESS,
+    WalletManager,
+    checksum_address,
+    close_rpc_clients,
+)
+
+
+class TestChecksumAddress:
+    """checksum_address matches web3 and memoizes repeated lookups."""
+
+    def test_checksums_lowercase(self):
+        assert checksum_address(USDC_ADDRESS.lower()) == USDC_ADDRESS
+
+    def test_memoized(self):
+        checksum_address.cache_clear()
+        checksum_address(USDC_ADDRESS.lower())
+        checksum_address(USDC_ADDRESS.lower())
+        info = checksum_address.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+_ERC20_BALANCE_OF_ABI = [
+    {
+        "inputs": [{"name": "_owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function",
+    }
+]
+
+
+class TestUsdcBalance:
+    """The balanceOf calldata is prepared once at initialize()."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_rpc_clients(self):
+        # Each test patches Web3; don't let a cached client leak between them
+        close_rpc_clients()
+        yield
+        close_rpc_clients()
+
+    def test_balance_of_calldata_built_once(self, settings: Settings):
+        settings.trading_mode = "live"
+        settings.wallet_private_key = SecretStr("0x" + "11" * 32)
+        w3 = MagicMock()
+        w3.is_connected.return_value = True
+        w3.eth.call.return_value = (12_500_000).to_bytes(32, "big")
+
+        with patch("src.core.wallet.Web3", return_value=w3) as web3_cls:
+            web3_cls.to_checksum_address = Web3.to_checksum_address
+            wallet = WalletManager(settings)
+            wallet.initialize()
+
+        assert wallet.get_usdc_balance() == 12.5
+        assert wallet.get_usdc_balance_raw() == 12_500_000
+        w3.eth.contract.assert_not_called()
+        contract = Web3().eth.contract(address=USDC_ADDRESS, abi=_ERC20_BALANCE_OF_ABI)
+        expected = contract.encode_abi("balanceOf", [checksum_address(wallet.funder_address)])
+        w3.eth.call.assert_called_with({"to": USDC_ADDRESS, "data": expected})
+
+    def test_rpc_client_shared_between_wallets(self, settings: Settings):
+        w3 = MagicMock()
+        w3.is_connected.return_value = True
+        with patch("src.core.wallet.Web3", return_value=w3) as web3_cls:
+            first = WalletManager(settings)
+            first.initialize()
+            second = WalletManager(settings)
+            second.initialize()
+
+        assert first._w3 is second._w3
+        web3_cls.HTTPProvider.assert_called_once()
+        session = web3_cls.HTTPProvider.call_args.kwargs["session"]
+        adapter = session.get_adapter("https://polygon-rpc.com")
+        assert adapter._pool_maxsize == 16
+
+    def test_verify_connection_batches_balances(self, settings: Settings):
+        settings.trading_mode = "live"
+        settings.wallet_private_key = SecretStr("0x" + "11" * 32)
+        w3 = MagicMock()
+        w3.is_connected.return_value = True
+        w3.from_wei = Web3.from_wei
+        batch = w3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [(12_500_000).to_bytes(32, "big"), 2 * 10**18]
+
+        with patch("src.core.wallet.Web3", return_value=w3) as web3_cls:
+            web3_cls.to_checksum_address = Web3.to_checksum_address
+            wallet = WalletManager(settings)
+            wallet.initialize()
+            status = wallet.verify_connection()
+
+        assert status["usdc_balance"] == 12.5
+        assert status["matic_balance"] == 2.0
+        assert batch.add.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_balance_awaits_rpc(self, settings: Settings):
+        settings.trading_mode = "live"
+        settings.wallet_private_key = SecretStr("0x" + "11" * 32)
+        w3 = MagicMock()
+        w3.is_connected.return_value = True
+        aw3 = MagicMock()
+        aw3.from_wei = Web3.from_wei
+        aw3.eth.call = AsyncMock(return_value=(12_500_000).to_bytes(32, "big"))
+        aw3.eth.get_balance = AsyncMock(return_value=2 * 10**18)
+
+        with (
+            patch("src.core.wallet.Web3", return_value=w3) as web3_cls,
+            patch("src.core.wallet.AsyncWeb3", return_value=aw3),
+        ):
+            web3_cls.to_checksum_address = Web3.to_checksum_address
+            wallet = WalletManager(settings)
+            wallet.initialize()
+
+        assert await wallet.aget_usdc_balance() == 12.5
+        assert await wallet.aget_matic_balance() == 2.0
+        w3.eth.call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_balance_reads_share_one_rpc(self, settings: Settings):
+        settings.trading_mode = "live"
+        settings.wallet_private_key = SecretStr("0x" + "11" * 32)
+        w3 = MagicMock()
+        w3.is_connected.return_value = True
+        aw3 = MagicMock()
+
+        async def slow_call(tx: object) -> bytes:
+            await asyncio.sleep(0.01)
+            return (7_000_000).to_bytes(32, "big")
+
+        aw3.eth.call = AsyncMock(side_effect=slow_call)
+
+        with (
+            patch("src.core.wallet.Web3", return_value=w3) as web3_cls,
+            patch("src.core.wallet.AsyncWeb3", return_value=aw3),
+        ):
+            web3_cls.to_checksum_address = Web3.to_checksum_address
+            wallet = WalletManager(settings)
+            wallet.initialize()
+
+        balances = await asyncio.gather(*(wallet.aget_usdc_balance() for _ in range(5)))
+        assert balances == [7.0] * 5
+        assert await wallet.aget_usdc_balance() == 7.0
+        assert aw3.eth.call.await_count == 1
+
+        settings.balance_cache_ttl_seconds = 0
+        await wallet.aget_usdc_balance()
+        assert aw3.eth.call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_averify_connection_runs_checks_concurrently(self, settings: Settings):
+        settings.trading_mode = "live"
+        settings.wallet_private_key = SecretStr("0x" + "11" * 32)
+        w3 = MagicMock()
+        w3.is_connected.return_value = True
+        aw3 = MagicMock()
+        aw3.from_wei = Web3.from_wei
+        aw3.is_connected = AsyncMock(return_value=True)
+        aw3.eth.call = AsyncMock(return_value=(12_500_000).to_bytes(32, "big"))
+        aw3.eth.get_balance = AsyncMock(side_effect=ConnectionError("rpc down"))
+
+        with (
+            patch("src.core.wallet.Web3", return_value=w3) as web3_cls,
+            patch("src.core.wallet.AsyncWeb3", return_value=aw3),
+        ):
+            web3_cls.to_checksum_address = Web3.to_checksum_address
+            wallet = WalletManager(settings)
+            wallet.initialize()
+        w3.reset_mock()
+
+        status = await wallet.averify_connection()
+
+        assert status["connected"] is True
+        assert status["funder_address"] == wallet.funder_address
+        assert status["usdc_balance"] == 12.5
+        assert status["matic_balance"] == 0.0
+        w3.is_connected.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_balance_paper_mode(self, settings: Settings):
+        w3 = MagicMock()
+        w3.is_connected.return_value = True
+        with patch("src.core.wallet.Web3", return_value=w3):
+            wallet = WalletManager(settings)
+            wallet.initialize()
+
+        assert await wallet.aget_usdc_balance() == settings.paper_balance_usd
+        assert wallet.get_usdc_balance() == settings.paper_balance_usd
+        assert wallet.get_usdc_balance_raw() == round(settings.paper_balance_usd * 10**6)
+        w3.eth.call.assert_not_called()
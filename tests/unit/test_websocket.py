@@ -0,0 +1,167 @@
+"""Unit tests for the WebSocket manager."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+from websockets import ConnectionClosedOK
+
+from src.core.config import Settings
+from src.core.websocket import WebSocketManager
+
+
+class TestHandleMessage:
+    """Inbound frames update prices and are handed to callbacks in batches."""
+
+    @pytest.fixture
+    def ws(self, settings: Settings) -> WebSocketManager:
+        return WebSocketManager(settings)
+
+    @pytest.mark.asyncio
+    async def test_bytes_frame_parsed(self, ws: WebSocketManager):
+        callback = AsyncMock()
+        ws.register_callback(callback)
+        ws._handle_message(
+            b'{"type": "price_change", "asset_id": "tok", "price": "0.42", "timestamp": 7}'
+        )
+        assert ws._latest_prices["tok"] == 0.42
+        callback.assert_not_awaited()
+
+        await ws._dispatch_pending()
+        callback.assert_awaited_once_with("tok", 0.42, 7.0)
+
+    @pytest.mark.asyncio
+    async def test_burst_coalesced_to_latest_price(self, ws: WebSocketManager):
+        callback = AsyncMock()
+        ws.register_callback(callback)
+        for i in range(100):
+            ws._handle_message(
+                f'{{"type": "price_change", "asset_id": "a", "price": "0.{i:02d}1",'
+                f' "timestamp": {i}}}'
+            )
+        ws._handle_message('{"type": "book", "asset_id": "b", "price": "0.3", "timestamp": 1}')
+
+        await ws._dispatch_pending()
+        assert callback.await_args_list == [call("a", 0.991, 99.0), call("b", 0.3, 1.0)]
+
+    @pytest.mark.asyncio
+    async def test_callback_error_does_not_stop_dispatch(self, ws: WebSocketManager):
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        callback = AsyncMock()
+        ws.register_callback(failing)
+        ws.register_callback(callback)
+        ws._handle_message('{"type": "book", "asset_id": "tok", "price": "0.5"}')
+
+        await ws._dispatch_pending()
+        callback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_concurrently(self, ws: WebSocketManager):
+        done = asyncio.Event()
+        started: list[str] = []
+
+        async def first(token_id: str, price: float, timestamp: float) -> None:
+            started.append("first")
+            await done.wait()
+
+        async def second(token_id: str, price: float, timestamp: float) -> None:
+            started.append("second")
+            done.set()
+
+        ws.register_callback(first)
+        ws.register_callback(second)
+        ws._handle_message('{"type": "book", "asset_id": "tok", "price": "0.5"}')
+
+        await asyncio.wait_for(ws._dispatch_pending(), timeout=1.0)
+        assert started == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_frame_ignored(self, ws: WebSocketManager):
+        callback = AsyncMock()
+        ws.register_callback(callback)
+        ws._handle_message(b"{not json")
+        ws._handle_message("PONG")
+        await ws._dispatch_pending()
+        callback.assert_not_awaited()
+        assert "tok" not in ws._latest_prices
+
+    @pytest.mark.asyncio
+    async def test_malformed_book_level_keeps_price(self, ws: WebSocketManager):
+        callback = AsyncMock()
+        ws.register_callback(callback)
+        ws._quotes["tok"] = (0.4, 0.6, 0.0)
+        ws._handle_message(
+            b'{"type": "book", "asset_id": "tok", "price": "0.5",'
+            b' "bids": [{"price": null}, "0.4"], "asks": []}'
+        )
+        ws._handle_message(b'{"type": "book", "asset_id": "tok", "price": {"x": 1}}')
+
+        assert ws._quotes["tok"] == (0.4, 0.6, 0.0)
+        await ws._dispatch_pending()
+        callback.assert_awaited_once()
+        assert callback.await_args.args[:2] == ("tok", 0.5)
+
+
+class TestSubscriptions:
+    """Subscribe/unsubscribe only send tokens whose state actually changed."""
+
+    @pytest.mark.asyncio
+    async def test_only_new_tokens_sent(self, settings: Settings, monkeypatch: pytest.MonkeyPatch):
+        ws = WebSocketManager(settings)
+        sent = AsyncMock()
+        monkeypatch.setattr(ws, "_send_subscribe", sent)
+        monkeypatch.setattr(WebSocketManager, "is_connected", property(lambda self: True))
+
+        ws.subscribe(["a", "b", "a"])
+        ws.subscribe(["b", "c"])
+        await asyncio.sleep(0)
+
+        assert ws._subscribed_tokens == {"a", "b", "c"}
+        assert sent.await_args_list == [call(["a", "b"]), call(["c"])]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_skips_unknown_tokens(
+        self, settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ):
+        ws = WebSocketManager(settings)
+        sent = AsyncMock()
+        monkeypatch.setattr(ws, "_send_unsubscribe", sent)
+        monkeypatch.setattr(WebSocketManager, "is_connected", property(lambda self: True))
+        ws._subscribed_tokens = {"a", "b"}
+        ws._latest_prices["a"] = 0.5
+
+        ws.unsubscribe(["a", "zzz"])
+        ws.unsubscribe(["zzz"])
+        await asyncio.sleep(0)
+
+        assert ws._subscribed_tokens == {"b"}
+        assert "a" not in ws._latest_prices
+        sent.assert_awaited_once_with(["a"])
+
+
+class TestListen:
+    """The receive loop reads raw bytes frames until the socket closes."""
+
+    @pytest.mark.asyncio
+    async def test_frames_received_as_bytes(self, settings: Settings):
+        settings.trading_mode = "live"
+        ws = WebSocketManager(settings)
+        conn = MagicMock()
+        conn.recv = AsyncMock(
+            side_effect=[
+                b'{"type": "book", "asset_id": "tok", "price": "0.5"}',
+                ConnectionClosedOK(None, None),
+            ]
+        )
+        connect = MagicMock()
+        connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+        connect.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("src.core.websocket.websockets.connect", connect):
+            await ws._connect_and_listen()
+
+        conn.recv.assert_awaited_with(decode=False)
+        assert ws._latest_prices["tok"] == 0.5
+        assert ws._ws is None